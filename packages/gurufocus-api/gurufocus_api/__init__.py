@@ -4,7 +4,7 @@ A Python client for the GuruFocus API with async support,
 Pydantic models, and intelligent caching.
 """
 
-from .client import GuruFocusClient
+from .client import GuruFocusClient, close_shared_clients
 from .config import GuruFocusSettings
 from .endpoints import (
     EconomicEndpoint,
@@ -76,6 +76,7 @@ from .models import (
     GuruList,
     GuruListItem,
     GuruListResponse,
+    GuruListRow,
     GuruPickItem,
     GuruPicks,
     GuruPicksResponse,
@@ -170,7 +171,12 @@ from .models import (
     quality_filters,
     value_filters,
 )
-from .rate_limiter import NullRateLimiter, RateLimitConfig, RateLimiter
+from .rate_limiter import (
+    NullRateLimiter,
+    RateLimitConfig,
+    RateLimiter,
+    SlidingWindowRateLimiter,
+)
 
 __version__ = "0.1.0"
 __all__ = [
@@ -230,6 +236,7 @@ __all__ = [
     "GuruList",
     "GuruListItem",
     "GuruListResponse",
+    "GuruListRow",
     "GuruPickItem",
     "GuruPicks",
     "GuruPicksResponse",
@@ -308,6 +315,7 @@ __all__ = [
     "SegmentData",
     "SegmentPeriodData",
     "SegmentType",
+    "SlidingWindowRateLimiter",
     "SolvencyRatios",
     "SplitEvent",
     "StockGuruHolder",
@@ -332,6 +340,7 @@ __all__ = [
     "VolumeHistory",
     "VolumePoint",
     "__version__",
+    "close_shared_clients",
     "configure_from_settings",
     "configure_logging",
     "deep_value_filters",
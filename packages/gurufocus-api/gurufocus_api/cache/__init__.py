@@ -1,11 +1,12 @@
 """Caching infrastructure for GuruFocus API responses."""
 
-from .base import CacheBackend
+from .base import CACHE_MISS, CacheBackend
 from .config import CacheCategory, CacheTier, get_cache_config
 from .disk import DiskCacheBackend
 from .manager import CacheManager
 
 __all__ = [
+    "CACHE_MISS",
     "CacheBackend",
     "CacheCategory",
     "CacheManager",
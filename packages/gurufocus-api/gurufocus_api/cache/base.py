@@ -1,7 +1,93 @@
 """Abstract base class for cache backends."""
 
+import asyncio
+import fnmatch
+import json
+import re
 from abc import ABC, abstractmethod
-from typing import Any
+from collections.abc import AsyncIterator, Callable, Sequence
+from functools import lru_cache
+from types import TracebackType
+from typing import Any, Final, Self
+
+# Optional orjson support for value serialization
+_ORJSON_AVAILABLE = False
+try:
+    import orjson
+
+    # orjson would turn dates into strings, dataclasses into dicts and
+    # str/int/dict/list subclasses (enums, ...) into their base type; passing
+    # them through to a raising default leaves them for the caller to store
+    # another way, so they read back as the same type
+    _ORJSON_OPTIONS = (
+        orjson.OPT_PASSTHROUGH_DATETIME
+        | orjson.OPT_PASSTHROUGH_DATACLASS
+        | orjson.OPT_PASSTHROUGH_SUBCLASS
+    )
+
+    def _reject(value: Any) -> Any:
+        """Refuse to JSON-encode a value orjson was told to pass through."""
+        raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+    def json_dumps(value: Any, /) -> bytes:
+        """Serialize a value to compact JSON bytes.
+
+        Raises:
+            TypeError: If the value holds a type JSON cannot round-trip
+        """
+        return orjson.dumps(value, default=_reject, option=_ORJSON_OPTIONS)
+
+    json_loads = orjson.loads
+
+    _ORJSON_AVAILABLE = True
+except ImportError:
+
+    def json_dumps(value: Any, /) -> bytes:
+        """Serialize a value to compact JSON bytes (stdlib fallback)."""
+        return json.dumps(value, separators=(",", ":")).encode()
+
+    json_loads = json.loads  # type: ignore[assignment]
+
+# Maximum number of keys removed per delete_many() call during pattern deletes
+DELETE_BATCH_SIZE = 500
+
+# Default TTL for negative-cache entries, independent of the category TTL
+NEGATIVE_TTL_SECONDS = 300
+
+
+class _CacheMiss:
+    """Type of the CACHE_MISS sentinel."""
+
+    __slots__ = ()
+
+    def __repr__(self) -> str:
+        return "CACHE_MISS"
+
+    def __reduce__(self) -> str:
+        # Unpickle to the singleton so identity checks survive storage
+        return "CACHE_MISS"
+
+
+# Stored to record that upstream has no data for a key. get() returns it
+# (distinct from None) so callers can skip the API call until it expires.
+CACHE_MISS: Final = _CacheMiss()
+
+
+@lru_cache(maxsize=256)
+def compile_glob(pattern: str) -> Callable[[str], re.Match[str] | None]:
+    """Compile a glob pattern into an anchored matcher for cache keys.
+
+    Uses ``fnmatch`` semantics (``*`` also matches ``:``), but compiles the
+    pattern once so backends that walk keys can filter them with a single
+    regex call per key.
+
+    Args:
+        pattern: Glob-style pattern (e.g., "*:AAPL*")
+
+    Returns:
+        The compiled pattern's ``fullmatch`` method
+    """
+    return re.compile(fnmatch.translate(pattern)).fullmatch
 
 
 class CacheBackend(ABC):
@@ -10,8 +96,22 @@ class CacheBackend(ABC):
     All cache implementations must inherit from this class and implement
     the required methods. This allows swapping cache backends without
     changing the rest of the codebase.
+
+    Values are JSON-serializable, or the ``CACHE_MISS`` sentinel, which
+    get() must return as-is. Backends that store bytes should encode with
+    the ``_dumps``/``_loads`` hooks, which use orjson when installed and
+    fall back to the stdlib json module.
+
+    Connection contract: a backend instance owns one long-lived handle
+    (a diskcache.Cache, a client connection pool, ...) created once and
+    shared by every operation, and releases it in close(). Implementations
+    must not open a new connection per call. Backends can be used as async
+    context managers, which call close() on exit.
     """
 
+    _dumps: Callable[[Any], bytes] = staticmethod(json_dumps)
+    _loads: Callable[[bytes | str], Any] = staticmethod(json_loads)
+
     @abstractmethod
     async def get(self, key: str) -> Any | None:
         """Retrieve a value from the cache.
@@ -20,7 +120,8 @@ class CacheBackend(ABC):
             key: The cache key to look up
 
         Returns:
-            The cached value, or None if not found or expired
+            The cached value, ``CACHE_MISS`` if a miss was recorded, or None
+            if not found or expired
         """
         ...
 
@@ -52,23 +153,66 @@ class CacheBackend(ABC):
         """Clear all entries from the cache."""
         ...
 
-    @abstractmethod
     async def exists(self, key: str) -> bool:
         """Check if a key exists in the cache.
 
+        Default implementation is derived from get(), which transfers and
+        deserializes the value. Backends with a cheap presence check (an
+        index lookup, Redis ``EXISTS``) should override this.
+
         Args:
             key: The cache key to check
 
         Returns:
             True if the key exists and hasn't expired
         """
-        ...
+        return (await self.get(key)) is not None
+
+    async def add(self, key: str, value: Any, ttl_seconds: int | None = None) -> bool:
+        """Store a value only if the key is not already cached.
+
+        Default implementation checks exists() and then calls set(), so two
+        concurrent callers can both write. Backends with an atomic
+        insert-if-absent (SQL ``INSERT`` on a unique key, Redis ``SET NX``)
+        should override this.
+
+        Args:
+            key: The cache key
+            value: The value to cache
+            ttl_seconds: Time-to-live in seconds. None uses backend default.
+
+        Returns:
+            True if the value was stored, False if the key already existed
+        """
+        if await self.exists(key):
+            return False
+        await self.set(key, value, ttl_seconds)
+        return True
+
+    async def get_with_ttl(self, key: str) -> tuple[Any | None, float | None]:
+        """Retrieve a value along with how long it has left to live.
+
+        Default implementation calls get() and reports the remaining time
+        as unknown. Backends that track expiry (diskcache ``expire_time``,
+        Redis ``PTTL``) should override this so stale-while-revalidate
+        readers can tell fresh entries from stale ones.
+
+        Args:
+            key: The cache key to look up
+
+        Returns:
+            Tuple of (value, seconds until expiry). The value is as get()
+            returns it; the remaining time is None if unknown or unbounded.
+        """
+        return await self.get(key), None
 
     async def get_many(self, keys: list[str]) -> dict[str, Any]:
         """Retrieve multiple values from the cache.
 
-        Default implementation calls get() for each key.
-        Backends may override for better performance.
+        Default implementation issues get() for every key concurrently, so
+        network-backed caches pay one round-trip of latency rather than N.
+        Backends with a native batch read (MGET, pipelines, a single SQL
+        query) should override this.
 
         Args:
             keys: List of cache keys to look up
@@ -76,39 +220,118 @@ class CacheBackend(ABC):
         Returns:
             Dictionary of key -> value for keys that were found
         """
-        result = {}
-        for key in keys:
-            value = await self.get(key)
-            if value is not None:
-                result[key] = value
-        return result
+        values = await asyncio.gather(*(self.get(key) for key in keys))
+        return {key: value for key, value in zip(keys, values, strict=True) if value is not None}
 
     async def set_many(self, items: dict[str, Any], ttl_seconds: int | None = None) -> None:
         """Store multiple values in the cache.
 
-        Default implementation calls set() for each item.
-        Backends may override for better performance.
+        Default implementation issues set() for every item concurrently.
+        Backends with a native batch write should override this.
 
         Args:
             items: Dictionary of key -> value to cache
             ttl_seconds: Time-to-live in seconds for all items
         """
-        for key, value in items.items():
-            await self.set(key, value, ttl_seconds)
+        await asyncio.gather(*(self.set(key, value, ttl_seconds) for key, value in items.items()))
+
+    async def delete_many(self, keys: list[str]) -> int:
+        """Delete multiple keys from the cache.
+
+        Default implementation issues delete() for every key concurrently.
+        Backends with a native multi-key delete should override this.
+
+        Args:
+            keys: List of cache keys to delete
+
+        Returns:
+            Number of keys that existed and were deleted
+        """
+        results = await asyncio.gather(*(self.delete(key) for key in keys))
+        return sum(results)
+
+    def scan_keys(self, pattern: str) -> AsyncIterator[str]:
+        """Iterate over keys matching a glob pattern.
+
+        Implementations must walk the key space incrementally (e.g. Redis
+        ``SCAN`` with ``MATCH``) rather than materializing every key at once
+        (e.g. Redis ``KEYS``), which blocks the server on large caches.
+        Backends that filter keys themselves should match with
+        ``compile_glob(pattern)`` rather than calling ``fnmatch`` per key.
+
+        Args:
+            pattern: Glob-style pattern (e.g., "summary:AAPL*")
+
+        Returns:
+            Async iterator of matching keys
+
+        Raises:
+            NotImplementedError: If the backend cannot enumerate keys
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support key scanning")
 
     async def delete_pattern(self, pattern: str) -> int:
         """Delete all keys matching a pattern.
 
-        Default implementation does nothing. Backends that support
-        pattern matching should override this.
+        Default implementation streams matches from scan_keys() and removes
+        them via delete_many() in batches of ``DELETE_BATCH_SIZE``. Backends
+        that can filter and delete natively should override this.
 
         Args:
             pattern: Glob-style pattern (e.g., "stock:AAPL:*")
 
+        Returns:
+            Number of keys deleted
+
+        Raises:
+            NotImplementedError: If the backend supports neither pattern
+                deletes nor key scanning
+        """
+        deleted = 0
+        batch: list[str] = []
+        async for key in self.scan_keys(pattern):
+            batch.append(key)
+            if len(batch) >= DELETE_BATCH_SIZE:
+                deleted += await self.delete_many(batch)
+                batch = []
+        if batch:
+            deleted += await self.delete_many(batch)
+        return deleted
+
+    async def delete_patterns(self, patterns: Sequence[str]) -> int:
+        """Delete all keys matching any of several patterns.
+
+        Default implementation runs delete_pattern() for each pattern in
+        turn. Backends where each call has a fixed cost (a thread hop, a
+        round trip) should override this to handle every pattern at once.
+
+        Args:
+            patterns: Glob-style patterns (e.g., ["summary:AAPL*", "quote:AAPL*"])
+
         Returns:
             Number of keys deleted
         """
-        return 0
+        deleted = 0
+        for pattern in patterns:
+            deleted += await self.delete_pattern(pattern)
+        return deleted
+
+    async def invalidate_category(self, category: str) -> int:
+        """Delete all entries in a cache category.
+
+        Keys are expected to follow the ``"{category}:..."`` layout produced
+        by ``build_cache_key``. The default implementation falls back to a
+        pattern delete; backends that keep a category index (tags, sets of
+        keys per category) should override this so invalidation only
+        touches the affected keys.
+
+        Args:
+            category: Category prefix of the keys to delete
+
+        Returns:
+            Number of keys deleted
+        """
+        return await self.delete_pattern(f"{category}:*")
 
     async def close(self) -> None:
         """Close the cache connection and release resources.
@@ -117,3 +340,16 @@ class CacheBackend(ABC):
         needs cleanup.
         """
         return None
+
+    async def __aenter__(self) -> Self:
+        """Enter async context manager."""
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        """Exit async context manager, closing the backend."""
+        await self.close()
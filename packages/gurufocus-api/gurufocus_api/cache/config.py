@@ -9,9 +9,12 @@ This module defines the cache tiers and TTL configuration for each
 type of data to optimize API usage while keeping data fresh.
 """
 
+import sys
+from collections.abc import Callable
 from dataclasses import dataclass
 from datetime import timedelta
-from enum import Enum
+from enum import Enum, StrEnum
+from types import MappingProxyType
 
 
 class CacheTier(Enum):
@@ -27,8 +30,12 @@ class CacheTier(Enum):
     STATIC = "static"
 
 
-class CacheCategory(Enum):
-    """Categories of cached data mapped to API endpoints."""
+class CacheCategory(StrEnum):
+    """Categories of cached data mapped to API endpoints.
+
+    Members are ``str`` instances, so dict lookups keyed by category use
+    the C-level string hash instead of ``Enum.__hash__``.
+    """
 
     # Price-dependent (refresh daily or more frequently)
     QUOTE = "quote"
@@ -119,301 +126,413 @@ class CacheCategory(Enum):
     FUNDA_UPDATED = "funda_updated"
 
 
-@dataclass(frozen=True)
+# Shared TTL values in seconds, named so the table below reads at a glance
+_5M = 5 * 60
+_15M = 15 * 60
+_1H = 60 * 60
+_1D = 24 * _1H
+_7D = 7 * _1D
+_14D = 14 * _1D
+_30D = 30 * _1D
+_95D = 95 * _1D
+
+
+@dataclass(frozen=True, slots=True)
 class CacheConfig:
-    """Configuration for a cache category."""
+    """Configuration for a cache category.
+
+    ``stale_ttl_seconds`` keeps an entry for that long past ``ttl_seconds``
+    so readers using stale-while-revalidate can serve it while a refresh
+    runs in the background. Zero (the default) disables the stale window.
+    """
 
     tier: CacheTier
-    ttl: timedelta
+    ttl_seconds: int
     invalidate_on_earnings: bool = False
+    stale_ttl_seconds: int = 0
 
+    @property
+    def ttl(self) -> timedelta:
+        """TTL as a ``timedelta``, for display and comparisons."""
+        return timedelta(seconds=self.ttl_seconds)
 
-# Default TTL configurations for each category
-_CACHE_CONFIGS: dict[CacheCategory, CacheConfig] = {
+
+# Default TTL configurations for each category (read-only, see below)
+_CACHE_CONFIG_ENTRIES: dict[CacheCategory, CacheConfig] = {
     # TIER 1: Price-Dependent (daily refresh)
     CacheCategory.QUOTE: CacheConfig(
         tier=CacheTier.PRICE_DEPENDENT,
-        ttl=timedelta(minutes=15),
+        ttl_seconds=_15M,
     ),
     CacheCategory.VALUATION_RATIOS: CacheConfig(
         tier=CacheTier.PRICE_DEPENDENT,
-        ttl=timedelta(days=1),
+        ttl_seconds=_1D,
     ),
     CacheCategory.MARKET_DATA: CacheConfig(
         tier=CacheTier.PRICE_DEPENDENT,
-        ttl=timedelta(days=1),
+        ttl_seconds=_1D,
     ),
     # TIER 2: Earnings-Dependent (quarterly, invalidate after earnings)
     CacheCategory.SUMMARY: CacheConfig(
         tier=CacheTier.EARNINGS_DEPENDENT,
-        ttl=timedelta(days=1),  # Summary includes price data, so daily
+        ttl_seconds=_1D,  # Summary includes price data, so daily
         invalidate_on_earnings=True,
     ),
     CacheCategory.FINANCIALS: CacheConfig(
         tier=CacheTier.EARNINGS_DEPENDENT,
-        ttl=timedelta(days=95),  # ~quarterly
+        ttl_seconds=_95D,  # ~quarterly
         invalidate_on_earnings=True,
     ),
     CacheCategory.KEY_RATIOS: CacheConfig(
         tier=CacheTier.EARNINGS_DEPENDENT,
-        ttl=timedelta(days=95),
+        ttl_seconds=_95D,
         invalidate_on_earnings=True,
     ),
     CacheCategory.FUNDAMENTAL_RATIOS: CacheConfig(
         tier=CacheTier.EARNINGS_DEPENDENT,
-        ttl=timedelta(days=95),
+        ttl_seconds=_95D,
         invalidate_on_earnings=True,
     ),
     CacheCategory.GROWTH_METRICS: CacheConfig(
         tier=CacheTier.EARNINGS_DEPENDENT,
-        ttl=timedelta(days=95),
+        ttl_seconds=_95D,
         invalidate_on_earnings=True,
     ),
     CacheCategory.ESTIMATES: CacheConfig(
         tier=CacheTier.EARNINGS_DEPENDENT,
-        ttl=timedelta(days=7),
+        ttl_seconds=_7D,
         invalidate_on_earnings=True,
     ),
     CacheCategory.GF_SCORE: CacheConfig(
         tier=CacheTier.EARNINGS_DEPENDENT,
-        ttl=timedelta(days=1),  # GF Score can change with price
+        ttl_seconds=_1D,  # GF Score can change with price
         invalidate_on_earnings=True,
     ),
     CacheCategory.DIVIDENDS: CacheConfig(
         tier=CacheTier.EARNINGS_DEPENDENT,
-        ttl=timedelta(days=30),  # Dividend data changes infrequently
+        ttl_seconds=_30D,  # Dividend data changes infrequently
         invalidate_on_earnings=True,
     ),
     CacheCategory.INSIDERS: CacheConfig(
         tier=CacheTier.EARNINGS_DEPENDENT,
-        ttl=timedelta(days=7),  # Insider trades filed within days
+        ttl_seconds=_7D,  # Insider trades filed within days
     ),
     # Insider activity endpoints (daily refresh for fresh SEC filings)
     CacheCategory.INSIDER_UPDATES: CacheConfig(
         tier=CacheTier.EARNINGS_DEPENDENT,
-        ttl=timedelta(days=1),  # New updates arrive daily
+        ttl_seconds=_1D,  # New updates arrive daily
     ),
     CacheCategory.INSIDER_CEO_BUYS: CacheConfig(
         tier=CacheTier.EARNINGS_DEPENDENT,
-        ttl=timedelta(days=1),  # CEO buys are time-sensitive signals
+        ttl_seconds=_1D,  # CEO buys are time-sensitive signals
     ),
     CacheCategory.INSIDER_CFO_BUYS: CacheConfig(
         tier=CacheTier.EARNINGS_DEPENDENT,
-        ttl=timedelta(days=1),  # CFO buys are time-sensitive signals
+        ttl_seconds=_1D,  # CFO buys are time-sensitive signals
     ),
     CacheCategory.INSIDER_CLUSTER_BUY: CacheConfig(
         tier=CacheTier.EARNINGS_DEPENDENT,
-        ttl=timedelta(days=1),  # Cluster buys are time-sensitive signals
+        ttl_seconds=_1D,  # Cluster buys are time-sensitive signals
     ),
     CacheCategory.INSIDER_DOUBLE: CacheConfig(
         tier=CacheTier.EARNINGS_DEPENDENT,
-        ttl=timedelta(days=1),  # Double-down buys are time-sensitive signals
+        ttl_seconds=_1D,  # Double-down buys are time-sensitive signals
     ),
     CacheCategory.INSIDER_TRIPLE: CacheConfig(
         tier=CacheTier.EARNINGS_DEPENDENT,
-        ttl=timedelta(days=1),  # Triple-down buys are time-sensitive signals
+        ttl_seconds=_1D,  # Triple-down buys are time-sensitive signals
     ),
     CacheCategory.INSIDER_LIST: CacheConfig(
         tier=CacheTier.STATIC,
-        ttl=timedelta(days=7),  # Insider list changes infrequently
+        ttl_seconds=_7D,  # Insider list changes infrequently
     ),
     CacheCategory.PRICE_HISTORY: CacheConfig(
         tier=CacheTier.PRICE_DEPENDENT,
-        ttl=timedelta(days=1),  # Price data updates daily
+        ttl_seconds=_1D,  # Price data updates daily
     ),
     CacheCategory.PRICE_OHLC: CacheConfig(
         tier=CacheTier.PRICE_DEPENDENT,
-        ttl=timedelta(days=1),  # OHLC data updates daily
+        ttl_seconds=_1D,  # OHLC data updates daily
     ),
     CacheCategory.VOLUME: CacheConfig(
         tier=CacheTier.PRICE_DEPENDENT,
-        ttl=timedelta(days=1),  # Volume data updates daily
+        ttl_seconds=_1D,  # Volume data updates daily
     ),
     CacheCategory.UNADJUSTED_PRICE: CacheConfig(
         tier=CacheTier.PRICE_DEPENDENT,
-        ttl=timedelta(days=1),  # Unadjusted prices update daily
+        ttl_seconds=_1D,  # Unadjusted prices update daily
     ),
     CacheCategory.CURRENT_DIVIDEND: CacheConfig(
         tier=CacheTier.PRICE_DEPENDENT,
-        ttl=timedelta(days=1),  # Yield changes with price
+        ttl_seconds=_1D,  # Yield changes with price
     ),
     # TIER 3: Static (monthly+)
     CacheCategory.PROFILE: CacheConfig(
         tier=CacheTier.STATIC,
-        ttl=timedelta(days=30),
+        ttl_seconds=_30D,
     ),
     CacheCategory.GURUS: CacheConfig(
         tier=CacheTier.STATIC,
-        ttl=timedelta(days=14),
+        ttl_seconds=_14D,
     ),
     CacheCategory.GURU_LIST: CacheConfig(
         tier=CacheTier.STATIC,
-        ttl=timedelta(days=7),  # Large dataset, cache longer
+        ttl_seconds=_7D,  # Large dataset, cache longer
     ),
     CacheCategory.GURU_PICKS: CacheConfig(
         tier=CacheTier.EARNINGS_DEPENDENT,
-        ttl=timedelta(days=1),  # Guru picks update with SEC filings
+        ttl_seconds=_1D,  # Guru picks update with SEC filings
     ),
     CacheCategory.GURU_AGGREGATED: CacheConfig(
         tier=CacheTier.EARNINGS_DEPENDENT,
-        ttl=timedelta(days=1),  # Aggregated portfolio updates with filings
+        ttl_seconds=_1D,  # Aggregated portfolio updates with filings
     ),
     CacheCategory.GURU_REALTIME_PICKS: CacheConfig(
         tier=CacheTier.PRICE_DEPENDENT,
-        ttl=timedelta(minutes=15),  # Real-time activity, short TTL
+        ttl_seconds=_15M,  # Real-time activity, short TTL
     ),
     CacheCategory.EXECUTIVES: CacheConfig(
         tier=CacheTier.STATIC,
-        ttl=timedelta(days=30),
+        ttl_seconds=_30D,
     ),
     CacheCategory.TRADES_HISTORY: CacheConfig(
         tier=CacheTier.STATIC,
-        ttl=timedelta(days=7),  # Guru trades update with SEC filings
+        ttl_seconds=_7D,  # Guru trades update with SEC filings
     ),
     # Operating & segment data (earnings-dependent)
     CacheCategory.OPERATING_DATA: CacheConfig(
         tier=CacheTier.EARNINGS_DEPENDENT,
-        ttl=timedelta(days=1),  # Refresh daily for operational metrics
+        ttl_seconds=_1D,  # Refresh daily for operational metrics
         invalidate_on_earnings=True,
     ),
     CacheCategory.SEGMENTS_DATA: CacheConfig(
         tier=CacheTier.EARNINGS_DEPENDENT,
-        ttl=timedelta(days=1),  # Refresh daily for segment data
+        ttl_seconds=_1D,  # Refresh daily for segment data
         invalidate_on_earnings=True,
     ),
     # Ownership & indicators
     CacheCategory.OWNERSHIP: CacheConfig(
         tier=CacheTier.EARNINGS_DEPENDENT,
-        ttl=timedelta(days=7),  # Ownership updates with SEC filings
+        ttl_seconds=_7D,  # Ownership updates with SEC filings
     ),
     CacheCategory.INDICATOR_HISTORY: CacheConfig(
         tier=CacheTier.EARNINGS_DEPENDENT,
-        ttl=timedelta(days=7),  # Historical ownership updates with SEC filings
+        ttl_seconds=_7D,  # Historical ownership updates with SEC filings
     ),
     CacheCategory.INDICATORS_LIST: CacheConfig(
         tier=CacheTier.STATIC,
-        ttl=timedelta(days=30),  # List of indicators rarely changes
+        ttl_seconds=_30D,  # List of indicators rarely changes
     ),
     CacheCategory.INDICATOR_VALUE: CacheConfig(
         tier=CacheTier.EARNINGS_DEPENDENT,
-        ttl=timedelta(days=1),  # Individual indicator values may change daily
+        ttl_seconds=_1D,  # Individual indicator values may change daily
         invalidate_on_earnings=True,
     ),
     # Politician data
     CacheCategory.POLITICIANS_LIST: CacheConfig(
         tier=CacheTier.STATIC,
-        ttl=timedelta(days=7),  # Politicians list changes infrequently
+        ttl_seconds=_7D,  # Politicians list changes infrequently
     ),
     CacheCategory.POLITICIAN_TRANSACTIONS: CacheConfig(
         tier=CacheTier.EARNINGS_DEPENDENT,
-        ttl=timedelta(days=1),  # Transactions update with SEC filings
+        ttl_seconds=_1D,  # Transactions update with SEC filings
     ),
     # Reference data (exchanges and indexes)
     CacheCategory.EXCHANGE_LIST: CacheConfig(
         tier=CacheTier.STATIC,
-        ttl=timedelta(days=30),  # Exchange list rarely changes
+        ttl_seconds=_30D,  # Exchange list rarely changes
     ),
     CacheCategory.EXCHANGE_STOCKS: CacheConfig(
         tier=CacheTier.STATIC,
-        ttl=timedelta(days=7),  # Stock listings update occasionally
+        ttl_seconds=_7D,  # Stock listings update occasionally
     ),
     CacheCategory.INDEX_LIST: CacheConfig(
         tier=CacheTier.STATIC,
-        ttl=timedelta(days=30),  # Index list rarely changes
+        ttl_seconds=_30D,  # Index list rarely changes
     ),
     CacheCategory.INDEX_STOCKS: CacheConfig(
         tier=CacheTier.STATIC,
-        ttl=timedelta(days=7),  # Index constituents change occasionally
+        ttl_seconds=_7D,  # Index constituents change occasionally
     ),
     # Economic data
     CacheCategory.ECONOMIC_INDICATORS_LIST: CacheConfig(
         tier=CacheTier.STATIC,
-        ttl=timedelta(days=30),  # List of indicators rarely changes
+        ttl_seconds=_30D,  # List of indicators rarely changes
+        stale_ttl_seconds=_7D,
     ),
     CacheCategory.ECONOMIC_INDICATOR_ITEM: CacheConfig(
         tier=CacheTier.EARNINGS_DEPENDENT,
-        ttl=timedelta(days=1),  # Economic data updates regularly
+        ttl_seconds=_1D,  # Economic data updates regularly
+        stale_ttl_seconds=_1D,
     ),
     CacheCategory.CALENDAR: CacheConfig(
         tier=CacheTier.PRICE_DEPENDENT,
-        ttl=timedelta(hours=1),  # Calendar data changes frequently
+        ttl_seconds=_1H,  # Calendar data changes frequently
+        stale_ttl_seconds=_1H,
     ),
     # News feed
     CacheCategory.NEWS_FEED: CacheConfig(
         tier=CacheTier.PRICE_DEPENDENT,
-        ttl=timedelta(minutes=15),  # News updates frequently
+        ttl_seconds=_15M,  # News updates frequently
     ),
     # Estimate history
     CacheCategory.ESTIMATE_HISTORY: CacheConfig(
         tier=CacheTier.EARNINGS_DEPENDENT,
-        ttl=timedelta(days=7),  # Estimates update with earnings
+        ttl_seconds=_7D,  # Estimates update with earnings
         invalidate_on_earnings=True,
     ),
     # ETF data
     CacheCategory.ETF_LIST: CacheConfig(
         tier=CacheTier.STATIC,
-        ttl=timedelta(days=7),  # ETF list changes infrequently
+        ttl_seconds=_7D,  # ETF list changes infrequently
     ),
     CacheCategory.ETF_SECTOR_WEIGHTING: CacheConfig(
         tier=CacheTier.STATIC,
-        ttl=timedelta(days=7),  # Sector allocations change infrequently
+        ttl_seconds=_7D,  # Sector allocations change infrequently
     ),
     # User/Personal data
     CacheCategory.API_USAGE: CacheConfig(
         tier=CacheTier.PRICE_DEPENDENT,
-        ttl=timedelta(minutes=5),  # Very short TTL for quota tracking
+        ttl_seconds=_5M,  # Very short TTL for quota tracking
     ),
     CacheCategory.USER_SCREENERS: CacheConfig(
         tier=CacheTier.STATIC,
-        ttl=timedelta(hours=1),  # Screeners update infrequently
+        ttl_seconds=_1H,  # Screeners update infrequently
     ),
     CacheCategory.USER_SCREENER_RESULTS: CacheConfig(
         tier=CacheTier.EARNINGS_DEPENDENT,
-        ttl=timedelta(hours=1),  # Screener results change with market data
+        ttl_seconds=_1H,  # Screener results change with market data
     ),
     CacheCategory.PORTFOLIOS: CacheConfig(
         tier=CacheTier.PRICE_DEPENDENT,
-        ttl=timedelta(minutes=5),  # Portfolio values change with prices
+        ttl_seconds=_5M,  # Portfolio values change with prices
     ),
     CacheCategory.PORTFOLIO_DETAIL: CacheConfig(
         tier=CacheTier.PRICE_DEPENDENT,
-        ttl=timedelta(minutes=5),  # Portfolio holdings change with prices
+        ttl_seconds=_5M,  # Portfolio holdings change with prices
     ),
     # Misc reference data
     CacheCategory.COUNTRY_CURRENCY: CacheConfig(
         tier=CacheTier.STATIC,
-        ttl=timedelta(days=30),  # Currency codes rarely change
+        ttl_seconds=_30D,  # Currency codes rarely change
     ),
     CacheCategory.FUNDA_UPDATED: CacheConfig(
         tier=CacheTier.EARNINGS_DEPENDENT,
-        ttl=timedelta(days=1),  # List of updated fundamentals for date
+        ttl_seconds=_1D,  # List of updated fundamentals for date
     ),
 }
 
+_CACHE_CONFIGS: MappingProxyType[CacheCategory, CacheConfig] = MappingProxyType(
+    _CACHE_CONFIG_ENTRIES
+)
+
+# Flattened lookup tables derived once at import; the cache read/write paths
+# consult these instead of re-deriving values from CacheConfig on every call.
+_TTL_SECONDS: dict[CacheCategory, int] = {
+    category: config.ttl_seconds for category, config in _CACHE_CONFIGS.items()
+}
+
+_STALE_TTL_SECONDS: dict[CacheCategory, int] = {
+    category: config.stale_ttl_seconds for category, config in _CACHE_CONFIGS.items()
+}
+
+# How long the backend keeps an entry: the fresh TTL plus the stale window
+_STORE_TTL_SECONDS: dict[CacheCategory, int] = {
+    category: config.ttl_seconds + config.stale_ttl_seconds
+    for category, config in _CACHE_CONFIGS.items()
+}
+
+_INVALIDATE_ON_EARNINGS: frozenset[CacheCategory] = frozenset(
+    category for category, config in _CACHE_CONFIGS.items() if config.invalidate_on_earnings
+)
+
+# Categories flagged invalidate_on_earnings, in declaration order
+EARNINGS_INVALIDATED_CATEGORIES: tuple[CacheCategory, ...] = tuple(
+    category for category in CacheCategory if category in _INVALIDATE_ON_EARNINGS
+)
+
+# Categories grouped by tier, in declaration order
+_CATEGORIES_BY_TIER: dict[CacheTier, tuple[CacheCategory, ...]] = {
+    tier: tuple(category for category in CacheCategory if _CACHE_CONFIGS[category].tier is tier)
+    for tier in CacheTier
+}
+
+# Plain-str category names, so key building never goes through the Enum
+# ``value`` descriptor (and never hands a str subclass to the backend)
+_CATEGORY_NAMES: dict[CacheCategory, str] = {
+    category: sys.intern(category.value) for category in CacheCategory
+}
+
+# Interned "category:" prefixes so the common single-part key is one concat
+_KEY_PREFIXES: dict[CacheCategory, str] = {
+    category: sys.intern(f"{name}:") for category, name in _CATEGORY_NAMES.items()
+}
+
+# Key segment placed before the symbol for categories whose keys don't start
+# with the symbol itself (e.g. "news_feed:symbol:AAPL")
+_SYMBOL_KEY_MARKERS: dict[CacheCategory, str] = {
+    CacheCategory.NEWS_FEED: "symbol:",
+}
 
-def get_cache_config(category: CacheCategory) -> CacheConfig:
-    """Get cache configuration for a category.
+
+# Get the CacheConfig (tier, TTL, invalidation settings) for a category.
+# Bound directly to the dict's __getitem__ so lookups skip a Python frame;
+# raises KeyError for an unknown category, like the previous wrapper.
+get_cache_config: Callable[[CacheCategory], CacheConfig] = _CACHE_CONFIG_ENTRIES.__getitem__
+
+
+# Get the TTL in seconds for a category. Called on every cache write, so it
+# is bound to the flat TTL table's __getitem__ the same way.
+get_ttl_seconds: Callable[[CacheCategory], int] = _TTL_SECONDS.__getitem__
+
+# Get the stale-while-revalidate window in seconds for a category (0 if none)
+get_stale_ttl_seconds: Callable[[CacheCategory], int] = _STALE_TTL_SECONDS.__getitem__
+
+# Get the backend expiry for a category's entries: TTL plus stale window
+get_store_ttl_seconds: Callable[[CacheCategory], int] = _STORE_TTL_SECONDS.__getitem__
+
+
+def invalidates_on_earnings(category: CacheCategory) -> bool:
+    """Check whether a cache category should be invalidated after earnings.
 
     Args:
-        category: The cache category to look up
+        category: The cache category
 
     Returns:
-        CacheConfig with tier, TTL, and invalidation settings
+        True if entries in this category go stale with a new earnings report
     """
-    return _CACHE_CONFIGS[category]
+    return category in _INVALIDATE_ON_EARNINGS
 
 
-def get_ttl_seconds(category: CacheCategory) -> int:
-    """Get TTL in seconds for a cache category.
+def categories_for_tier(tier: CacheTier) -> tuple[CacheCategory, ...]:
+    """Get every cache category in a tier.
 
     Args:
-        category: The cache category
+        tier: The cache tier
+
+    Returns:
+        Categories in the tier, in declaration order
+    """
+    return _CATEGORIES_BY_TIER[tier]
+
+
+def symbol_key_patterns(symbol: str) -> tuple[str, ...]:
+    """Get glob patterns matching every cache key for a symbol.
+
+    Each pattern is anchored at a category prefix (e.g. "summary:AAPL*"), so
+    backends with an ordered key index can resolve it as a range scan rather
+    than testing every key, as a leading-``*`` pattern would require.
+
+    Args:
+        symbol: The stock symbol, already normalized to upper case
 
     Returns:
-        TTL in seconds
+        One pattern per category, in declaration order
     """
-    config = get_cache_config(category)
-    return int(config.ttl.total_seconds())
+    return tuple(
+        f"{prefix}{_SYMBOL_KEY_MARKERS.get(category, '')}{symbol}*"
+        for category, prefix in _KEY_PREFIXES.items()
+    )
 
 
 def build_cache_key(category: CacheCategory, *parts: str) -> str:
@@ -432,53 +551,65 @@ def build_cache_key(category: CacheCategory, *parts: str) -> str:
         >>> build_cache_key(CacheCategory.FINANCIALS, "AAPL", "annual")
         "financials:AAPL:annual"
     """
-    return ":".join([category.value, *parts])
+    # Only the single-part case is specialized: for two or more parts,
+    # ":".join() measured faster than chained concatenation or an f-string
+    if len(parts) == 1:
+        return _KEY_PREFIXES[category] + parts[0]
+    if not parts:
+        return _CATEGORY_NAMES[category]
+    return _KEY_PREFIXES[category] + ":".join(parts)
 
 
 # Metrics classification for reference
-PRICE_DEPENDENT_METRICS = {
-    "pe_ratio",
-    "ps_ratio",
-    "pb_ratio",
-    "peg_ratio",
-    "ev_ebitda",
-    "ev_sales",
-    "ev_fcf",
-    "market_cap",
-    "enterprise_value",
-    "dividend_yield",
-    "discount_to_gf_value",
-    "discount_to_dcf",
-    "momentum_score",
-    "valuation_rank",
-    "current_price",
-}
-
-EARNINGS_DEPENDENT_METRICS = {
-    "eps",
-    "revenue_per_share",
-    "fcf_per_share",
-    "book_value_per_share",
-    "roe",
-    "roic",
-    "roa",
-    "roce",
-    "gross_margin",
-    "operating_margin",
-    "net_margin",
-    "fcf_margin",
-    "revenue_growth_yoy",
-    "eps_growth_yoy",
-    "debt_to_equity",
-    "current_ratio",
-    "piotroski_score",
-}
-
-STATIC_METRICS = {
-    "company_name",
-    "sector",
-    "industry",
-    "exchange",
-    "currency",
-    "description",
-}
+PRICE_DEPENDENT_METRICS: frozenset[str] = frozenset(
+    {
+        "pe_ratio",
+        "ps_ratio",
+        "pb_ratio",
+        "peg_ratio",
+        "ev_ebitda",
+        "ev_sales",
+        "ev_fcf",
+        "market_cap",
+        "enterprise_value",
+        "dividend_yield",
+        "discount_to_gf_value",
+        "discount_to_dcf",
+        "momentum_score",
+        "valuation_rank",
+        "current_price",
+    }
+)
+
+EARNINGS_DEPENDENT_METRICS: frozenset[str] = frozenset(
+    {
+        "eps",
+        "revenue_per_share",
+        "fcf_per_share",
+        "book_value_per_share",
+        "roe",
+        "roic",
+        "roa",
+        "roce",
+        "gross_margin",
+        "operating_margin",
+        "net_margin",
+        "fcf_margin",
+        "revenue_growth_yoy",
+        "eps_growth_yoy",
+        "debt_to_equity",
+        "current_ratio",
+        "piotroski_score",
+    }
+)
+
+STATIC_METRICS: frozenset[str] = frozenset(
+    {
+        "company_name",
+        "sector",
+        "industry",
+        "exchange",
+        "currency",
+        "description",
+    }
+)
@@ -4,32 +4,140 @@ Uses the diskcache library for persistent, file-based caching.
 This is ideal for development and single-server deployments.
 
 Note on async implementation:
-    Operations are executed synchronously to ensure all SQLite connections
-    are created in the same thread, enabling proper cleanup on close().
-    Each async method yields control back to the event loop via
-    `await asyncio.sleep(0)` after completing the sync operation.
-    This allows other coroutines to run between cache operations while
-    keeping all database connections in a single thread.
-
-    SQLite operations are typically sub-millisecond, so the brief blocking
-    is acceptable for most use cases. For high-concurrency scenarios
-    requiring true non-blocking behavior, consider a Redis-based backend.
+    Every diskcache operation runs on a dedicated single-thread executor
+    owned by the backend. The event loop never blocks on SQLite (WAL
+    contention or a multi-MB spilled value no longer stalls other
+    coroutines), and all SQLite connections, which diskcache keeps
+    thread-local, are created in and closed from that one thread, so
+    close() cleans them up. diskcache serializes writes anyway, so a single
+    worker costs no throughput. Values above the inline limit are spilled
+    to files, which diskcache reads and writes with plain file IO on the
+    same thread; the event loop still never waits on them.
 """
 
 import asyncio
-import fnmatch
+import logging
+import math
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import suppress
 from pathlib import Path
-from types import TracebackType
-from typing import Any
+from typing import Any, TypeVar
 
 import diskcache
 import structlog
 
-from .base import CacheBackend
+from ..logging import level_enabled
+from .base import CACHE_MISS, DELETE_BATCH_SIZE, CacheBackend, compile_glob
+
+# Optional zstd compression of large values
+_ZSTD_AVAILABLE = False
+try:
+    import zstandard
+
+    _ZSTD_AVAILABLE = True
+except ImportError:
+    zstandard = None  # type: ignore[assignment]
 
 logger = structlog.stdlib.get_logger(__name__)
 
+_debug_enabled = level_enabled(__name__, logging.DEBUG)
+
+T = TypeVar("T")
+
+# SQLite tuning applied through diskcache's settings (each maps to a PRAGMA).
+# Pinned explicitly so caches created with other settings are brought in
+# line: WAL with synchronous=NORMAL avoids an fsync per write, a 64 MB page
+# cache and 256 MB mmap serve hot reads from memory, and values under 32 KB
+# stay inline in SQLite instead of spilling to one file each.
+_SQLITE_SETTINGS: dict[str, Any] = {
+    "sqlite_journal_mode": "wal",
+    "sqlite_synchronous": 1,  # NORMAL
+    "sqlite_cache_size": -64_000,  # Negative means KiB rather than pages
+    "sqlite_mmap_size": 256 * 1024 * 1024,
+    "disk_min_file_size": 32 * 1024,
+}
+
+# Tags every untagged entry with its key's category prefix (text before the
+# first colon). Entries written before tagging was introduced are migrated
+# once per cache directory: the UPDATE scans the table, so finishing it
+# bumps SQLite's user_version (unused by diskcache) to _TAGGED_USER_VERSION
+# and later opens only read that pragma.
+_TAGGED_USER_VERSION = 1
+_BACKFILL_TAGS_SQL = (
+    "UPDATE Cache SET tag = substr(key, 1, instr(key, ':') - 1)"
+    " WHERE tag IS NULL AND raw = 1 AND instr(key, ':') > 0"
+)
+
+
+# Selects live string-keyed rows matching a GLOB pattern, one batch at a time.
+# Used with diskcache's batched select/delete so matching runs inside SQLite.
+# Pages by key rather than rowid so a pattern with a literal prefix (e.g.
+# "summary:AAPL*") is resolved as a range scan on the Cache(key, raw) index.
+_GLOB_SELECT_SQL = (
+    "SELECT rowid, key, filename FROM Cache"
+    " WHERE raw = 1 AND key GLOB ? AND (expire_time IS NULL OR expire_time > ?)"
+    " AND key > ? ORDER BY key LIMIT ?"
+)
+
+# Fetches live string-keyed rows for a batch of keys in one statement, and
+# bumps their access time so batched reads still count for LRU eviction.
+_GET_MANY_SQL = (
+    "SELECT rowid, key, expire_time, mode, filename, value FROM Cache"
+    " WHERE raw = 1 AND key IN ({}) AND (expire_time IS NULL OR expire_time > ?)"
+)
+_TOUCH_SQL = "UPDATE Cache SET access_time = ? WHERE rowid IN ({})"
+
+# Selects the live rows for a batch of keys so diskcache's batched delete
+# removes them in one statement and reports how many it removed
+_DELETE_MANY_SQL = (
+    "SELECT rowid, key, filename FROM Cache"
+    " WHERE raw = 1 AND key IN ({}) AND (expire_time IS NULL OR expire_time > ?)"
+    " AND key > ? ORDER BY key"
+)
+
+# Keys per batched SELECT; stays under SQLITE_MAX_VARIABLE_NUMBER (999 on
+# older SQLite builds)
+_GET_BATCH_SIZE = 500
+
+# Stored values that start with a NUL byte are markers written by _encode():
+# JSON and zstd-compressed JSON payloads carry a prefix, CACHE_MISS is a
+# marker of its own, and raw bytes values that happen to start with NUL are
+# prefixed so they are never mistaken for one. Anything else comes back from
+# diskcache exactly as stored.
+_MISS_MARKER = b"\x00MISS"
+_JSON_MARKER = b"\x00JSON"
+_BYTES_MARKER = b"\x00BYTES"
+
+# Prefix of zstd-compressed JSON. Only encoded values of at least
+# _COMPRESS_MIN_BYTES are compressed: large JSON (guru lists, aggregated
+# portfolios) shrinks several times over, while small values would pay the
+# frame overhead and CPU for next to nothing.
+_ZSTD_MARKER = b"\x00ZSTD"
+_COMPRESS_MIN_BYTES = 16 * 1024
+_ZSTD_LEVEL = 3
+
+# Default for diskcache lookups, so an absent key is told apart from a
+# stored value without decoding anything
+_ABSENT: Any = object()
+
+
+def _to_sqlite_glob(pattern: str) -> str:
+    """Convert an fnmatch pattern to SQLite GLOB syntax.
+
+    Both share ``*``, ``?`` and ``[...]``; only set negation differs
+    (``[!...]`` in fnmatch, ``[^...]`` in SQLite).
+    """
+    return pattern.replace("[!", "[^")
+
+
+def _key_tag(key: str) -> str | None:
+    """Return the category prefix of a cache key, used as its diskcache tag."""
+    prefix, sep, _ = key.partition(":")
+    return prefix if sep else None
+
 
 class DiskCacheBackend(CacheBackend):
     """Cache backend using diskcache for persistent storage.
@@ -37,6 +145,12 @@ class DiskCacheBackend(CacheBackend):
     This backend stores cached data in SQLite databases on disk,
     providing persistence across restarts and efficient storage.
 
+    Recently read entries are also kept in a bounded in-process LRU (L1),
+    so repeat reads of hot keys skip SQLite. The L1 keeps encoded bytes and
+    each hit decodes its own copy, so callers may mutate what they get. The
+    L1 only sees this process's writes; set ``l1_size=0`` when several
+    processes write to the same cache directory.
+
     Attributes:
         cache_dir: Directory where cache files are stored
         default_ttl: Default TTL in seconds if not specified
@@ -52,6 +166,9 @@ class DiskCacheBackend(CacheBackend):
         cache_dir: str | Path = ".cache/gurufocus",
         default_ttl: int = 3600,
         size_limit: int = 1024 * 1024 * 1024,  # 1GB default
+        l1_size: int = 2048,
+        stats_ttl: float = 1.0,
+        compress_min_bytes: int = _COMPRESS_MIN_BYTES,
     ) -> None:
         """Initialize the disk cache backend.
 
@@ -59,22 +176,87 @@ class DiskCacheBackend(CacheBackend):
             cache_dir: Directory for cache storage
             default_ttl: Default TTL in seconds (1 hour default)
             size_limit: Maximum cache size in bytes (1GB default)
+            l1_size: Maximum entries in the in-process LRU (0 disables it)
+            stats_ttl: Seconds to reuse the size/count snapshot between writes
+            compress_min_bytes: Encoded size from which values are stored
+                zstd-compressed, when zstandard is installed
         """
-        self._cache_dir = Path(cache_dir)
+        self._cache_dir = cache_dir if isinstance(cache_dir, Path) else Path(cache_dir)
         self._default_ttl = default_ttl
         self._size_limit = size_limit
 
-        # Create cache directory if it doesn't exist
-        self._cache_dir.mkdir(parents=True, exist_ok=True)
+        # In-process LRU of key -> (monotonic expiry, encoded bytes). Only
+        # touched from the cache thread, so it needs no lock. OrderedDict is
+        # implemented in C (get/move_to_end/popitem), which beats the
+        # pure-Python cachetools.LRUCache on the hit path.
+        self._l1: OrderedDict[str, tuple[float, bytes]] = OrderedDict()
+        self._l1_size = l1_size
+
+        # (monotonic time, volume, count) from the last aggregate query.
+        # volume() and len() scan the whole table, so polled stats reuse the
+        # snapshot for stats_ttl seconds; every write through this backend
+        # drops it, so only expiry and other processes can make it stale.
+        self._stats: tuple[float, int, int] | None = None
+        self._stats_ttl = stats_ttl
+
+        # One zstd compressor/decompressor per backend, reused for every
+        # value. They are not safe for concurrent use, but like everything
+        # else here they only run on the cache thread.
+        self._compress_min_bytes = compress_min_bytes
+        self._compressor = zstandard.ZstdCompressor(level=_ZSTD_LEVEL) if _ZSTD_AVAILABLE else None
+        self._decompressor = zstandard.ZstdDecompressor() if _ZSTD_AVAILABLE else None
+
+        # All SQLite work happens on one worker thread, including opening the
+        # cache, so its thread-local connection is the only one to close.
+        # diskcache creates the directory (and parents) only if it's missing.
+        self._executor: ThreadPoolExecutor | None = None
+        self._cache = self._call(self._open_sync)
+
+        logger.debug(
+            "Initialized disk cache at %s (journal_mode=%s)",
+            self._cache_dir,
+            self._cache.sqlite_journal_mode,
+        )
 
-        # Initialize diskcache
-        self._cache = diskcache.Cache(
+    def _open_sync(self) -> diskcache.Cache:
+        """Open the diskcache store, tagging old entries on first open."""
+        # Entries are tagged with their category and the tag index lets
+        # invalidate_category() touch only those rows.
+        cache = diskcache.Cache(
             str(self._cache_dir),
-            size_limit=size_limit,
+            size_limit=self._size_limit,
             eviction_policy="least-recently-used",
+            tag_index=True,
+            **_SQLITE_SETTINGS,
         )
-
-        logger.debug("Initialized disk cache at %s", self._cache_dir)
+        try:
+            (user_version,) = cache._sql("PRAGMA user_version").fetchone()
+            if user_version < _TAGGED_USER_VERSION:
+                self._backfill_tags(cache)
+        except Exception as e:
+            logger.warning("Cache tag backfill error: %s", e)
+        return cache
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Get the cache thread, starting it again if the backend was closed."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="diskcache")
+        return self._executor
+
+    async def _run(self, func: Callable[..., T], *args: Any) -> T:
+        """Run a synchronous diskcache operation on the cache thread."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._get_executor(), func, *args)
+
+    def _call(self, func: Callable[..., T], *args: Any) -> T:
+        """Run a synchronous diskcache operation on the cache thread and wait."""
+        return self._get_executor().submit(func, *args).result()
+
+    def _backfill_tags(self, cache: diskcache.Cache) -> None:
+        """Tag entries written before category tagging was introduced."""
+        with cache._transact(retry=True) as (sql, _):
+            sql(_BACKFILL_TAGS_SQL)
+            sql(f"PRAGMA user_version = {_TAGGED_USER_VERSION}")
 
     @property
     def cache_dir(self) -> Path:
@@ -84,12 +266,20 @@ class DiskCacheBackend(CacheBackend):
     @property
     def size(self) -> int:
         """Get the current cache size in bytes."""
-        return int(self._cache.volume())
+        return self._call(self._stats_sync)[1]
 
     @property
     def count(self) -> int:
         """Get the number of items in the cache."""
-        return len(self._cache)
+        return self._call(self._stats_sync)[2]
+
+    def _stats_sync(self) -> tuple[float, int, int]:
+        """Get the memoized (time, volume, count) snapshot, refreshing it if stale."""
+        stats = self._stats
+        now = time.monotonic()
+        if stats is None or now - stats[0] >= self._stats_ttl:
+            stats = self._stats = (now, int(self._cache.volume()), len(self._cache))
+        return stats
 
     async def get(self, key: str) -> Any | None:
         """Retrieve a value from the cache.
@@ -100,17 +290,106 @@ class DiskCacheBackend(CacheBackend):
         Returns:
             The cached value, or None if not found or expired
         """
-        result = self._get_sync(key)
-        await asyncio.sleep(0)  # Yield to event loop
-        return result
+        return await self._run(self._get_sync, key)
+
+    async def get_with_ttl(self, key: str) -> tuple[Any | None, float | None]:
+        """Retrieve a value and the seconds left until it expires.
+
+        Args:
+            key: The cache key to look up
+
+        Returns:
+            Tuple of (value, seconds until expiry); the remaining time is
+            None for entries stored without an expiry
+        """
+        return await self._run(self._get_with_ttl_sync, key)
+
+    def _get_with_ttl_sync(self, key: str) -> tuple[Any | None, float | None]:
+        """Synchronous get_with_ttl operation."""
+        try:
+            entry = self._l1.get(key)
+            if entry is not None:
+                remaining = entry[0] - time.monotonic()
+                if remaining > 0:
+                    self._l1.move_to_end(key)
+                    return self._decode(entry[1]), None if remaining == math.inf else remaining
+                del self._l1[key]
+
+            stored, expire_time = self._cache.get(key, default=_ABSENT, expire_time=True)
+            if stored is _ABSENT:
+                return None, None
+
+            value = self._decode(self._l1_put(key, stored, expire_time))
+            if value is None:
+                return None, None
+            return value, None if expire_time is None else expire_time - time.time()
+        except Exception as e:
+            logger.warning("Cache get error for %s: %s", key, e)
+            return None, None
+
+    def _l1_get(self, key: str) -> Any | None:
+        """Decode a live L1 entry into a fresh value for the caller."""
+        stored = self._l1_stored(key)
+        return None if stored is None else self._decode(stored)
+
+    def _l1_stored(self, key: str) -> bytes | None:
+        """Return the stored bytes of a live L1 entry, dropping it if it has expired."""
+        entry = self._l1.get(key)
+        if entry is None:
+            return None
+        if entry[0] <= time.monotonic():
+            del self._l1[key]
+            return None
+        self._l1.move_to_end(key)
+        return entry[1]
+
+    def _l1_put(self, key: str, stored: Any, expire_time: float | None) -> Any:
+        """Remember a stored value read from disk until its diskcache expiry.
+
+        Only encoded bytes are kept, zstd values decompressed, and every hit
+        decodes them again, so no two callers share a mutable value.
+        Pickled values come back from diskcache as objects and are not kept.
+
+        Returns:
+            The stored value, decompressed, for the caller to decode
+        """
+        if (
+            isinstance(stored, bytes)
+            and stored.startswith(_ZSTD_MARKER)
+            and self._decompressor is not None
+        ):
+            stored = _JSON_MARKER + self._decompressor.decompress(stored[len(_ZSTD_MARKER) :])
+        if self._l1_size <= 0 or not isinstance(stored, bytes):
+            return stored
+        expires_at = (
+            time.monotonic() + (expire_time - time.time()) if expire_time is not None else math.inf
+        )
+        self._l1[key] = (expires_at, stored)
+        self._l1.move_to_end(key)
+        if len(self._l1) > self._l1_size:
+            self._l1.popitem(last=False)
+        return stored
 
     def _get_sync(self, key: str) -> Any | None:
         """Synchronous get operation."""
         try:
-            value = self._cache.get(key, default=None)
+            value = self._l1_get(key)
             if value is not None:
-                logger.debug("Cache hit: %s", key)
-            else:
+                if _debug_enabled():
+                    logger.debug("Cache L1 hit: %s", key)
+                return value
+
+            stored, expire_time = self._cache.get(key, default=_ABSENT, expire_time=True)
+            if stored is _ABSENT:
+                if _debug_enabled():
+                    logger.debug("Cache miss: %s", key)
+                return None
+
+            value = self._decode(self._l1_put(key, stored, expire_time))
+            if value is not None:
+                if _debug_enabled():
+                    logger.debug("Cache hit: %s", key)
+            elif _debug_enabled():
                 logger.debug("Cache miss: %s", key)
             return value
         except Exception as e:
@@ -126,17 +405,131 @@ class DiskCacheBackend(CacheBackend):
             ttl_seconds: Time-to-live in seconds. None uses default.
         """
         ttl = ttl_seconds if ttl_seconds is not None else self._default_ttl
-        self._set_sync(key, value, ttl)
-        await asyncio.sleep(0)  # Yield to event loop
+        await self._run(self._set_sync, key, value, ttl)
 
     def _set_sync(self, key: str, value: Any, ttl: int) -> None:
         """Synchronous set operation."""
+        self._stats = None
         try:
-            self._cache.set(key, value, expire=ttl)
-            logger.debug("Cache set: %s (TTL: %ds)", key, ttl)
+            self._l1.pop(key, None)
+            self._cache.set(key, self._encode(value), expire=ttl, tag=_key_tag(key))
+            if _debug_enabled():
+                logger.debug("Cache set: %s (TTL: %ds)", key, ttl)
         except Exception as e:
             logger.warning("Cache set error for %s: %s", key, e)
 
+    async def add(self, key: str, value: Any, ttl_seconds: int | None = None) -> bool:
+        """Store a value only if the key is not already cached.
+
+        The check and insert are one diskcache transaction, so when several
+        callers race to fill the same key only the first one writes.
+
+        Args:
+            key: The cache key
+            value: The value to cache
+            ttl_seconds: Time-to-live in seconds. None uses default.
+
+        Returns:
+            True if the value was stored, False if the key already existed
+        """
+        ttl = ttl_seconds if ttl_seconds is not None else self._default_ttl
+        return await self._run(self._add_sync, key, value, ttl)
+
+    def _add_sync(self, key: str, value: Any, ttl: int) -> bool:
+        """Synchronous insert-if-absent."""
+        try:
+            added = bool(self._cache.add(key, self._encode(value), expire=ttl, tag=_key_tag(key)))
+        except Exception as e:
+            logger.warning("Cache add error for %s: %s", key, e)
+            return False
+        if added:
+            self._stats = None
+            self._l1.pop(key, None)
+            if _debug_enabled():
+                logger.debug("Cache add: %s (TTL: %ds)", key, ttl)
+        return added
+
+    def _encode(self, value: Any) -> Any:
+        """Serialize a value to marked JSON bytes for storage.
+
+        Only values that read back equal, and of the same types, are stored
+        as JSON; anything else (dates, tuples, bytes, non-string keys, ...)
+        is stored as-is and pickled by diskcache, so callers never lose a
+        write to a serialization error or get back a different type.
+        Encoding here rather than in a ``diskcache.Disk`` subclass keeps the
+        on-disk format readable by a plain ``diskcache.Cache`` and lets the
+        backend's ``_dumps``/``_loads`` hooks be swapped per instance.
+
+        Encoded values of at least ``compress_min_bytes`` are zstd-compressed
+        when zstandard is installed.
+        """
+        if value is CACHE_MISS:
+            return _MISS_MARKER
+        if isinstance(value, bytes):
+            return _BYTES_MARKER + value if value.startswith(b"\x00") else value
+        try:
+            data = self._dumps(value)
+        except (TypeError, ValueError):
+            return value
+        # JSON has no tuples and only string keys, and the stdlib encoder
+        # converts subclasses to their base types; a value that doesn't
+        # survive the round trip is pickled instead
+        if self._loads(data) != value:
+            return value
+        if self._compressor is not None and len(data) >= self._compress_min_bytes:
+            return _ZSTD_MARKER + self._compressor.compress(data)
+        return _JSON_MARKER + data
+
+    def _decode(self, value: Any) -> Any:
+        """Deserialize a stored value written by _encode().
+
+        Pickled entries and raw bytes come back as stored and are returned
+        unchanged. Compressed values read without zstandard installed, and
+        JSON that no longer parses, decode to None, so they are treated as
+        a miss and refetched.
+        """
+        if not isinstance(value, bytes) or not value.startswith(b"\x00"):
+            return value
+        if value.startswith(_JSON_MARKER):
+            data = value[len(_JSON_MARKER) :]
+        elif value.startswith(_ZSTD_MARKER):
+            if self._decompressor is None:
+                return None
+            data = self._decompressor.decompress(value[len(_ZSTD_MARKER) :])
+        elif value == _MISS_MARKER:
+            return CACHE_MISS
+        elif value.startswith(_BYTES_MARKER):
+            return value[len(_BYTES_MARKER) :]
+        else:
+            return value
+        try:
+            return self._loads(data)
+        except ValueError:
+            return None
+
+    async def set_many(self, items: dict[str, Any], ttl_seconds: int | None = None) -> None:
+        """Store multiple values in a single transaction.
+
+        Args:
+            items: Dictionary of key -> value to cache
+            ttl_seconds: Time-to-live in seconds for all items. None uses default.
+        """
+        ttl = ttl_seconds if ttl_seconds is not None else self._default_ttl
+        await self._run(self._set_many_sync, items, ttl)
+
+    def _set_many_sync(self, items: dict[str, Any], ttl: int) -> None:
+        """Synchronous multi-key set, committed once for the whole batch."""
+        self._stats = None
+        try:
+            with self._cache.transact():
+                for key, value in items.items():
+                    self._l1.pop(key, None)
+                    self._cache.set(key, self._encode(value), expire=ttl, tag=_key_tag(key))
+            logger.debug("Cache set_many: %d keys (TTL: %ds)", len(items), ttl)
+        except Exception as e:
+            # The transaction rolled back, so nothing was stored
+            logger.warning("Cache set_many error: %s", e)
+
     async def delete(self, key: str) -> bool:
         """Delete a value from the cache.
 
@@ -146,16 +539,16 @@ class DiskCacheBackend(CacheBackend):
         Returns:
             True if the key existed and was deleted
         """
-        result = self._delete_sync(key)
-        await asyncio.sleep(0)  # Yield to event loop
-        return result
+        return await self._run(self._delete_sync, key)
 
     def _delete_sync(self, key: str) -> bool:
         """Synchronous delete operation."""
+        self._stats = None
         try:
-            existed = key in self._cache
-            if existed:
-                del self._cache[key]
+            self._l1.pop(key, None)
+            # One transaction that reports whether a live row was removed
+            existed = bool(self._cache.delete(key))
+            if existed and _debug_enabled():
                 logger.debug("Cache delete: %s", key)
             return existed
         except Exception as e:
@@ -164,12 +557,13 @@ class DiskCacheBackend(CacheBackend):
 
     async def clear(self) -> None:
         """Clear all entries from the cache."""
-        self._clear_sync()
-        await asyncio.sleep(0)  # Yield to event loop
+        await self._run(self._clear_sync)
 
     def _clear_sync(self) -> None:
         """Synchronous clear operation."""
+        self._stats = None
         try:
+            self._l1.clear()
             self._cache.clear()
             logger.info("Cache cleared")
         except Exception as e:
@@ -184,14 +578,12 @@ class DiskCacheBackend(CacheBackend):
         Returns:
             True if the key exists and hasn't expired
         """
-        result = self._exists_sync(key)
-        await asyncio.sleep(0)  # Yield to event loop
-        return result
+        return await self._run(self._exists_sync, key)
 
     def _exists_sync(self, key: str) -> bool:
         """Synchronous exists check."""
         try:
-            return key in self._cache
+            return self._l1_stored(key) is not None or key in self._cache
         except Exception as e:
             logger.warning("Cache exists error for %s: %s", key, e)
             return False
@@ -205,23 +597,62 @@ class DiskCacheBackend(CacheBackend):
         Returns:
             Number of keys deleted
         """
-        result = self._delete_pattern_sync(pattern)
-        await asyncio.sleep(0)  # Yield to event loop
-        return result
+        return await self._run(self._delete_pattern_sync, pattern)
+
+    async def delete_patterns(self, patterns: Sequence[str]) -> int:
+        """Delete all keys matching any of several glob patterns.
+
+        Every pattern is handled in a single hop to the cache thread.
+
+        Args:
+            patterns: Glob-style patterns (e.g., ["summary:AAPL*", "quote:AAPL*"])
+
+        Returns:
+            Number of keys deleted
+        """
+        return await self._run(self._delete_patterns_sync, patterns)
+
+    def _delete_patterns_sync(self, patterns: Sequence[str]) -> int:
+        """Synchronous multi-pattern delete."""
+        return sum(self._delete_pattern_sync(pattern) for pattern in patterns)
 
     def _delete_pattern_sync(self, pattern: str) -> int:
-        """Synchronous pattern delete."""
+        """Synchronous pattern delete, matched by SQLite's GLOB operator."""
+        self._stats = None
+        self._l1.clear()
+        try:
+            args = [_to_sqlite_glob(pattern), time.time(), "", DELETE_BATCH_SIZE]
+            deleted = int(
+                self._cache._select_delete(_GLOB_SELECT_SQL, args, row_index=1, arg_index=2)
+            )
+        except AttributeError:
+            # diskcache internals changed; fall back to matching in Python
+            return self._delete_pattern_scan_sync(pattern)
+        except Exception as e:
+            logger.warning("Cache delete pattern error for %s: %s", pattern, e)
+            return 0
+
+        if deleted > 0:
+            logger.debug("Cache delete pattern %s: %d keys", pattern, deleted)
+        return deleted
+
+    def _delete_pattern_scan_sync(self, pattern: str) -> int:
+        """Pattern delete that walks every key in Python."""
         deleted = 0
         try:
-            # Iterate through all keys and match pattern
-            keys_to_delete = []
+            # Stream keys and delete matches a batch at a time, one transaction
+            # per batch. iterkeys() pages by rowid, so deleting while
+            # iterating is safe and only one batch is held in memory.
+            match = compile_glob(pattern)
+            batch: list[str] = []
             for key in self._cache.iterkeys():
-                if fnmatch.fnmatch(key, pattern):
-                    keys_to_delete.append(key)
-
-            for key in keys_to_delete:
-                del self._cache[key]
-                deleted += 1
+                if match(key):
+                    batch.append(key)
+                    if len(batch) >= DELETE_BATCH_SIZE:
+                        deleted += self._delete_many_sync(batch)
+                        batch = []
+            if batch:
+                deleted += self._delete_many_sync(batch)
 
             if deleted > 0:
                 logger.debug("Cache delete pattern %s: %d keys", pattern, deleted)
@@ -230,6 +661,81 @@ class DiskCacheBackend(CacheBackend):
 
         return deleted
 
+    async def invalidate_category(self, category: str) -> int:
+        """Delete all entries in a cache category using the tag index.
+
+        Args:
+            category: Category prefix of the keys to delete
+
+        Returns:
+            Number of keys deleted
+        """
+        return await self._run(self._invalidate_category_sync, category)
+
+    def _invalidate_category_sync(self, category: str) -> int:
+        """Synchronous category invalidation."""
+        self._stats = None
+        self._l1.clear()
+        try:
+            deleted = int(self._cache.evict(category))
+            if deleted > 0:
+                logger.debug("Cache evict category %s: %d keys", category, deleted)
+            return deleted
+        except Exception as e:
+            logger.warning("Cache evict error for category %s: %s", category, e)
+            return 0
+
+    async def delete_many(self, keys: list[str]) -> int:
+        """Delete multiple keys from the cache.
+
+        Args:
+            keys: List of cache keys to delete
+
+        Returns:
+            Number of keys that existed and were deleted
+        """
+        return await self._run(self._delete_many_sync, keys)
+
+    def _delete_many_sync(self, keys: list[str]) -> int:
+        """Synchronous multi-key delete in a single transaction."""
+        self._stats = None
+        deleted = 0
+        try:
+            for key in keys:
+                self._l1.pop(key, None)
+            with self._cache.transact():
+                for start in range(0, len(keys), DELETE_BATCH_SIZE):
+                    chunk = keys[start : start + DELETE_BATCH_SIZE]
+                    select = _DELETE_MANY_SQL.format(",".join("?" * len(chunk)))
+                    args = [*chunk, time.time(), ""]
+                    # SQLite counts the removed rows; no per-key round trip
+                    deleted += int(
+                        self._cache._select_delete(
+                            select, args, row_index=1, arg_index=len(chunk) + 1
+                        )
+                    )
+        except AttributeError:
+            # diskcache internals changed; delete one key at a time
+            return self._delete_each_sync(keys)
+        except Exception as e:
+            # The transaction rolled back, so nothing was removed
+            logger.warning("Cache delete_many error: %s", e)
+            return 0
+        return deleted
+
+    def _delete_each_sync(self, keys: list[str]) -> int:
+        """Multi-key delete through diskcache's public API, in one transaction."""
+        deleted = 0
+        try:
+            with self._cache.transact():
+                for key in keys:
+                    if self._cache.delete(key):
+                        deleted += 1
+        except Exception as e:
+            logger.warning("Cache delete_many error: %s", e)
+            return 0
+        return deleted
+
     async def get_many(self, keys: list[str]) -> dict[str, Any]:
         """Retrieve multiple values from the cache.
 
@@ -239,29 +745,78 @@ class DiskCacheBackend(CacheBackend):
         Returns:
             Dictionary of key -> value for keys that were found
         """
-        result = self._get_many_sync(keys)
-        await asyncio.sleep(0)  # Yield to event loop
-        return result
+        return await self._run(self._get_many_sync, keys)
 
     def _get_many_sync(self, keys: list[str]) -> dict[str, Any]:
-        """Synchronous get_many operation."""
-        result = {}
+        """Synchronous get_many operation, one SELECT per batch of L1 misses."""
+        result: dict[str, Any] = {}
+        remaining = []
         for key in keys:
-            value = self._get_sync(key)
+            value = self._l1_get(key)
             if value is not None:
                 result[key] = value
+            else:
+                remaining.append(key)
+
+        try:
+            if remaining:
+                result.update(self._get_many_batched_sync(remaining))
+        except AttributeError:
+            # diskcache internals changed; fall back to per-key gets
+            for key in remaining:
+                value = self._get_sync(key)
+                if value is not None:
+                    result[key] = value
+            return result
+        except Exception as e:
+            logger.warning("Cache get_many error: %s", e)
+            return result
+
+        if _debug_enabled():
+            logger.debug("Cache get_many: %d/%d hits", len(result), len(keys))
+        return result
+
+    def _get_many_batched_sync(self, keys: list[str]) -> dict[str, Any]:
+        """Read keys with batched SELECT ... IN queries on diskcache's tables."""
+        result: dict[str, Any] = {}
+        disk = self._cache._disk
+        for start in range(0, len(keys), _GET_BATCH_SIZE):
+            chunk = keys[start : start + _GET_BATCH_SIZE]
+            placeholders = ",".join("?" * len(chunk))
+            with self._cache._transact(retry=True) as (sql, _):
+                now = time.time()
+                rows = sql(_GET_MANY_SQL.format(placeholders), (*chunk, now)).fetchall()
+                if rows:
+                    sql(
+                        _TOUCH_SQL.format(",".join("?" * len(rows))),
+                        (now, *(row[0] for row in rows)),
+                    )
+
+            for _, key, expire_time, mode, filename, db_value in rows:
+                try:
+                    stored = disk.fetch(mode, filename, db_value, False)
+                except OSError:
+                    # Value file was removed before we could read it
+                    continue
+                value = self._decode(self._l1_put(key, stored, expire_time))
+                if value is not None:
+                    result[key] = value
         return result
 
     async def close(self) -> None:
-        """Close the cache and release resources."""
-        # Close synchronously in the current thread to properly clean up
-        # thread-local connections. Using run_in_executor would run in a
-        # different thread and miss the connections created in this thread.
-        self._close_sync()
-        await asyncio.sleep(0)  # Yield to event loop
+        """Close the cache, its connection and the cache thread."""
+        if self._executor is None:
+            return
+        # Close on the cache thread, which owns the thread-local connection.
+        # A later operation starts a new thread and diskcache reconnects.
+        await self._run(self._close_sync)
+        self._executor.shutdown(wait=True)
+        self._executor = None
 
     def _close_sync(self) -> None:
         """Synchronous close operation."""
+        self._stats = None
+        self._l1.clear()
         try:
             self._cache.close()
             # Clear thread-local storage to prevent ResourceWarnings
@@ -282,24 +837,12 @@ class DiskCacheBackend(CacheBackend):
         Returns:
             Dictionary with cache statistics
         """
+        _, size, count = self._call(self._stats_sync)
         return {
             "cache_dir": str(self._cache_dir),
-            "size_bytes": self.size,
-            "size_mb": round(self.size / (1024 * 1024), 2),
-            "item_count": self.count,
+            "size_bytes": size,
+            "size_mb": round(size / (1024 * 1024), 2),
+            "item_count": count,
             "size_limit_bytes": self._size_limit,
             "size_limit_mb": round(self._size_limit / (1024 * 1024), 2),
         }
-
-    async def __aenter__(self) -> "DiskCacheBackend":
-        """Enter async context manager."""
-        return self
-
-    async def __aexit__(
-        self,
-        exc_type: type[BaseException] | None,
-        exc_val: BaseException | None,
-        exc_tb: TracebackType | None,
-    ) -> None:
-        """Exit async context manager, closing cache."""
-        await self.close()
@@ -8,18 +8,31 @@ with support for:
 - Statistics and monitoring
 """
 
+import logging
 from pathlib import Path
 from types import TracebackType
 from typing import Any
 
 import structlog
 
-from .base import CacheBackend
-from .config import CacheCategory, build_cache_key, get_ttl_seconds
+from ..logging import level_enabled
+from .base import CACHE_MISS, NEGATIVE_TTL_SECONDS, CacheBackend
+from .config import (
+    EARNINGS_INVALIDATED_CATEGORIES,
+    CacheCategory,
+    CacheTier,
+    build_cache_key,
+    categories_for_tier,
+    get_stale_ttl_seconds,
+    get_store_ttl_seconds,
+    symbol_key_patterns,
+)
 from .disk import DiskCacheBackend
 
 logger = structlog.stdlib.get_logger(__name__)
 
+_debug_enabled = level_enabled(__name__, logging.DEBUG)
+
 
 class CacheManager:
     """High-level cache manager for GuruFocus API responses.
@@ -107,24 +120,71 @@ class CacheManager:
             bypass: If True, skip cache and return None
 
         Returns:
-            Cached value or None if not found/bypassed
+            Cached value, ``CACHE_MISS`` if a miss was recorded with
+            set_miss(), or None if not found/bypassed. Falsy values such
+            as ``[]`` are hits; only None means nothing is cached.
         """
-        if not self.enabled or bypass:
+        backend = self._backend
+        if backend is None or not self._enabled or bypass:
             self._misses += 1
             return None
 
         key = build_cache_key(category, *key_parts)
-        value = await self._backend.get(key)  # type: ignore[union-attr]
+        value = await backend.get(key)
 
         if value is not None:
             self._hits += 1
-            logger.debug("Cache hit: %s", key)
+            if _debug_enabled():
+                logger.debug("Cache hit: %s", key)
         else:
             self._misses += 1
-            logger.debug("Cache miss: %s", key)
+            if _debug_enabled():
+                logger.debug("Cache miss: %s", key)
 
         return value
 
+    async def get_with_freshness(
+        self,
+        category: CacheCategory,
+        *key_parts: str,
+        bypass: bool = False,
+    ) -> tuple[Any | None, bool]:
+        """Get a value from the cache and whether it is past its TTL.
+
+        For categories with a ``stale_ttl_seconds`` window, entries are kept
+        that long after their TTL. Such an entry is returned with
+        ``is_stale=True`` so the caller can serve it and refresh it in the
+        background (stale-while-revalidate). Backends that can't report
+        expiry always report entries as fresh.
+
+        Args:
+            category: The cache category (determines TTL)
+            *key_parts: Additional key parts (e.g., symbol)
+            bypass: If True, skip cache and return (None, False)
+
+        Returns:
+            Tuple of (value, is_stale); the value is as get() returns it
+        """
+        backend = self._backend
+        if backend is None or not self._enabled or bypass:
+            self._misses += 1
+            return None, False
+
+        key = build_cache_key(category, *key_parts)
+        value, remaining = await backend.get_with_ttl(key)
+
+        if value is None:
+            self._misses += 1
+            if _debug_enabled():
+                logger.debug("Cache miss: %s", key)
+            return None, False
+
+        self._hits += 1
+        is_stale = remaining is not None and remaining <= get_stale_ttl_seconds(category)
+        if _debug_enabled():
+            logger.debug("Cache %s hit: %s", "stale" if is_stale else "fresh", key)
+        return value, is_stale
+
     async def set(
         self,
         category: CacheCategory,
@@ -138,16 +198,95 @@ class CacheManager:
             category: The cache category (determines TTL)
             *key_parts: Additional key parts (e.g., symbol)
             value: The value to cache
-            ttl_override: Override the category's default TTL (seconds)
+            ttl_override: Override the category's default TTL (seconds).
+                This sets the backend expiry directly, stale window included.
         """
-        if not self.enabled:
+        backend = self._backend
+        if backend is None or not self._enabled:
             return
 
         key = build_cache_key(category, *key_parts)
-        ttl = ttl_override if ttl_override is not None else get_ttl_seconds(category)
+        ttl = ttl_override if ttl_override is not None else get_store_ttl_seconds(category)
+
+        await backend.set(key, value, ttl_seconds=ttl)
+        if _debug_enabled():
+            logger.debug("Cache set: %s (TTL: %ds)", key, ttl)
+
+    async def add(
+        self,
+        category: CacheCategory,
+        *key_parts: str,
+        value: Any,
+        ttl_override: int | None = None,
+    ) -> bool:
+        """Store a value only if nothing is cached for the key yet.
+
+        Use this to fill the cache after a miss when several callers may
+        fetch the same data at once; only the first write lands.
+
+        Args:
+            category: The cache category (determines TTL)
+            *key_parts: Additional key parts (e.g., symbol)
+            value: The value to cache
+            ttl_override: Override the category's default TTL (seconds)
+
+        Returns:
+            True if the value was stored, False if the key was already
+            cached or caching is disabled
+        """
+        backend = self._backend
+        if backend is None or not self._enabled:
+            return False
+
+        key = build_cache_key(category, *key_parts)
+        ttl = ttl_override if ttl_override is not None else get_store_ttl_seconds(category)
+
+        added = await backend.add(key, value, ttl_seconds=ttl)
+        if added and _debug_enabled():
+            logger.debug("Cache add: %s (TTL: %ds)", key, ttl)
+        return added
+
+    async def set_many(
+        self,
+        category: CacheCategory,
+        values: dict[str, Any],
+        ttl_override: int | None = None,
+    ) -> None:
+        """Store several entries of one category in a single backend call.
+
+        Args:
+            category: The cache category (determines TTL)
+            values: Mapping of key part (e.g., symbol) -> value to cache
+            ttl_override: Override the category's default TTL (seconds)
+        """
+        backend = self._backend
+        if backend is None or not self._enabled or not values:
+            return
+
+        ttl = ttl_override if ttl_override is not None else get_store_ttl_seconds(category)
+        items = {build_cache_key(category, part): value for part, value in values.items()}
 
-        await self._backend.set(key, value, ttl_seconds=ttl)  # type: ignore[union-attr]
-        logger.debug("Cache set: %s (TTL: %ds)", key, ttl)
+        await backend.set_many(items, ttl_seconds=ttl)
+        logger.debug("Cache set_many: %s x%d (TTL: %ds)", category.value, len(items), ttl)
+
+    async def set_miss(
+        self,
+        category: CacheCategory,
+        *key_parts: str,
+        ttl_seconds: int = NEGATIVE_TTL_SECONDS,
+    ) -> None:
+        """Record that upstream has no data for a key (negative caching).
+
+        Until the entry expires, get() returns ``CACHE_MISS`` for the key so
+        callers can skip re-querying the API, e.g. after a 404.
+
+        Args:
+            category: The cache category
+            *key_parts: Additional key parts (e.g., symbol)
+            ttl_seconds: How long to remember the miss (short by default,
+                independent of the category TTL)
+        """
+        await self.set(category, *key_parts, value=CACHE_MISS, ttl_override=ttl_seconds)
 
     async def delete(
         self,
@@ -163,11 +302,11 @@ class CacheManager:
         Returns:
             True if the entry was deleted
         """
-        if not self.enabled:
+        backend = self._backend
+        if backend is None or not self._enabled:
             return False
 
-        key = build_cache_key(category, *key_parts)
-        return await self._backend.delete(key)  # type: ignore[union-attr]
+        return await backend.delete(build_cache_key(category, *key_parts))
 
     async def invalidate_symbol(self, symbol: str) -> int:
         """Invalidate all cached data for a symbol.
@@ -181,12 +320,14 @@ class CacheManager:
         Returns:
             Number of cache entries deleted
         """
-        if not self.enabled:
+        backend = self._backend
+        if backend is None or not self._enabled:
             return 0
 
         symbol = symbol.upper()
-        pattern = f"*:{symbol}*"
-        count = await self._backend.delete_pattern(pattern)  # type: ignore[union-attr]
+        # One prefix-anchored pattern per category rather than "*:SYMBOL*",
+        # so the backend never has to test every key in the cache
+        count = await backend.delete_patterns(symbol_key_patterns(symbol))
 
         logger.info("Invalidated %d cache entries for %s", count, symbol)
         return count
@@ -200,21 +341,64 @@ class CacheManager:
         Returns:
             Number of cache entries deleted
         """
-        if not self.enabled:
+        backend = self._backend
+        if backend is None or not self._enabled:
             return 0
 
-        pattern = f"{category.value}:*"
-        count = await self._backend.delete_pattern(pattern)  # type: ignore[union-attr]
+        count = await backend.invalidate_category(category.value)
 
         logger.info("Invalidated %d cache entries for category %s", count, category.value)
         return count
 
+    async def invalidate_earnings_categories(self) -> int:
+        """Invalidate every category flagged ``invalidate_on_earnings``.
+
+        Intended to run after an earnings season update, when financials,
+        ratios, estimates and similar data all go stale at once.
+
+        Returns:
+            Number of cache entries deleted
+        """
+        backend = self._backend
+        if backend is None or not self._enabled:
+            return 0
+
+        count = 0
+        for category in EARNINGS_INVALIDATED_CATEGORIES:
+            count += await backend.invalidate_category(category.value)
+
+        logger.info("Invalidated %d earnings-dependent cache entries", count)
+        return count
+
+    async def invalidate_tier(self, tier: CacheTier) -> int:
+        """Invalidate every category in a cache tier.
+
+        For example, drop all PRICE_DEPENDENT data after market close.
+
+        Args:
+            tier: The cache tier to invalidate
+
+        Returns:
+            Number of cache entries deleted
+        """
+        backend = self._backend
+        if backend is None or not self._enabled:
+            return 0
+
+        count = 0
+        for category in categories_for_tier(tier):
+            count += await backend.invalidate_category(category.value)
+
+        logger.info("Invalidated %d cache entries for tier %s", count, tier.value)
+        return count
+
     async def clear(self) -> None:
         """Clear all cached data."""
-        if not self.enabled:
+        backend = self._backend
+        if backend is None or not self._enabled:
             return
 
-        await self._backend.clear()  # type: ignore[union-attr]
+        await backend.clear()
         self._hits = 0
         self._misses = 0
         logger.info("Cache cleared")
@@ -235,14 +419,15 @@ class CacheManager:
         Returns:
             Dictionary with cache statistics
         """
+        enabled = self.enabled
         stats = {
-            "enabled": self.enabled,
+            "enabled": enabled,
             "hits": self._hits,
             "misses": self._misses,
             "hit_rate": round(self.hit_rate, 3),
         }
 
-        if self.enabled and isinstance(self._backend, DiskCacheBackend):
+        if enabled and isinstance(self._backend, DiskCacheBackend):
             stats.update(self._backend.get_stats())
 
         return stats
@@ -265,14 +450,20 @@ class NullCacheManager(CacheManager):
     """A cache manager that doesn't cache anything.
 
     Useful for testing or when caching should be completely disabled.
+    The per-request methods are static no-ops, so calls skip key building
+    and bound-method creation entirely.
     """
 
     def __init__(self) -> None:
         """Initialize null cache manager."""
-        super().__init__(enabled=False)
+        self._enabled = False
+        self._cache_dir = Path()
+        self._backend = None
+        self._hits = 0
+        self._misses = 0
 
+    @staticmethod
     async def get(
-        self,
         category: CacheCategory,
         *key_parts: str,
         bypass: bool = False,
@@ -280,8 +471,8 @@ class NullCacheManager(CacheManager):
         """Always returns None."""
         return None
 
+    @staticmethod
     async def set(
-        self,
         category: CacheCategory,
         *key_parts: str,
         value: Any,
@@ -290,8 +481,18 @@ class NullCacheManager(CacheManager):
         """Does nothing."""
         pass
 
+    @staticmethod
+    async def add(
+        category: CacheCategory,
+        *key_parts: str,
+        value: Any,
+        ttl_override: int | None = None,
+    ) -> bool:
+        """Always returns False."""
+        return False
+
+    @staticmethod
     async def delete(
-        self,
         category: CacheCategory,
         *key_parts: str,
     ) -> bool:
@@ -3,40 +3,79 @@
 from __future__ import annotations
 
 import asyncio
+import importlib.util
+import itertools
+import logging
+import random
+import re
 import time
-import uuid
-from collections.abc import Generator
-from contextlib import contextmanager
+from collections import OrderedDict
+from collections.abc import Callable
+from contextlib import AbstractContextManager, nullcontext
+from functools import partial
+from secrets import token_hex
 from types import TracebackType
-from typing import TYPE_CHECKING, Any, Literal, Self
+from typing import TYPE_CHECKING, Any, Literal, NoReturn, Self
 
 import httpx
 import structlog
-from structlog.contextvars import bind_contextvars, clear_contextvars
 
 from .config import GuruFocusSettings
 from .exceptions import (
     APIError,
     AuthenticationError,
+    GuruFocusError,
     InvalidSymbolError,
     NetworkError,
     NotFoundError,
     RateLimitError,
 )
+from .logging import level_enabled
+from .singleflight import SingleFlight
 
-# Optional OpenTelemetry support
-_OTEL_AVAILABLE = False
-_tracer = None
+# Optional OpenTelemetry support. Importing it takes tens of milliseconds,
+# so only its presence is checked here; _load_tracer() imports it on the
+# first traced request. find_spec() imports the parent package, so it
+# raises rather than returning None when opentelemetry is missing.
 try:
-    from opentelemetry import trace
-    from opentelemetry.trace import Status, StatusCode
+    _OTEL_AVAILABLE = importlib.util.find_spec("opentelemetry.trace") is not None
+except ImportError:
+    _OTEL_AVAILABLE = False
+_tracer: Tracer | None = None
+if TYPE_CHECKING:
+    from opentelemetry.trace import Status, StatusCode, Tracer
+else:
+    Status = None
+    StatusCode = None
 
-    _OTEL_AVAILABLE = True
-    _tracer = trace.get_tracer("gurufocus_api")
+# Optional HTTP/2 support (httpx needs the h2 package for it)
+_HTTP2_AVAILABLE = False
+try:
+    import h2  # noqa: F401
+
+    _HTTP2_AVAILABLE = True
 except ImportError:
-    trace = None  # type: ignore[assignment]
-    Status = None  # type: ignore[assignment, misc]
-    StatusCode = None  # type: ignore[assignment, misc]
+    pass
+
+# Optional orjson support for faster response parsing and body encoding
+_ORJSON_AVAILABLE = False
+try:
+    import orjson
+
+    _ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Request IDs only correlate log lines and spans, so a per-process random
+# prefix plus a counter is enough and skips an os.urandom() call per request
+_REQUEST_ID_PREFIX = token_hex(2)
+_REQUEST_IDS = itertools.count()
+
+# Symbol in a "stock/SYMBOL/..." endpoint; a single C-level match beats
+# stripping and partitioning the path in Python
+_STOCK_SYMBOL_RE = re.compile(r"/*stock/([^/]+)")
 
 if TYPE_CHECKING:
     from .cache import CacheManager
@@ -53,27 +92,131 @@ if TYPE_CHECKING:
 
 logger = structlog.stdlib.get_logger(__name__)
 
+# Request timing is only read by the INFO success log and spans, so it is
+# skipped when neither will see it; per-attempt debug logs are skipped
+# before structlog builds their event dict
+_info_enabled = level_enabled(__name__, logging.INFO)
+_debug_enabled = level_enabled(__name__, logging.DEBUG)
+
+# HTTP clients shared by GuruFocusClient instances with shared_http_client
+# enabled. Keyed by event loop (httpx connections can't move between loops)
+# plus the settings that shape the connection pool.
+_SHARED_CLIENTS: dict[tuple[Any, ...], httpx.AsyncClient] = {}
+
+# Most GET requests kept prepared per client, least recently used dropped
+_PREPARED_GETS_MAX = 256
+
+
+async def close_shared_clients() -> None:
+    """Close the shared HTTP clients created on the running event loop.
+
+    GuruFocusClient.close() leaves a shared connection pool open for other
+    instances; call this on application shutdown to release it.
+    """
+    loop = asyncio.get_running_loop()
+    for key in [key for key in _SHARED_CLIENTS if key[0] is loop]:
+        await _SHARED_CLIENTS.pop(key).aclose()
+
+
+_NOOP_SPAN: AbstractContextManager[None] = nullcontext()
+
+
+def _noop_span(
+    name: str,
+    attributes: dict[str, Any] | None = None,
+) -> AbstractContextManager[Any]:
+    """Return the shared no-op span context used without OpenTelemetry.
+
+    `nullcontext` holds no state, so one instance is reused for every request.
+    """
+    return _NOOP_SPAN
+
 
-@contextmanager
-def _create_span(
+def _otel_span(
     name: str,
     attributes: dict[str, Any] | None = None,
-) -> Generator[Any, None, None]:
-    """Create an OpenTelemetry span if available, otherwise a no-op context.
+) -> AbstractContextManager[Any]:
+    """Start an OpenTelemetry span as the current span.
 
     Args:
         name: Span name
         attributes: Initial span attributes
 
-    Yields:
-        The span object if OpenTelemetry is available, otherwise None
+    Returns:
+        Context manager yielding the span
+    """
+    tracer = _tracer or _load_tracer()
+    return tracer.start_as_current_span(name, attributes=attributes)
+
+
+def _load_tracer() -> Tracer:
+    """Import OpenTelemetry and create the module's tracer.
+
+    Also binds ``Status`` and ``StatusCode``, which the request path only
+    uses once a span exists.
+
+    Returns:
+        The tracer for this module
+    """
+    global _tracer, Status, StatusCode
+    from opentelemetry import trace
+    from opentelemetry.trace import Status, StatusCode
+
+    _tracer = trace.get_tracer("gurufocus_api")
+    return _tracer
+
+
+# Bound once at import so the no-op case skips a generator per request
+_create_span = _otel_span if _OTEL_AVAILABLE else _noop_span
+
+
+def _error_preview(response: httpx.Response) -> str:
+    """Decode the start of an error body for exception details.
+
+    Only the first 500 bytes are decoded, as UTF-8, so a large HTML error
+    page isn't charset-sniffed and decoded in full just to be truncated.
     """
-    if not _OTEL_AVAILABLE or _tracer is None:
-        yield None
-        return
+    return response.content[:500].decode("utf-8", "replace")
+
+
+def _rate_limit_error(
+    response: httpx.Response, endpoint: str, symbol: str | None
+) -> GuruFocusError:
+    """Build the error for a 429 response."""
+    retry_after = response.headers.get("Retry-After")
+    return RateLimitError(
+        message="API rate limit exceeded",
+        retry_after=int(retry_after) if retry_after else None,
+    )
+
+
+def _unauthorized_error(
+    response: httpx.Response, endpoint: str, symbol: str | None
+) -> GuruFocusError:
+    """Build the error for a 401 response."""
+    return AuthenticationError("Invalid or missing API token")
 
-    with _tracer.start_as_current_span(name, attributes=attributes) as span:
-        yield span
+
+def _forbidden_error(response: httpx.Response, endpoint: str, symbol: str | None) -> GuruFocusError:
+    """Build the error for a 403 response."""
+    return AuthenticationError("Access forbidden - check API token permissions")
+
+
+def _not_found_error(response: httpx.Response, endpoint: str, symbol: str | None) -> GuruFocusError:
+    """Build the error for a 404 response."""
+    # A 404 on a stock endpoint means the symbol is invalid
+    if symbol:
+        return InvalidSymbolError(symbol)
+    return NotFoundError(f"Resource not found: {endpoint}")
+
+
+# Error statuses with a dedicated exception; other 4xx/5xx become APIError
+_STATUS_ERRORS: dict[int, Callable[[httpx.Response, str, str | None], GuruFocusError]] = {
+    429: _rate_limit_error,
+    401: _unauthorized_error,
+    403: _forbidden_error,
+    404: _not_found_error,
+}
 
 
 class GuruFocusClient:
@@ -138,7 +281,16 @@ class GuruFocusClient:
         self._base_url = base_url or settings.base_url
         self._timeout = timeout or settings.timeout
         self._max_retries = max_retries if max_retries is not None else settings.max_retries
+        self._total_attempts = self._max_retries + 1
+
+        # URL prefixes with the token in the path, built once per client.
+        # Requests get absolute URLs: httpx resolves a relative URL against
+        # base_url in pure Python, which costs more than this concatenation,
+        # and a token-free HTTP client can be shared between clients.
+        self._url_prefix = f"{self._base_url}/{self._api_token}/"
+        self._v2_url_prefix = f"{self._base_url.replace('/user', '')}/v2/{self._api_token}/"
         self._retry_delay = settings.retry_delay
+        self._retry_delay_cap = max(settings.retry_delay_cap, self._retry_delay)
 
         # Cache settings
         self._cache_enabled = cache_enabled if cache_enabled is not None else settings.cache_enabled
@@ -153,6 +305,7 @@ class GuruFocusClient:
             rate_limit_daily if rate_limit_daily is not None else settings.rate_limit_daily
         )
         self._rate_limit_burst = rate_limit_burst or settings.rate_limit_burst
+        self._rate_limit_algorithm = settings.rate_limit_algorithm
 
         # HTTP client (created on first use or context entry)
         self._client: httpx.AsyncClient | None = None
@@ -167,6 +320,14 @@ class GuruFocusClient:
         # Usage tracker (lazily initialized)
         self._usage_tracker: APIUsageTracker | None = None
 
+        # Identical GETs in flight, shared by concurrent callers
+        self._in_flight = SingleFlight()
+
+        # Built GET requests by URL. Only the URL varies between them (the
+        # HTTP clients set no default headers or auth), so a polled endpoint
+        # skips httpx's URL parsing and header merging after the first call.
+        self._prepared_gets: OrderedDict[str, httpx.Request] = OrderedDict()
+
         # Endpoint instances (lazily initialized)
         self._stocks: StocksEndpoint | None = None
         self._insiders: InsidersEndpoint | None = None
@@ -210,7 +371,12 @@ class GuruFocusClient:
                 await client.request(...)
         """
         if self._rate_limiter is None:
-            from .rate_limiter import NullRateLimiter, RateLimitConfig, RateLimiter
+            from .rate_limiter import (
+                NullRateLimiter,
+                RateLimitConfig,
+                RateLimiter,
+                SlidingWindowRateLimiter,
+            )
 
             if not self._rate_limit_enabled:
                 self._rate_limiter = NullRateLimiter()
@@ -220,7 +386,10 @@ class GuruFocusClient:
                     requests_per_day=self._rate_limit_daily,
                     burst_size=self._rate_limit_burst,
                 )
-                self._rate_limiter = RateLimiter(config)
+                if self._rate_limit_algorithm == "sliding_window":
+                    self._rate_limiter = SlidingWindowRateLimiter(config)
+                else:
+                    self._rate_limiter = RateLimiter(config)
         return self._rate_limiter
 
     @property
@@ -416,32 +585,98 @@ class GuruFocusClient:
     async def _ensure_client(self) -> httpx.AsyncClient:
         """Ensure HTTP client is initialized."""
         if self._client is None or self._client.is_closed:
-            self._client = httpx.AsyncClient(
-                timeout=httpx.Timeout(self._timeout),
-                follow_redirects=True,
-            )
-            self._owns_client = True
+            if self._settings.shared_http_client:
+                self._client = self._get_shared_client()
+                self._owns_client = False
+            else:
+                self._client = self._build_http_client()
+                self._owns_client = True
         return self._client
 
+    def _build_http_client(self) -> httpx.AsyncClient:
+        """Create an HTTP client with the configured pool limits."""
+        settings = self._settings
+        # Keep enough idle connections alive that concurrent endpoint calls
+        # reuse TLS sessions instead of handshaking again; with HTTP/2 they
+        # multiplex over a single connection. Requests are bounded by one
+        # asyncio.timeout() in request() rather than httpx's per-read timers.
+        return httpx.AsyncClient(
+            timeout=None,
+            follow_redirects=settings.follow_redirects,
+            http2=settings.http2 and _HTTP2_AVAILABLE,
+            limits=httpx.Limits(
+                max_connections=settings.max_connections,
+                max_keepalive_connections=settings.max_keepalive_connections,
+                keepalive_expiry=settings.keepalive_expiry,
+            ),
+        )
+
+    def _get_shared_client(self) -> httpx.AsyncClient:
+        """Get the process-wide HTTP client for this event loop and pool config."""
+        settings = self._settings
+        key = (
+            asyncio.get_running_loop(),
+            settings.follow_redirects,
+            settings.http2,
+            settings.max_connections,
+            settings.max_keepalive_connections,
+            settings.keepalive_expiry,
+        )
+        client = _SHARED_CLIENTS.get(key)
+        if client is None or client.is_closed:
+            # Forget clients whose event loop has since been closed
+            for stale in [k for k in _SHARED_CLIENTS if k[0].is_closed()]:
+                del _SHARED_CLIENTS[stale]
+            client = _SHARED_CLIENTS[key] = self._build_http_client()
+        return client
+
     async def close(self) -> None:
         """Close the HTTP client and cache connections."""
-        if self._client is not None and self._owns_client:
-            await self._client.aclose()
+        if self._economic is not None:
+            # A background refresh finishing later would reopen both
+            await self._economic.close()
+            self._economic = None
+
+        if self._client is not None:
+            # A shared client stays open for the other instances using it
+            if self._owns_client:
+                await self._client.aclose()
             self._client = None
 
         if self._cache is not None:
             await self._cache.close()
             self._cache = None
 
+    def _prepared_get(self, client: httpx.AsyncClient, url: str) -> httpx.Request:
+        """Get the built GET request for a URL, building it on first use.
+
+        A bodiless request can be sent any number of times, so one instance
+        serves every poll of the URL.
+
+        Args:
+            client: HTTP client to build the request with
+            url: Absolute request URL, query included
+
+        Returns:
+            The request, ready for ``client.send()``
+        """
+        prepared = self._prepared_gets
+        request = prepared.get(url)
+        if request is None:
+            request = prepared[url] = client.build_request("GET", url)
+            if len(prepared) > _PREPARED_GETS_MAX:
+                prepared.popitem(last=False)
+        else:
+            prepared.move_to_end(url)
+        return request
+
     def _build_url(self, endpoint: str) -> str:
         """Build full URL for an API endpoint.
 
         The GuruFocus API uses the token in the URL path:
         https://api.gurufocus.com/public/user/{token}/stock/{symbol}/summary
         """
-        # Remove leading slash if present
-        endpoint = endpoint.lstrip("/")
-        return f"{self._base_url}/{self._api_token}/{endpoint}"
+        return self._url_prefix + endpoint.lstrip("/")
 
     def _build_v2_url(self, endpoint: str) -> str:
         """Build full URL for a V2 API endpoint.
@@ -449,18 +684,12 @@ class GuruFocusClient:
         The GuruFocus V2 API uses a different path structure:
         https://api.gurufocus.com/public/v2/{token}/portfolios
         """
-        # Remove leading slash if present
-        endpoint = endpoint.lstrip("/")
-        # Extract base without /user suffix
-        base = self._base_url.replace("/user", "")
-        return f"{base}/v2/{self._api_token}/{endpoint}"
+        return self._v2_url_prefix + endpoint.lstrip("/")
 
     def _extract_symbol_from_endpoint(self, endpoint: str) -> str | None:
         """Extract stock symbol from endpoint path if present."""
-        parts = endpoint.lstrip("/").split("/")
-        if len(parts) >= 2 and parts[0] == "stock":
-            return parts[1].upper()
-        return None
+        match = _STOCK_SYMBOL_RE.match(endpoint)
+        return match.group(1).upper() if match else None
 
     async def request(
         self,
@@ -470,6 +699,7 @@ class GuruFocusClient:
         json_data: dict[str, Any] | None = None,
         *,
         api_version: Literal["v1", "v2"] = "v1",
+        idempotent: bool | None = None,
     ) -> Any:
         """Make an HTTP request to the GuruFocus API.
 
@@ -479,6 +709,9 @@ class GuruFocusClient:
             params: Query parameters
             json_data: JSON body data for POST requests
             api_version: API version to use ("v1" or "v2")
+            idempotent: Whether the request is safe to retry after a failure.
+                Defaults to True for GET and False otherwise; a
+                non-idempotent request is attempted once.
 
         Returns:
             Parsed JSON response data
@@ -491,162 +724,240 @@ class GuruFocusClient:
             APIError: Other API errors
             NetworkError: Network connectivity issues
         """
+        # Encode the query once, in a stable key order; it is reused for the
+        # in-flight key and every retry of the request
+        query = (
+            str(httpx.QueryParams({name: params[name] for name in sorted(params)}))
+            if params
+            else ""
+        )
+
+        if idempotent is None:
+            idempotent = method == "GET"
+        attempts = self._total_attempts if idempotent else 1
+
+        if method != "GET":
+            return await self._send_request(
+                method, endpoint, query, json_data, api_version, attempts
+            )
+
+        # Concurrent identical GETs share one request. GET is idempotent, so
+        # every caller gets the same result as if it had sent its own.
+        return await self._in_flight.do(
+            (api_version, endpoint, query),
+            partial(self._send_request, method, endpoint, query, json_data, api_version, attempts),
+        )
+
+    async def _send_request(
+        self,
+        method: str,
+        endpoint: str,
+        query: str,
+        json_data: dict[str, Any] | None,
+        api_version: Literal["v1", "v2"],
+        attempts: int,
+    ) -> Any:
+        """Send a request with rate limiting, retries, logging and tracing.
+
+        Args:
+            method: HTTP method (GET, POST, etc.)
+            endpoint: API endpoint path
+            query: Encoded query string, or "" for none
+            json_data: JSON body data for POST requests
+            api_version: API version to use ("v1" or "v2")
+            attempts: Maximum number of attempts, 1 to disable retries
+
+        Returns:
+            Parsed JSON response data
+        """
         client = await self._ensure_client()
         url = self._build_v2_url(endpoint) if api_version == "v2" else self._build_url(endpoint)
+        if query:
+            url = f"{url}?{query}"
 
-        request_id = str(uuid.uuid4())[:8]
+        request_id = f"{_REQUEST_ID_PREFIX}{next(_REQUEST_IDS):04x}"
         symbol = self._extract_symbol_from_endpoint(endpoint)
-        start_time = time.perf_counter()
-
-        # Set up span attributes for OpenTelemetry
-        span_attributes = {
-            "http.method": method,
-            "http.url": endpoint,
-            "gurufocus.request_id": request_id,
-        }
-        if symbol:
-            span_attributes["gurufocus.symbol"] = symbol
-
-        bind_contextvars(
+        timed = _OTEL_AVAILABLE or _info_enabled()
+        start_time = time.perf_counter() if timed else 0.0
+
+        # Set up span attributes for OpenTelemetry; the no-op span ignores them
+        span_attributes: dict[str, Any] | None = None
+        if _OTEL_AVAILABLE:
+            span_attributes = {
+                "http.method": method,
+                "http.url": endpoint,
+                "gurufocus.request_id": request_id,
+            }
+            if symbol:
+                span_attributes["gurufocus.symbol"] = symbol
+
+        # Bind a local logger rather than contextvars, so the caller's
+        # logging context is neither mutated nor cleared
+        log = logger.bind(
             request_id=request_id,
             endpoint=endpoint,
             symbol=symbol,
             method=method,
         )
 
+        # Build the request once, outside the retry loop
+        if method == "GET" and json_data is None:
+            http_request = self._prepared_get(client, url)
+        elif json_data is not None and _ORJSON_AVAILABLE:
+            http_request = client.build_request(
+                method, url, content=orjson.dumps(json_data), headers=_JSON_HEADERS
+            )
+        else:
+            http_request = client.build_request(method, url, json=json_data)
+
         last_exception: Exception | None = None
+        delay = self._retry_delay
 
+        # span is only set when OpenTelemetry is installed, so the span
+        # branches below can use Status/StatusCode without checking for them
         with _create_span(f"gurufocus.{method} {endpoint}", span_attributes) as span:
-            try:
-                for attempt in range(self._max_retries + 1):
-                    try:
-                        # Acquire rate limit token before making request
-                        await self.rate_limiter.acquire_or_raise()
-
-                        logger.debug(
+            rate_limiter = self.rate_limiter
+            last_attempt = attempts - 1
+            for attempt in range(attempts):
+                try:
+                    # Acquire rate limit token before making request; only
+                    # await when no token is immediately available
+                    if not rate_limiter.try_acquire_nowait():
+                        await rate_limiter.acquire_or_raise()
+
+                    if _debug_enabled():
+                        log.debug(
                             "api_request_attempt",
                             attempt=attempt + 1,
-                            max_attempts=self._max_retries + 1,
+                            max_attempts=attempts,
                         )
 
-                        response = await client.request(
-                            method=method,
-                            url=url,
-                            params=params,
-                            json=json_data,
-                        )
+                    async with asyncio.timeout(self._timeout):
+                        response = await client.send(http_request)
 
-                        duration_ms = (time.perf_counter() - start_time) * 1000
+                    if timed:
+                        duration_ms = round((time.perf_counter() - start_time) * 1000, 2)
 
                         # Set span attributes for successful response
                         if span is not None:
                             span.set_attribute("http.status_code", response.status_code)
-                            span.set_attribute("gurufocus.duration_ms", round(duration_ms, 2))
-                            if _OTEL_AVAILABLE and Status is not None:
-                                span.set_status(Status(StatusCode.OK))
+                            span.set_attribute("gurufocus.duration_ms", duration_ms)
+                            span.set_status(Status(StatusCode.OK))
 
-                        logger.info(
+                        log.info(
                             "api_request_success",
                             status_code=response.status_code,
-                            duration_ms=round(duration_ms, 2),
-                        )
-
-                        result = self._handle_response(response, endpoint)
-
-                        # Track successful API consumption
-                        if self._usage_tracker is not None:
-                            await self._usage_tracker.decrement()
-
-                        return result
-
-                    except httpx.TimeoutException as e:
-                        last_exception = NetworkError(f"Request timed out: {e}")
-                        logger.warning(
-                            "api_request_timeout",
-                            attempt=attempt + 1,
-                            error=str(e),
+                            duration_ms=duration_ms,
                         )
 
-                    except httpx.NetworkError as e:
-                        last_exception = NetworkError(f"Network error: {e}")
-                        logger.warning(
-                            "api_request_network_error",
-                            attempt=attempt + 1,
-                            error=str(e),
-                        )
-
-                    except RateLimitError as e:
-                        last_exception = e
+                    result = self._handle_response(response, endpoint, symbol)
+
+                    # Track successful API consumption
+                    if self._usage_tracker is not None:
+                        self._usage_tracker.decrement_nowait()
+
+                    return result
+
+                except (httpx.TimeoutException, TimeoutError) as e:
+                    error = str(e) or f"no response within {self._timeout}s"
+                    last_exception = NetworkError(f"Request timed out: {error}")
+                    log.warning(
+                        "api_request_timeout",
+                        attempt=attempt + 1,
+                        error=error,
+                    )
+
+                except httpx.NetworkError as e:
+                    last_exception = NetworkError(f"Network error: {e}")
+                    log.warning(
+                        "api_request_network_error",
+                        attempt=attempt + 1,
+                        error=str(e),
+                    )
+
+                except RateLimitError as e:
+                    last_exception = e
+                    log.warning(
+                        "api_request_rate_limited",
+                        retry_after=e.retry_after,
+                    )
+                    # Retry once the server's Retry-After has passed when it
+                    # fits within the backoff cap; longer waits (and the local
+                    # daily limit) are left to the caller
+                    if (
+                        e.retry_after is not None
+                        and e.retry_after <= self._retry_delay_cap
+                        and attempt < last_attempt
+                    ):
+                        if _debug_enabled():
+                            log.debug("api_request_retry_wait", delay_seconds=e.retry_after)
+                        await asyncio.sleep(e.retry_after)
+                        continue
+                    if span is not None:
+                        span.set_attribute("http.status_code", 429)
+                        span.record_exception(e)
+                        span.set_status(Status(StatusCode.ERROR, "Rate limited"))
+                    raise
+
+                except (AuthenticationError, InvalidSymbolError, NotFoundError) as e:
+                    if span is not None:
+                        span.record_exception(e)
+                        span.set_status(Status(StatusCode.ERROR, str(e)))
+                    raise
+
+                except APIError as e:
+                    last_exception = e
+                    if e.status_code and e.status_code < 500:
                         if span is not None:
-                            span.set_attribute("http.status_code", 429)
+                            span.set_attribute("http.status_code", e.status_code)
                             span.record_exception(e)
-                            if _OTEL_AVAILABLE and Status is not None:
-                                span.set_status(Status(StatusCode.ERROR, "Rate limited"))
-                        logger.warning(
-                            "api_request_rate_limited",
-                            retry_after=e.retry_after,
-                        )
+                            span.set_status(Status(StatusCode.ERROR, str(e)))
                         raise
-
-                    except (AuthenticationError, InvalidSymbolError, NotFoundError) as e:
-                        if span is not None:
-                            span.record_exception(e)
-                            if _OTEL_AVAILABLE and Status is not None:
-                                span.set_status(Status(StatusCode.ERROR, str(e)))
-                        raise
-
-                    except APIError as e:
-                        last_exception = e
-                        if e.status_code and e.status_code < 500:
-                            if span is not None:
-                                span.set_attribute("http.status_code", e.status_code)
-                                span.record_exception(e)
-                                if _OTEL_AVAILABLE and Status is not None:
-                                    span.set_status(Status(StatusCode.ERROR, str(e)))
-                            raise
-                        logger.warning(
-                            "api_request_server_error",
-                            attempt=attempt + 1,
-                            status_code=e.status_code,
-                            error=str(e),
-                        )
-
-                    # Exponential backoff before retry
-                    if attempt < self._max_retries:
-                        delay = self._retry_delay * (2**attempt)
-                        logger.debug("api_request_retry_wait", delay_seconds=delay)
-                        await asyncio.sleep(delay)
-
-                # All retries exhausted
-                duration_ms = (time.perf_counter() - start_time) * 1000
-
-                if span is not None:
-                    span.set_attribute("gurufocus.duration_ms", round(duration_ms, 2))
-                    span.set_attribute("gurufocus.retry_count", self._max_retries + 1)
-                    if last_exception:
-                        span.record_exception(last_exception)
-                    if _OTEL_AVAILABLE and Status is not None:
-                        span.set_status(Status(StatusCode.ERROR, "All retries exhausted"))
-
-                logger.error(
-                    "api_request_failed",
-                    duration_ms=round(duration_ms, 2),
-                    total_attempts=self._max_retries + 1,
-                    error=str(last_exception),
-                )
-
+                    log.warning(
+                        "api_request_server_error",
+                        attempt=attempt + 1,
+                        status_code=e.status_code,
+                        error=str(e),
+                    )
+
+                # Exponential backoff with decorrelated jitter, so clients
+                # that failed together don't all retry in lockstep
+                if attempt < last_attempt:
+                    delay = min(self._retry_delay_cap, random.uniform(self._retry_delay, delay * 3))
+                    if _debug_enabled():
+                        log.debug("api_request_retry_wait", delay_seconds=delay)
+                    await asyncio.sleep(delay)
+
+            # All retries exhausted
+            failed_ms = round((time.perf_counter() - start_time) * 1000, 2) if timed else None
+
+            if span is not None:
+                span.set_attribute("gurufocus.duration_ms", failed_ms)
+                span.set_attribute("gurufocus.retry_count", attempts)
                 if last_exception:
-                    raise last_exception
-                raise NetworkError("Request failed after all retries")
-            finally:
-                clear_contextvars()
+                    span.record_exception(last_exception)
+                span.set_status(Status(StatusCode.ERROR, "All retries exhausted"))
+
+            log.error(
+                "api_request_failed",
+                duration_ms=failed_ms,
+                total_attempts=attempts,
+                error=str(last_exception),
+            )
+
+            if last_exception:
+                raise last_exception
+            raise NetworkError("Request failed after all retries")
 
-    def _handle_response(self, response: httpx.Response, endpoint: str) -> Any:
+    def _handle_response(
+        self, response: httpx.Response, endpoint: str, symbol: str | None = None
+    ) -> Any:
         """Handle API response and raise appropriate exceptions.
 
         Args:
             response: HTTP response object
             endpoint: Original endpoint for error context
+            symbol: Stock symbol parsed from the endpoint, if any
 
         Returns:
             Parsed JSON response data
@@ -654,58 +965,67 @@ class GuruFocusClient:
         Raises:
             Appropriate exception based on response status
         """
-        # Check for rate limiting
-        if response.status_code == 429:
-            retry_after = response.headers.get("Retry-After")
-            raise RateLimitError(
-                message="API rate limit exceeded",
-                retry_after=int(retry_after) if retry_after else None,
-            )
-
-        # Check for authentication errors
-        if response.status_code == 401:
-            raise AuthenticationError("Invalid or missing API token")
-
-        if response.status_code == 403:
-            raise AuthenticationError("Access forbidden - check API token permissions")
-
-        # Check for not found
-        if response.status_code == 404:
-            # Try to determine if it's an invalid symbol
-            # Handle both "stock/SYMBOL/..." and "/stock/SYMBOL/..."
-            if "stock/" in endpoint:
-                # Extract symbol from endpoint
-                parts = endpoint.lstrip("/").split("/")
-                if len(parts) >= 2 and parts[0] == "stock":
-                    symbol = parts[1]
-                    raise InvalidSymbolError(symbol)
-            raise NotFoundError(f"Resource not found: {endpoint}")
+        # Successful responses skip the error ladder with one comparison
+        if response.status_code >= 300:
+            self._raise_for_status(response, endpoint, symbol)
 
-        # Check for other client errors
-        if response.status_code >= 400 and response.status_code < 500:
+        # Parse JSON response. orjson reads the raw bytes; stdlib json still
+        # handles what orjson rejects (non-UTF-8 bodies, NaN/Infinity)
+        try:
+            if _ORJSON_AVAILABLE:
+                try:
+                    return orjson.loads(response.content)
+                except orjson.JSONDecodeError:
+                    pass
+            return response.json()
+        except ValueError as e:
             raise APIError(
-                message=f"Client error: {response.status_code}",
+                message=f"Invalid JSON response: {e}",
                 status_code=response.status_code,
-                details={"response_text": response.text[:500]},
-            )
+                details={"response_text": _error_preview(response)},
+            ) from e
 
-        # Check for server errors
-        if response.status_code >= 500:
+    def _raise_for_status(
+        self, response: httpx.Response, endpoint: str, symbol: str | None
+    ) -> NoReturn:
+        """Raise the exception matching an error response.
+
+        Args:
+            response: HTTP response with a status code of 300 or above
+            endpoint: Original endpoint for error context
+            symbol: Stock symbol parsed from the endpoint, if any
+
+        Raises:
+            Appropriate exception based on response status
+        """
+        make_error = _STATUS_ERRORS.get(response.status_code)
+        if make_error is not None:
+            raise make_error(response, endpoint, symbol)
+
+        # Redirects only reach here when follow_redirects is off
+        if response.status_code < 400:
             raise APIError(
-                message=f"Server error: {response.status_code}",
+                message=(
+                    f"Unexpected redirect: {response.status_code} to "
+                    f"{response.headers.get('Location', 'unknown location')}"
+                ),
                 status_code=response.status_code,
-                details={"response_text": response.text[:500]},
             )
 
-        # Parse JSON response
-        try:
-            return response.json()
-        except ValueError as e:
+        # Check for other client errors
+        if response.status_code < 500:
             raise APIError(
-                message=f"Invalid JSON response: {e}",
+                message=f"Client error: {response.status_code}",
                 status_code=response.status_code,
-                details={"response_text": response.text[:500]},
-            ) from e
+                details={"response_text": _error_preview(response)},
+            )
+
+        # Server errors
+        raise APIError(
+            message=f"Server error: {response.status_code}",
+            status_code=response.status_code,
+            details={"response_text": _error_preview(response)},
+        )
 
     async def get(
         self,
@@ -728,6 +1048,8 @@ class GuruFocusClient:
         endpoint: str,
         json_data: dict[str, Any] | None = None,
         params: dict[str, Any] | None = None,
+        *,
+        idempotent: bool = False,
     ) -> Any:
         """Make a POST request to the API.
 
@@ -735,11 +1057,15 @@ class GuruFocusClient:
             endpoint: API endpoint path
             json_data: JSON body data
             params: Query parameters
+            idempotent: Set for POSTs that only read data, so failed
+                attempts are retried like a GET
 
         Returns:
             Parsed JSON response data
         """
-        return await self.request("POST", endpoint, params=params, json_data=json_data)
+        return await self.request(
+            "POST", endpoint, params=params, json_data=json_data, idempotent=idempotent
+        )
 
     async def request_v2(
         self,
@@ -747,6 +1073,8 @@ class GuruFocusClient:
         endpoint: str,
         params: dict[str, Any] | None = None,
         json_data: dict[str, Any] | None = None,
+        *,
+        idempotent: bool | None = None,
     ) -> Any:
         """Make an HTTP request to the GuruFocus V2 API.
 
@@ -759,12 +1087,18 @@ class GuruFocusClient:
             endpoint: API endpoint path (e.g., "/portfolios")
             params: Query parameters
             json_data: JSON body data for POST requests
+            idempotent: Whether the request is safe to retry; see request()
 
         Returns:
             Parsed JSON response data
         """
         return await self.request(
-            method, endpoint, params=params, json_data=json_data, api_version="v2"
+            method,
+            endpoint,
+            params=params,
+            json_data=json_data,
+            api_version="v2",
+            idempotent=idempotent,
         )
 
     async def get_v2(
@@ -788,6 +1122,8 @@ class GuruFocusClient:
         endpoint: str,
         json_data: dict[str, Any] | None = None,
         params: dict[str, Any] | None = None,
+        *,
+        idempotent: bool = False,
     ) -> Any:
         """Make a POST request to the V2 API.
 
@@ -795,8 +1131,12 @@ class GuruFocusClient:
             endpoint: API endpoint path
             json_data: JSON body data
             params: Query parameters
+            idempotent: Set for POSTs that only read data, so failed
+                attempts are retried like a GET
 
         Returns:
             Parsed JSON response data
         """
-        return await self.request_v2("POST", endpoint, params=params, json_data=json_data)
+        return await self.request_v2(
+            "POST", endpoint, params=params, json_data=json_data, idempotent=idempotent
+        )
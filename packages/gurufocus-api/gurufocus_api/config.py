@@ -52,7 +52,56 @@ class GuruFocusSettings(BaseSettings):
         default=1.0,
         ge=0.1,
         le=60.0,
-        description="Initial delay between retries in seconds (exponential backoff)",
+        description="Base delay between retries in seconds (jittered exponential backoff)",
+    )
+
+    retry_delay_cap: float = Field(
+        default=30.0,
+        ge=0.1,
+        le=300.0,
+        description="Maximum delay between retries in seconds",
+    )
+
+    http2: bool = Field(
+        default=True,
+        description="Use HTTP/2 when the h2 package is installed (http2 extra)",
+    )
+
+    max_connections: int = Field(
+        default=100,
+        ge=1,
+        le=1000,
+        description="Maximum concurrent HTTP connections",
+    )
+
+    max_keepalive_connections: int = Field(
+        default=20,
+        ge=0,
+        le=1000,
+        description="Maximum idle connections kept open for reuse",
+    )
+
+    keepalive_expiry: float = Field(
+        default=30.0,
+        ge=0.0,
+        le=600.0,
+        description="Seconds an idle connection is kept open for reuse",
+    )
+
+    follow_redirects: bool = Field(
+        default=False,
+        description=(
+            "Follow HTTP redirects; when off, a redirect response raises APIError "
+            "instead of costing a second round trip"
+        ),
+    )
+
+    shared_http_client: bool = Field(
+        default=False,
+        description=(
+            "Share one HTTP connection pool between all clients in the process "
+            "(per event loop) instead of giving each client its own"
+        ),
     )
 
     cache_enabled: bool = Field(
@@ -90,6 +139,11 @@ class GuruFocusSettings(BaseSettings):
         description="Maximum burst size for rate limiting",
     )
 
+    rate_limit_algorithm: Literal["token_bucket", "sliding_window"] = Field(
+        default="token_bucket",
+        description="Rate limiting algorithm (token_bucket or sliding_window)",
+    )
+
     log_level: str = Field(
         default="INFO",
         description="Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)",
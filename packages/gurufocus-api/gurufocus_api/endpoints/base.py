@@ -0,0 +1,66 @@
+"""Base class for endpoints that cache API responses."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from gurufocus_api.cache.config import CacheCategory
+from gurufocus_api.exceptions import NotFoundError
+from gurufocus_api.singleflight import SingleFlight
+
+if TYPE_CHECKING:
+    from gurufocus_api.client import GuruFocusClient
+
+
+class CachedEndpoint:
+    """Base for endpoint groups that fetch through the response cache.
+
+    Concurrent cache misses on the same key share one fetch and write.
+    """
+
+    def __init__(self, client: GuruFocusClient) -> None:
+        """Initialize the endpoint.
+
+        Args:
+            client: The GuruFocusClient instance
+        """
+        self._client = client
+        self._in_flight = SingleFlight()
+
+    async def _fetch(
+        self,
+        category: CacheCategory,
+        cache_key: str,
+        endpoint: str,
+        params: dict[str, Any] | None = None,
+        *,
+        cache_not_found: bool = False,
+    ) -> Any:
+        """Fetch from the API and cache the response.
+
+        Args:
+            category: Cache category for the response
+            cache_key: Cache key within the category
+            endpoint: API endpoint path
+            params: Query parameters
+            cache_not_found: If True, a 404 is remembered with set_miss() so
+                repeated lookups of a bad name or ID don't reach the API
+
+        Returns:
+            Raw API response
+
+        Raises:
+            NotFoundError: If the API returns 404
+        """
+
+        async def fetch() -> Any:
+            try:
+                data = await self._client.get(endpoint, params=params)
+            except NotFoundError:
+                if cache_not_found:
+                    await self._client.cache.set_miss(category, cache_key)
+                raise
+            await self._client.cache.set(category, cache_key, value=data)
+            return data
+
+        return await self._in_flight.do((category, cache_key), fetch)
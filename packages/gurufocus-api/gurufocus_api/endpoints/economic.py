@@ -4,13 +4,23 @@ This module provides access to economic data endpoints:
 - GET /economicindicators - List available economic indicators
 - GET /economicindicators/item/{indicator} - Data for a specific indicator
 - GET /calendar - Financial calendar events
+
+Cached responses are served stale-while-revalidate: once an entry is past
+its TTL but within its category's stale window, it is returned immediately
+and refreshed in the background.
 """
 
 from __future__ import annotations
 
+import asyncio
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any, Literal, cast
+from urllib.parse import quote, quote_plus
+
+import structlog
 
 from gurufocus_api.cache.config import CacheCategory
+from gurufocus_api.endpoints.base import CachedEndpoint
 from gurufocus_api.models.economic import (
     CalendarResponse,
     EconomicIndicatorResponse,
@@ -20,8 +30,31 @@ from gurufocus_api.models.economic import (
 if TYPE_CHECKING:
     from gurufocus_api.client import GuruFocusClient
 
+logger = structlog.stdlib.get_logger(__name__)
+
+
+@lru_cache(maxsize=4096)
+def _indicator_path(indicator: str) -> str:
+    """Build the endpoint path for an indicator, quoting it as one segment.
+
+    Indicator names contain spaces and may contain "/", so the name is fully
+    percent-encoded. Polling reuses a small set of names, so paths are cached.
+    """
+    return f"economicindicators/item/{quote(indicator, safe='')}"
+
 
-class EconomicEndpoint:
+@lru_cache(maxsize=512)
+def _calendar_path(date: str) -> str:
+    """Build the calendar endpoint path with the date query already encoded.
+
+    The unfiltered calendar only takes a date, so its query is baked into the
+    path and the client has no params to encode. Date scans revisit the same
+    dates, so paths are cached.
+    """
+    return f"calendar?date={quote_plus(date)}"
+
+
+class EconomicEndpoint(CachedEndpoint):
     """Endpoints for economic data and financial calendar."""
 
     def __init__(self, client: GuruFocusClient) -> None:
@@ -30,7 +63,55 @@ class EconomicEndpoint:
         Args:
             client: The GuruFocusClient instance
         """
-        self._client = client
+        super().__init__(client)
+        # Background stale-while-revalidate refreshes, held so they aren't
+        # garbage collected before they finish
+        self._refreshes: set[asyncio.Task[None]] = set()
+        self._closed = False
+
+    def _refresh(
+        self,
+        category: CacheCategory,
+        cache_key: str,
+        endpoint: str,
+        params: dict[str, Any] | None = None,
+    ) -> None:
+        """Refresh a stale cache entry in the background.
+
+        The refresh goes through ``_fetch``, so a stale entry read by many
+        callers at once still costs a single API request.
+
+        Args:
+            category: Cache category for the response
+            cache_key: Cache key within the category
+            endpoint: API endpoint path
+            params: Query parameters
+        """
+        if self._closed:
+            return
+
+        async def refresh() -> None:
+            try:
+                await self._fetch(category, cache_key, endpoint, params)
+            except Exception as e:
+                # The caller already has the stale value; the next read retries
+                logger.warning("Background refresh failed for %s:%s: %s", category, cache_key, e)
+
+        task = asyncio.create_task(refresh())
+        self._refreshes.add(task)
+        task.add_done_callback(self._refreshes.discard)
+
+    async def close(self) -> None:
+        """Cancel pending background refreshes and stop starting new ones.
+
+        Called by GuruFocusClient.close(), so no refresh outlives the
+        connections it would fetch and cache through.
+        """
+        self._closed = True
+        refreshes = list(self._refreshes)
+        for task in refreshes:
+            task.cancel()
+        await asyncio.gather(*refreshes, return_exceptions=True)
 
     # --- GET /economicindicators ---
 
@@ -70,12 +151,19 @@ class EconomicEndpoint:
         cache_key = "all"
 
         if not bypass_cache:
-            cached_data = await cache.get(CacheCategory.ECONOMIC_INDICATORS_LIST, cache_key)
+            cached_data, is_stale = await cache.get_with_freshness(
+                CacheCategory.ECONOMIC_INDICATORS_LIST, cache_key
+            )
             if cached_data is not None:
+                if is_stale:
+                    self._refresh(
+                        CacheCategory.ECONOMIC_INDICATORS_LIST, cache_key, "economicindicators"
+                    )
                 return cast(list[str], cached_data)
 
-        data = await self._client.get("economicindicators")
-        await cache.set(CacheCategory.ECONOMIC_INDICATORS_LIST, cache_key, value=data)
+        data = await self._fetch(
+            CacheCategory.ECONOMIC_INDICATORS_LIST, cache_key, "economicindicators"
+        )
         return cast(list[str], data)
 
     # --- GET /economicindicators/item/{indicator} ---
@@ -117,12 +205,23 @@ class EconomicEndpoint:
         cache_key = indicator
 
         if not bypass_cache:
-            cached_data = await cache.get(CacheCategory.ECONOMIC_INDICATOR_ITEM, cache_key)
+            cached_data, is_stale = await cache.get_with_freshness(
+                CacheCategory.ECONOMIC_INDICATOR_ITEM, cache_key
+            )
             if cached_data is not None:
+                if is_stale:
+                    self._refresh(
+                        CacheCategory.ECONOMIC_INDICATOR_ITEM,
+                        cache_key,
+                        _indicator_path(indicator),
+                    )
                 return cast(dict[str, Any], cached_data)
 
-        data = await self._client.get(f"economicindicators/item/{indicator}")
-        await cache.set(CacheCategory.ECONOMIC_INDICATOR_ITEM, cache_key, value=data)
+        data = await self._fetch(
+            CacheCategory.ECONOMIC_INDICATOR_ITEM,
+            cache_key,
+            _indicator_path(indicator),
+        )
         return cast(dict[str, Any], data)
 
     # --- GET /calendar ---
@@ -166,16 +265,17 @@ class EconomicEndpoint:
         """
         cache = self._client.cache
         cache_key = f"{date}:{event_type}"
+        endpoint = _calendar_path(date) if event_type == "all" else "calendar"
+        params = None if event_type == "all" else {"date": date, "type": event_type}
 
         if not bypass_cache:
-            cached_data = await cache.get(CacheCategory.CALENDAR, cache_key)
+            cached_data, is_stale = await cache.get_with_freshness(
+                CacheCategory.CALENDAR, cache_key
+            )
             if cached_data is not None:
+                if is_stale:
+                    self._refresh(CacheCategory.CALENDAR, cache_key, endpoint, params)
                 return cast(dict[str, Any], cached_data)
 
-        params: dict[str, Any] = {"date": date}
-        if event_type != "all":
-            params["type"] = event_type
-
-        data = await self._client.get("calendar", params=params)
-        await cache.set(CacheCategory.CALENDAR, cache_key, value=data)
+        data = await self._fetch(CacheCategory.CALENDAR, cache_key, endpoint, params)
         return cast(dict[str, Any], data)
@@ -7,26 +7,31 @@ This module provides access to ETF data endpoints:
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, cast
+from functools import lru_cache
+from typing import Any, cast
 from urllib.parse import quote
 
+from gurufocus_api.cache import CACHE_MISS
 from gurufocus_api.cache.config import CacheCategory
+from gurufocus_api.endpoints.base import CachedEndpoint
+from gurufocus_api.exceptions import NotFoundError
 from gurufocus_api.models.etf import ETFListResponse, ETFSectorWeightingResponse
+from gurufocus_api.pagination import fetch_pages
 
-if TYPE_CHECKING:
-    from gurufocus_api.client import GuruFocusClient
 
+@lru_cache(maxsize=4096)
+def _sector_weighting_path(etf_name: str) -> str:
+    """Build the sector weighting endpoint path for an ETF.
 
-class ETFsEndpoint:
-    """Endpoints for ETF data."""
+    ETF names contain spaces and punctuation, so the name is fully
+    percent-encoded (spaces -> %20). Callers revisit the same ETFs, so
+    paths are cached.
+    """
+    return f"etf/{quote(etf_name, safe='')}/sector_weighting"
 
-    def __init__(self, client: GuruFocusClient) -> None:
-        """Initialize the ETFsEndpoint.
 
-        Args:
-            client: The GuruFocusClient instance
-        """
-        self._client = client
+class ETFsEndpoint(CachedEndpoint):
+    """Endpoints for ETF data."""
 
     # --- GET /etf/etf_list ---
 
@@ -81,8 +86,9 @@ class ETFsEndpoint:
         if per_page != 50:
             params["per_page"] = per_page
 
-        data = await self._client.get("etf/etf_list", params=params if params else None)
-        await cache.set(CacheCategory.ETF_LIST, cache_key, value=data)
+        data = await self._fetch(
+            CacheCategory.ETF_LIST, cache_key, "etf/etf_list", params if params else None
+        )
         return cast(dict[str, Any], data)
 
     # --- GET /etf/{ETF}/sector_weighting ---
@@ -131,15 +137,66 @@ class ETFsEndpoint:
         cache = self._client.cache
         cache_key = f"sector:{etf_name}"
 
+        endpoint = _sector_weighting_path(etf_name)
+
         if not bypass_cache:
             cached_data = await cache.get(CacheCategory.ETF_SECTOR_WEIGHTING, cache_key)
+            if cached_data is CACHE_MISS:
+                raise NotFoundError(f"Resource not found: {endpoint}")
             if cached_data is not None:
                 return cast(dict[str, Any], cached_data)
 
-        # URL-encode the ETF name (spaces -> %20)
-        encoded_name = quote(etf_name, safe="")
-        endpoint = f"etf/{encoded_name}/sector_weighting"
-
-        data = await self._client.get(endpoint)
-        await cache.set(CacheCategory.ETF_SECTOR_WEIGHTING, cache_key, value=data)
+        data = await self._fetch(
+            CacheCategory.ETF_SECTOR_WEIGHTING, cache_key, endpoint, cache_not_found=True
+        )
         return cast(dict[str, Any], data)
+
+    async def get_etf_list_all(
+        self,
+        per_page: int = 50,
+        *,
+        max_concurrency: int = 8,
+        bypass_cache: bool = False,
+    ) -> list[ETFListResponse]:
+        """Get every page of the ETF list.
+
+        Args:
+            per_page: Items per page (default: 50)
+            max_concurrency: Most pages requested at once
+            bypass_cache: If True, skip cache lookup
+
+        Returns:
+            One ETFListResponse per page, in page order
+        """
+        pages = await self.get_etf_list_all_raw(
+            per_page, max_concurrency=max_concurrency, bypass_cache=bypass_cache
+        )
+        return [ETFListResponse.from_api_response(page) for page in pages]
+
+    async def get_etf_list_all_raw(
+        self,
+        per_page: int = 50,
+        *,
+        max_concurrency: int = 8,
+        bypass_cache: bool = False,
+    ) -> list[dict[str, Any]]:
+        """Get every page of the raw ETF list.
+
+        Reads page 1 for the page count, then fetches the remaining pages
+        concurrently.
+
+        Args:
+            per_page: Items per page (default: 50)
+            max_concurrency: Most pages requested at once
+            bypass_cache: If True, skip cache lookup
+
+        Returns:
+            Raw API response dicts, one per page, in page order
+        """
+        first = await self.get_etf_list_raw(1, per_page, bypass_cache=bypass_cache)
+        rest = await fetch_pages(
+            lambda page: self.get_etf_list_raw(page, per_page, bypass_cache=bypass_cache),
+            int(first.get("last_page", 1)),
+            max_concurrency=max_concurrency,
+        )
+        return [first, *rest]
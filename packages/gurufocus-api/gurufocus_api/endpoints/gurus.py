@@ -9,31 +9,24 @@ This module provides access to guru-related endpoints:
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, cast
+from typing import Any, cast
 
+from gurufocus_api.cache import CACHE_MISS
 from gurufocus_api.cache.config import CacheCategory
+from gurufocus_api.endpoints.base import CachedEndpoint
+from gurufocus_api.exceptions import NotFoundError
 from gurufocus_api.models.gurus import (
     GuruAggregatedPortfolio,
     GuruListResponse,
     GuruPicksResponse,
     GuruRealtimePicksResponse,
 )
+from gurufocus_api.pagination import fetch_pages
 
-if TYPE_CHECKING:
-    from gurufocus_api.client import GuruFocusClient
 
-
-class GurusEndpoint:
+class GurusEndpoint(CachedEndpoint):
     """Endpoints for guru/institutional investor data."""
 
-    def __init__(self, client: GuruFocusClient) -> None:
-        """Initialize the GurusEndpoint.
-
-        Args:
-            client: The GuruFocusClient instance
-        """
-        self._client = client
-
     # --- GET /gurulist ---
 
     async def get_gurulist(
@@ -76,8 +69,7 @@ class GurusEndpoint:
             if cached_data is not None:
                 return cast(dict[str, Any], cached_data)
 
-        data = await self._client.get("gurulist")
-        await cache.set(CacheCategory.GURU_LIST, cache_key, value=data)
+        data = await self._fetch(CacheCategory.GURU_LIST, cache_key, "gurulist")
         return cast(dict[str, Any], data)
 
     # --- GET /guru/{id}/picks/{start_date}/{page} ---
@@ -126,14 +118,18 @@ class GurusEndpoint:
         guru_id = str(guru_id).strip()
         cache = self._client.cache
         cache_key = f"{guru_id}:{start_date}:{page}"
+        endpoint = f"guru/{guru_id}/picks/{start_date}/{page}"
 
         if not bypass_cache:
             cached_data = await cache.get(CacheCategory.GURU_PICKS, cache_key)
+            if cached_data is CACHE_MISS:
+                raise NotFoundError(f"Resource not found: {endpoint}")
             if cached_data is not None:
                 return cast(dict[str, Any], cached_data)
 
-        data = await self._client.get(f"guru/{guru_id}/picks/{start_date}/{page}")
-        await cache.set(CacheCategory.GURU_PICKS, cache_key, value=data)
+        data = await self._fetch(
+            CacheCategory.GURU_PICKS, cache_key, endpoint, cache_not_found=True
+        )
         return cast(dict[str, Any], data)
 
     # --- GET /guru/{id}/aggregated ---
@@ -182,8 +178,9 @@ class GurusEndpoint:
             if cached_data is not None:
                 return cast(dict[str, Any], cached_data)
 
-        data = await self._client.get(f"guru/{guru_id}/aggregated")
-        await cache.set(CacheCategory.GURU_AGGREGATED, cache_key, value=data)
+        data = await self._fetch(
+            CacheCategory.GURU_AGGREGATED, cache_key, f"guru/{guru_id}/aggregated"
+        )
         return cast(dict[str, Any], data)
 
     # --- GET /guru_realtime_picks ---
@@ -232,6 +229,53 @@ class GurusEndpoint:
                 return cast(dict[str, Any], cached_data)
 
         params = {"page": page} if page > 1 else {}
-        data = await self._client.get("guru_realtime_picks", params=params)
-        await cache.set(CacheCategory.GURU_REALTIME_PICKS, cache_key, value=data)
+        data = await self._fetch(
+            CacheCategory.GURU_REALTIME_PICKS, cache_key, "guru_realtime_picks", params
+        )
         return cast(dict[str, Any], data)
+
+    async def get_realtime_picks_all(
+        self,
+        *,
+        max_concurrency: int = 8,
+        bypass_cache: bool = False,
+    ) -> list[GuruRealtimePicksResponse]:
+        """Get every page of real-time guru trading activity.
+
+        Args:
+            max_concurrency: Most pages requested at once
+            bypass_cache: If True, skip cache lookup
+
+        Returns:
+            One GuruRealtimePicksResponse per page, in page order
+        """
+        pages = await self.get_realtime_picks_all_raw(
+            max_concurrency=max_concurrency, bypass_cache=bypass_cache
+        )
+        return [GuruRealtimePicksResponse.from_api_response(page) for page in pages]
+
+    async def get_realtime_picks_all_raw(
+        self,
+        *,
+        max_concurrency: int = 8,
+        bypass_cache: bool = False,
+    ) -> list[dict[str, Any]]:
+        """Get every page of raw real-time guru trading activity.
+
+        Reads page 1 for the page count, then fetches the remaining pages
+        concurrently.
+
+        Args:
+            max_concurrency: Most pages requested at once
+            bypass_cache: If True, skip cache lookup
+
+        Returns:
+            Raw API response dicts, one per page, in page order
+        """
+        first = await self.get_realtime_picks_raw(1, bypass_cache=bypass_cache)
+        rest = await fetch_pages(
+            lambda page: self.get_realtime_picks_raw(page, bypass_cache=bypass_cache),
+            int(first.get("lastPage", 1)),
+            max_concurrency=max_concurrency,
+        )
+        return [first, *rest]
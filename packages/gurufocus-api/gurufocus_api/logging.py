@@ -7,8 +7,11 @@ trace context injection when available.
 
 from __future__ import annotations
 
+import importlib.util
 import logging
 import sys
+from collections.abc import Callable
+from functools import partial
 from typing import TYPE_CHECKING, Any, Literal
 
 import structlog
@@ -16,14 +19,13 @@ import structlog
 if TYPE_CHECKING:
     from .config import GuruFocusSettings
 
-# Check if OpenTelemetry is available
-_OTEL_AVAILABLE = False
+# Check if OpenTelemetry is available without importing it, which takes
+# tens of milliseconds that callers not tracing shouldn't pay at import.
+# find_spec() raises when the parent opentelemetry package is missing.
 try:
-    from opentelemetry import trace
-
-    _OTEL_AVAILABLE = True
+    _OTEL_AVAILABLE = importlib.util.find_spec("opentelemetry.trace") is not None
 except ImportError:
-    trace = None  # type: ignore[assignment]
+    _OTEL_AVAILABLE = False
 
 
 def _add_otel_context(
@@ -36,7 +38,10 @@ def _add_otel_context(
     Injects trace_id and span_id from the current OpenTelemetry context
     if available. This enables log correlation with distributed traces.
     """
-    if not _OTEL_AVAILABLE or trace is None:
+    # No span can be current until something has imported OpenTelemetry,
+    # so look it up rather than importing it just to find none
+    trace = sys.modules.get("opentelemetry.trace")
+    if trace is None:
         return event_dict
 
     span = trace.get_current_span()
@@ -146,6 +151,39 @@ def get_logger(name: str | None = None) -> structlog.stdlib.BoundLogger:
     return structlog.stdlib.get_logger(name)
 
 
+def level_enabled(name: str, level: int) -> Callable[[], bool]:
+    """Build a check for whether a structlog logger emits events at a level.
+
+    Hot paths test it before logging, so output that would be dropped
+    skips building the event dict and structlog's processor chain. The
+    check follows structlog's configuration as it stands at call time:
+    loggers configured with ``structlog.stdlib.BoundLogger`` (as
+    configure_logging() does) defer to the stdlib logger's level, filtering
+    loggers use their own level, and unconfigured structlog prints
+    everything.
+
+    Args:
+        name: Logger name (typically __name__)
+        level: stdlib logging level, e.g. logging.DEBUG
+
+    Returns:
+        Function returning True if events at the level are emitted
+    """
+    stdlib_enabled = partial(logging.getLogger(name).isEnabledFor, level)
+
+    def enabled() -> bool:
+        if not structlog.is_configured():
+            return True
+        wrapper_class = structlog.get_config()["wrapper_class"]
+        if issubclass(wrapper_class, structlog.stdlib.BoundLogger):
+            # stdlib caches the result until levels change
+            return stdlib_enabled()
+        is_enabled_for = getattr(wrapper_class, "is_enabled_for", None)
+        return is_enabled_for is None or bool(is_enabled_for(None, level))
+
+    return enabled
+
+
 def is_otel_available() -> bool:
     """Check if OpenTelemetry is available.
 
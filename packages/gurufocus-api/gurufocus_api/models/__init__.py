@@ -50,6 +50,7 @@ from .gurus import (
     GuruList,
     GuruListItem,
     GuruListResponse,
+    GuruListRow,
     GuruPickItem,
     GuruPicks,
     GuruPicksResponse,
@@ -245,6 +246,7 @@ __all__ = [
     "GuruList",
     "GuruListItem",
     "GuruListResponse",
+    "GuruListRow",
     "GuruPickItem",
     "GuruPicks",
     "GuruPicksResponse",
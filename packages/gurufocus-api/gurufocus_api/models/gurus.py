@@ -1,6 +1,7 @@
 """Pydantic models for guru/institutional investor data."""
 
-from typing import Any
+from collections.abc import Iterator
+from typing import Any, NamedTuple
 
 from pydantic import BaseModel, Field
 
@@ -127,6 +128,26 @@ class GuruListItem(BaseModel):
     fund_ticker: str | None = Field(default=None, description="Fund ticker if applicable")
 
 
+class GuruListRow(NamedTuple):
+    """A guru list entry as a plain tuple, without model validation.
+
+    Has the same fields and values as GuruListItem; yielded by
+    GuruListResponse.iter_gurus() for code that only reads the list.
+    """
+
+    guru_id: str
+    name: str
+    image_url: str | None
+    firm: str | None
+    num_stocks: int | None
+    equity: float | None
+    turnover: int | None
+    last_updated: str | None
+    cik: str | None
+    portfolio_date: str | None
+    fund_ticker: str | None
+
+
 class GuruListResponse(BaseModel):
     """Response from GET /gurulist endpoint.
 
@@ -160,25 +181,59 @@ class GuruListResponse(BaseModel):
             total_count=len(us_gurus) + len(plus_gurus),
         )
 
+    @staticmethod
+    def iter_gurus(data: dict[str, Any], *, plus: bool = False) -> Iterator[GuruListRow]:
+        """Yield guru list entries from a raw API response as GuruListRow tuples.
+
+        Skips building a GuruListItem per guru, which dominates the cost of
+        from_api_response() on the full list, for callers that just scan
+        or filter it.
+
+        Args:
+            data: Raw JSON response, as returned by get_gurulist_raw()
+            plus: Yield the GuruFocus Plus gurus instead of the US gurus
+
+        Yields:
+            One GuruListRow per guru, in API order
+
+        Example:
+            data = await client.gurus.get_gurulist_raw()
+            ciks = {row.cik for row in GuruListResponse.iter_gurus(data)}
+        """
+        items = data.get("all", {}).get("plus" if plus else "us", [])
+        for item in items:
+            if isinstance(item, list):
+                yield _parse_guru_list_row(item)
+
 
 def _parse_guru_list_item(item: list[Any]) -> GuruListItem:
-    """Parse a guru list item from array format.
+    """Parse a guru list item from array format."""
+    return GuruListItem(**_guru_list_fields(item))
+
+
+def _parse_guru_list_row(item: list[Any]) -> GuruListRow:
+    """Parse a guru list row from array format."""
+    return GuruListRow(**_guru_list_fields(item))
+
+
+def _guru_list_fields(item: list[Any]) -> dict[str, Any]:
+    """Convert a guru list array to GuruListItem/GuruListRow field values.
 
     Array format: [id, name, image, firm, num_stocks, equity, turnover, last_update, cik, port_date, fund_ticker]
     """
-    return GuruListItem(
-        guru_id=str(item[0]) if len(item) > 0 else "",
-        name=str(item[1]) if len(item) > 1 and item[1] else "",
-        image_url=item[2] if len(item) > 2 and item[2] else None,
-        firm=item[3] if len(item) > 3 and item[3] else None,
-        num_stocks=int(item[4]) if len(item) > 4 and item[4] else None,
-        equity=float(item[5]) if len(item) > 5 and item[5] else None,
-        turnover=int(item[6]) if len(item) > 6 and item[6] else None,
-        last_updated=item[7] if len(item) > 7 and item[7] else None,
-        cik=item[8] if len(item) > 8 and item[8] else None,
-        portfolio_date=item[9] if len(item) > 9 and item[9] else None,
-        fund_ticker=item[10] if len(item) > 10 and item[10] else None,
-    )
+    return {
+        "guru_id": str(item[0]) if len(item) > 0 else "",
+        "name": str(item[1]) if len(item) > 1 and item[1] else "",
+        "image_url": item[2] if len(item) > 2 and item[2] else None,
+        "firm": item[3] if len(item) > 3 and item[3] else None,
+        "num_stocks": int(item[4]) if len(item) > 4 and item[4] else None,
+        "equity": float(item[5]) if len(item) > 5 and item[5] else None,
+        "turnover": int(item[6]) if len(item) > 6 and item[6] else None,
+        "last_updated": item[7] if len(item) > 7 and item[7] else None,
+        "cik": item[8] if len(item) > 8 and item[8] else None,
+        "portfolio_date": item[9] if len(item) > 9 and item[9] else None,
+        "fund_ticker": item[10] if len(item) > 10 and item[10] else None,
+    }
 
 
 # --- Models for GET /guru/{id}/aggregated endpoint ---
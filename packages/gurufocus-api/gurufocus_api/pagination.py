@@ -0,0 +1,51 @@
+"""Concurrent fetching of paginated endpoints.
+
+Paginated endpoints report their last page in the first page's response,
+so once page 1 is in hand the remaining pages don't depend on each other.
+`fetch_pages` requests them concurrently, a bounded number at a time,
+instead of one round trip after another.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from typing import TypeVar
+
+T = TypeVar("T")
+
+
+async def fetch_pages(
+    fetch_page: Callable[[int], Awaitable[T]],
+    last_page: int,
+    *,
+    first_page: int = 2,
+    max_concurrency: int = 8,
+) -> list[T]:
+    """Fetch a range of pages concurrently.
+
+    Args:
+        fetch_page: Fetches one page by number
+        last_page: Last page to fetch (inclusive)
+        first_page: First page to fetch; defaults to 2, for callers that
+            already read page 1 to learn the page count
+        max_concurrency: Most pages requested at once, so a long listing
+            doesn't open a connection per page
+
+    Returns:
+        Pages in page order; empty if first_page is past last_page
+
+    Raises:
+        ValueError: If max_concurrency is less than 1
+        Exception: Whatever fetching a page raised
+    """
+    if max_concurrency < 1:
+        raise ValueError("max_concurrency must be at least 1")
+
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def fetch(page: int) -> T:
+        async with semaphore:
+            return await fetch_page(page)
+
+    return await asyncio.gather(*(fetch(page) for page in range(first_page, last_page + 1)))
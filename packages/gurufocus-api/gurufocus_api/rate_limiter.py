@@ -2,7 +2,8 @@
 
 Implements a token bucket algorithm to prevent exceeding API rate limits.
 The token bucket allows bursts of requests while maintaining a sustainable
-average rate.
+average rate. A sliding-window limiter is available as an alternative that
+never allows more than ``requests_per_minute`` requests in any 60 seconds.
 
 GuruFocus API Rate Limits (approximate):
 - Free: 100 requests/day, 10 requests/minute
@@ -12,6 +13,7 @@ GuruFocus API Rate Limits (approximate):
 
 import asyncio
 import time
+from collections import deque
 from dataclasses import dataclass
 from typing import Any
 
@@ -74,8 +76,10 @@ class RateLimiter:
         self._daily_count = 0
         self._daily_reset_time = time.time()
 
-        # Lock for thread safety
-        self._lock = asyncio.Lock()
+        # Callers sleeping in acquire() until a token frees up. The check and
+        # take run synchronously between awaits, so they need no lock; the
+        # count only lets try_acquire_nowait() defer to callers already waiting
+        self._waiters = 0
 
     @property
     def config(self) -> RateLimitConfig:
@@ -113,6 +117,10 @@ class RateLimiter:
         # Add tokens up to burst size
         self._tokens = min(self._config.burst_size, self._tokens + tokens_to_add)
 
+    def _take_token(self) -> None:
+        """Consume one token for a request that is about to be made."""
+        self._tokens -= 1.0
+
     def _check_daily_reset(self) -> None:
         """Reset daily counter if a new day has started."""
         now = time.time()
@@ -157,6 +165,32 @@ class RateLimiter:
 
         return tokens_needed / tokens_per_second
 
+    def try_acquire_nowait(self) -> bool:
+        """Acquire a token only if one is available right now.
+
+        Runs synchronously, so the check and the decrement can't be
+        interleaved with another coroutine and the caller never yields to
+        the event loop. Returns False while other callers are waiting in
+        `acquire()` so they keep their place in line.
+
+        Returns:
+            True if a token was acquired
+        """
+        if self._waiters:
+            return False
+
+        self._refill_tokens()
+        self._check_daily_reset()
+
+        if self._config.requests_per_day > 0 and self._daily_count >= self._config.requests_per_day:
+            return False
+        if self._tokens < 1.0:
+            return False
+
+        self._take_token()
+        self._daily_count += 1
+        return True
+
     async def acquire(self, timeout: float | None = None) -> bool:
         """Acquire a token, waiting if necessary.
 
@@ -169,50 +203,55 @@ class RateLimiter:
         Raises:
             RateLimitExceeded: If daily limit is exceeded (no waiting possible)
         """
-        async with self._lock:
-            start_time = time.monotonic()
-
-            while True:
-                self._refill_tokens()
-                self._check_daily_reset()
-
-                # Check daily limit first
-                if (
-                    self._config.requests_per_day > 0
-                    and self._daily_count >= self._config.requests_per_day
-                ):
-                    logger.warning(
-                        "Daily rate limit exceeded: %d/%d",
-                        self._daily_count,
-                        self._config.requests_per_day,
-                    )
+        start_time = time.monotonic()
+
+        while True:
+            self._refill_tokens()
+            self._check_daily_reset()
+
+            # Check daily limit first
+            if (
+                self._config.requests_per_day > 0
+                and self._daily_count >= self._config.requests_per_day
+            ):
+                logger.warning(
+                    "Daily rate limit exceeded: %d/%d",
+                    self._daily_count,
+                    self._config.requests_per_day,
+                )
+                return False
+
+            # Check if we have tokens
+            if self._tokens >= 1.0:
+                self._take_token()
+                self._daily_count += 1
+                logger.debug(
+                    "Token acquired. Remaining: %.1f, Daily: %d",
+                    self._tokens,
+                    self._daily_count,
+                )
+                return True
+
+            # Calculate wait time
+            wait_time = self.time_until_available()
+
+            # Check timeout
+            if timeout is not None:
+                elapsed = time.monotonic() - start_time
+                remaining_timeout = timeout - elapsed
+                if remaining_timeout <= 0:
+                    logger.debug("Rate limit acquire timeout")
                     return False
+                wait_time = min(wait_time, remaining_timeout)
 
-                # Check if we have tokens
-                if self._tokens >= 1.0:
-                    self._tokens -= 1.0
-                    self._daily_count += 1
-                    logger.debug(
-                        "Token acquired. Remaining: %.1f, Daily: %d",
-                        self._tokens,
-                        self._daily_count,
-                    )
-                    return True
-
-                # Calculate wait time
-                wait_time = self.time_until_available()
-
-                # Check timeout
-                if timeout is not None:
-                    elapsed = time.monotonic() - start_time
-                    remaining_timeout = timeout - elapsed
-                    if remaining_timeout <= 0:
-                        logger.debug("Rate limit acquire timeout")
-                        return False
-                    wait_time = min(wait_time, remaining_timeout)
-
-                logger.debug("Rate limited, waiting %.2f seconds", wait_time)
+            # Sleep without blocking other waiters, so every caller wakes
+            # as soon as its token could be free rather than one at a time
+            logger.debug("Rate limited, waiting %.2f seconds", wait_time)
+            self._waiters += 1
+            try:
                 await asyncio.sleep(wait_time)
+            finally:
+                self._waiters -= 1
 
     async def acquire_or_raise(self, timeout: float | None = None) -> None:
         """Acquire a token or raise an exception.
@@ -268,6 +307,75 @@ class RateLimiter:
         }
 
 
+class SlidingWindowRateLimiter(RateLimiter):
+    """Sliding-window rate limiter for API requests.
+
+    Records the time of each request in the last 60 seconds and allows a
+    new one only while fewer than ``requests_per_minute`` are recorded.
+    Unlike the token bucket there is no burst allowance on top of the
+    per-minute rate, so the limit holds over every 60-second window.
+    ``burst_size`` is ignored.
+
+    Example:
+        limiter = SlidingWindowRateLimiter(RateLimitConfig(requests_per_minute=10))
+        await limiter.acquire()
+    """
+
+    WINDOW_SECONDS = 60.0
+
+    def __init__(self, config: RateLimitConfig | None = None) -> None:
+        """Initialize the rate limiter.
+
+        Args:
+            config: Rate limit configuration. Uses defaults if not provided.
+        """
+        super().__init__(config)
+        self._limit = max(1, int(self._config.requests_per_minute))
+        self._timestamps: deque[float] = deque()
+        self._tokens = float(self._limit)
+
+    def _refill_tokens(self) -> None:
+        """Drop requests that have left the window and update free slots."""
+        cutoff = time.monotonic() - self.WINDOW_SECONDS
+        timestamps = self._timestamps
+        while timestamps and timestamps[0] <= cutoff:
+            timestamps.popleft()
+        self._tokens = float(self._limit - len(timestamps))
+
+    def _take_token(self) -> None:
+        """Record a request in the window."""
+        self._timestamps.append(time.monotonic())
+        self._tokens -= 1.0
+
+    def time_until_available(self) -> float:
+        """Calculate time until the oldest request leaves the window.
+
+        Returns:
+            Seconds until a request slot is available (0 if available now)
+        """
+        self._refill_tokens()
+        if self._tokens >= 1.0:
+            return 0.0
+        return max(0.0, self._timestamps[0] + self.WINDOW_SECONDS - time.monotonic())
+
+    def reset(self) -> None:
+        """Reset the rate limiter state."""
+        super().reset()
+        self._timestamps.clear()
+        self._tokens = float(self._limit)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get rate limiter statistics.
+
+        Returns:
+            Dictionary with current state and configuration
+        """
+        stats = super().get_stats()
+        stats["window_requests"] = len(self._timestamps)
+        stats["window_limit"] = self._limit
+        return stats
+
+
 class NullRateLimiter(RateLimiter):
     """A rate limiter that doesn't limit anything.
 
@@ -286,6 +394,10 @@ class NullRateLimiter(RateLimiter):
         """Always returns 0."""
         return 0.0
 
+    def try_acquire_nowait(self) -> bool:
+        """Always returns True."""
+        return True
+
     async def acquire(self, timeout: float | None = None) -> bool:
         """Always returns True immediately."""
         return True
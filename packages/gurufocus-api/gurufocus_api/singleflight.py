@@ -0,0 +1,83 @@
+"""Coalescing of concurrent identical async calls.
+
+When several coroutines ask for the same thing at once (for example the
+same stock summary after a cache miss), only the first needs to do the
+work; the rest can wait for its result. `SingleFlight` runs one call per
+key at a time and hands its result, or its exception, to every caller.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable
+from dataclasses import dataclass
+from functools import partial
+from typing import Any, TypeVar, cast
+
+T = TypeVar("T")
+
+
+@dataclass(slots=True)
+class _Call:
+    """A call running on behalf of one or more callers."""
+
+    task: asyncio.Future[Any]
+    waiters: int = 0
+
+
+class SingleFlight:
+    """Share one in-progress call between concurrent callers with the same key.
+
+    The call runs as its own task, so cancelling one caller doesn't cancel it
+    for the others; it is cancelled only once every caller waiting on it has
+    been cancelled. Keys are forgotten as soon as the call finishes, so later
+    callers start a fresh call.
+
+    Example:
+        flight = SingleFlight()
+        data = await flight.do(("summary", "AAPL"), lambda: fetch_summary("AAPL"))
+    """
+
+    def __init__(self) -> None:
+        """Initialize with no calls in flight."""
+        self._calls: dict[Hashable, _Call] = {}
+
+    def __len__(self) -> int:
+        """Return the number of calls in flight."""
+        return len(self._calls)
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """Run ``fn()`` for ``key``, or wait for the call already running.
+
+        Args:
+            key: Identifies calls that would produce the same result
+            fn: Starts the call; only invoked when none is in flight for key
+
+        Returns:
+            The result of the shared call
+
+        Raises:
+            Exception: Whatever the shared call raised
+        """
+        call = self._calls.get(key)
+        if call is None:
+            task = asyncio.ensure_future(fn())
+            call = self._calls[key] = _Call(task)
+            task.add_done_callback(partial(self._done, key, call))
+
+        call.waiters += 1
+        try:
+            return cast(T, await asyncio.shield(call.task))
+        finally:
+            call.waiters -= 1
+            # The last caller was cancelled; nobody is left for the result
+            if call.waiters == 0 and not call.task.done():
+                call.task.cancel()
+
+    def _done(self, key: Hashable, call: _Call, task: asyncio.Future[Any]) -> None:
+        """Forget a finished call."""
+        if self._calls.get(key) is call:
+            del self._calls[key]
+        # Mark the exception retrieved; callers that awaited it have raised it
+        if not task.cancelled():
+            task.exception()
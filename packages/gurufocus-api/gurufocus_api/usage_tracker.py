@@ -7,17 +7,20 @@ making unnecessary API requests to check quota.
 from __future__ import annotations
 
 import asyncio
+import logging
 import time
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any
 
-from .logging import get_logger
+from .logging import get_logger, level_enabled
 
 if TYPE_CHECKING:
     from .cache.manager import CacheManager
 
 logger = get_logger(__name__)
 
+_debug_enabled = level_enabled(__name__, logging.DEBUG)
+
 
 @dataclass
 class UsageTrackerConfig:
@@ -109,22 +112,31 @@ class APIUsageTracker:
         except Exception as e:
             logger.warning("usage_tracker_init_error", error=str(e))
 
-    async def decrement(self) -> None:
-        """Decrement local counter after successful API call.
+    def decrement_nowait(self) -> None:
+        """Decrement local counter after successful API call without awaiting.
 
-        This should be called after each successful API request.
-        Thread-safe via asyncio.Lock.
+        The increment has no await point, so it can't interleave with other
+        coroutines on the event loop and needs no lock. The count is held in
+        memory only; nothing is written until the next `sync()`.
         """
         if not self._config.enabled:
             return
 
-        async with self._lock:
-            self._local_consumed += 1
+        self._local_consumed += 1
+        if _debug_enabled():
             logger.debug(
                 "usage_tracker_decrement",
                 local_consumed=self._local_consumed,
             )
 
+    async def decrement(self) -> None:
+        """Decrement local counter after successful API call.
+
+        This should be called after each successful API request.
+        Async wrapper around `decrement_nowait()`.
+        """
+        self.decrement_nowait()
+
     async def get_remaining(self) -> int | None:
         """Get estimated remaining API calls.
 
@@ -249,6 +261,10 @@ class NullUsageTracker(APIUsageTracker):
         """No-op initialize."""
         pass
 
+    def decrement_nowait(self) -> None:
+        """No-op decrement."""
+        pass
+
     async def decrement(self) -> None:
         """No-op decrement."""
         pass
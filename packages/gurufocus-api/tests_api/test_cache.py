@@ -1,16 +1,45 @@
 """Tests for caching infrastructure."""
 
+import logging
+import pickle
 import tempfile
-from collections.abc import Generator
-from contextlib import suppress
+import threading
+import time
+from collections.abc import AsyncGenerator, AsyncIterator
+from datetime import date
 from pathlib import Path
+from typing import Any
 
+import diskcache
 import pytest
 import respx
+import structlog
 from httpx import Response
+from structlog.testing import capture_logs
 
+import gurufocus_api.cache.disk as disk_module
 from gurufocus_api import GuruFocusClient
-from gurufocus_api.cache import CacheCategory, CacheManager, DiskCacheBackend, get_cache_config
+from gurufocus_api.cache import (
+    CACHE_MISS,
+    CacheBackend,
+    CacheCategory,
+    CacheManager,
+    CacheTier,
+    DiskCacheBackend,
+    get_cache_config,
+)
+from gurufocus_api.cache.base import DELETE_BATCH_SIZE, compile_glob
+from gurufocus_api.cache.config import (
+    _CACHE_CONFIGS,
+    build_cache_key,
+    categories_for_tier,
+    get_stale_ttl_seconds,
+    get_ttl_seconds,
+    invalidates_on_earnings,
+    symbol_key_patterns,
+)
+from gurufocus_api.cache.disk import _GLOB_SELECT_SQL
+from gurufocus_api.cache.manager import NullCacheManager
 
 
 class TestCacheConfig:
@@ -33,6 +62,204 @@ class TestCacheConfig:
         # Profile should have longer TTL (static data)
         assert profile_config.ttl.days >= 30
 
+    def test_category_is_its_value(self) -> None:
+        """Test categories hash and compare as their string values."""
+        assert CacheCategory.SUMMARY == "summary"
+        assert hash(CacheCategory.SUMMARY) == hash("summary")
+        assert CacheCategory("summary") is CacheCategory.SUMMARY
+
+    def test_build_cache_key(self) -> None:
+        """Test cache keys join the category and parts with colons."""
+        assert build_cache_key(CacheCategory.SUMMARY) == "summary"
+        assert build_cache_key(CacheCategory.SUMMARY, "AAPL") == "summary:AAPL"
+        assert (
+            build_cache_key(CacheCategory.FINANCIALS, "AAPL", "annual") == "financials:AAPL:annual"
+        )
+        assert type(build_cache_key(CacheCategory.SUMMARY)) is str
+
+    def test_ttl_seconds_matches_config(self) -> None:
+        """Test precomputed TTL seconds agree with each category's config."""
+        for category in CacheCategory:
+            config = get_cache_config(category)
+            assert get_ttl_seconds(category) == config.ttl_seconds
+            assert get_stale_ttl_seconds(category) == config.stale_ttl_seconds
+            assert config.ttl.total_seconds() == config.ttl_seconds
+
+    def test_categories_for_tier(self) -> None:
+        """Test tier grouping agrees with each category's config."""
+        for tier in CacheTier:
+            categories = categories_for_tier(tier)
+            assert categories
+            assert all(get_cache_config(c).tier is tier for c in categories)
+        assert sum(len(categories_for_tier(t)) for t in CacheTier) == len(CacheCategory)
+
+    def test_symbol_key_patterns(self) -> None:
+        """Test symbol patterns are anchored at a category prefix."""
+        patterns = symbol_key_patterns("AAPL")
+        assert len(patterns) == len(CacheCategory)
+        assert "summary:AAPL*" in patterns
+        assert "news_feed:symbol:AAPL*" in patterns
+        assert not any(p.startswith("*") for p in patterns)
+
+    def test_invalidates_on_earnings(self) -> None:
+        """Test earnings invalidation lookup agrees with each category's config."""
+        assert invalidates_on_earnings(CacheCategory.FINANCIALS)
+        assert not invalidates_on_earnings(CacheCategory.QUOTE)
+        for category in CacheCategory:
+            config = get_cache_config(category)
+            assert invalidates_on_earnings(category) is config.invalidate_on_earnings
+
+    def test_every_category_has_config(self) -> None:
+        """Test the config table covers exactly the declared categories."""
+        assert set(_CACHE_CONFIGS) == set(CacheCategory)
+
+    def test_single_config_module(self) -> None:
+        """Test the package re-exports the one canonical cache config module."""
+        import gurufocus_api.cache as cache_pkg
+        import gurufocus_api.cache.config as cache_config
+
+        assert cache_pkg.CacheCategory is cache_config.CacheCategory
+        assert cache_pkg.get_cache_config is cache_config.get_cache_config
+
+    def test_cache_configs_are_read_only(self) -> None:
+        """Test the config table and its entries cannot be mutated."""
+        config = get_cache_config(CacheCategory.SUMMARY)
+        with pytest.raises(TypeError):
+            _CACHE_CONFIGS[CacheCategory.SUMMARY] = config  # type: ignore[index]
+        assert not hasattr(config, "__dict__")
+
+
+class InMemoryBackend(CacheBackend):
+    """Minimal backend implementing only the abstract methods."""
+
+    def __init__(self) -> None:
+        self.data: dict[str, Any] = {}
+        self.get_calls = 0
+
+    async def get(self, key: str) -> Any | None:
+        self.get_calls += 1
+        return self.data.get(key)
+
+    async def set(self, key: str, value: Any, ttl_seconds: int | None = None) -> None:
+        self.data[key] = value
+
+    async def delete(self, key: str) -> bool:
+        return self.data.pop(key, None) is not None
+
+    async def clear(self) -> None:
+        self.data.clear()
+
+
+class TestCacheBackendDefaults:
+    """Tests for the default implementations on CacheBackend."""
+
+    async def test_get_many_default(self) -> None:
+        """Test default get_many returns only the keys that were found."""
+        backend = InMemoryBackend()
+        await backend.set("key1", "value1")
+        await backend.set("key2", "value2")
+
+        result = await backend.get_many(["key1", "key2", "key3"])
+        assert result == {"key1": "value1", "key2": "value2"}
+        assert backend.get_calls == 3
+
+    async def test_exists_default(self) -> None:
+        """Test default exists is derived from get."""
+        backend = InMemoryBackend()
+        await backend.set("key1", "value1")
+
+        assert await backend.exists("key1")
+        assert not await backend.exists("key2")
+        assert backend.get_calls == 2
+
+    async def test_delete_many_default(self) -> None:
+        """Test default delete_many counts only keys that existed."""
+        backend = InMemoryBackend()
+        await backend.set_many({"key1": "value1", "key2": "value2"})
+
+        deleted = await backend.delete_many(["key1", "key2", "key3"])
+        assert deleted == 2
+        assert backend.data == {}
+
+    async def test_invalidate_category_default(self) -> None:
+        """Test default invalidate_category deletes by category prefix."""
+        backend = ScanningBackend()
+        await backend.set_many({"summary:AAPL": 1, "summary:MSFT": 2, "quote:AAPL": 3})
+
+        assert await backend.invalidate_category("summary") == 2
+        assert backend.data == {"quote:AAPL": 3}
+
+    async def test_delete_pattern_requires_scan(self) -> None:
+        """Test delete_pattern fails loudly when the backend cannot scan keys."""
+        backend = InMemoryBackend()
+        await backend.set("summary:AAPL", "data")
+
+        with pytest.raises(NotImplementedError):
+            await backend.delete_pattern("summary:*")
+
+    async def test_delete_pattern_scans_in_batches(self) -> None:
+        """Test delete_pattern streams scan results through delete_many batches."""
+        backend = ScanningBackend()
+        batches: list[int] = []
+        original_delete_many = backend.delete_many
+
+        async def tracking_delete_many(keys: list[str]) -> int:
+            batches.append(len(keys))
+            return await original_delete_many(keys)
+
+        backend.delete_many = tracking_delete_many  # type: ignore[method-assign]
+        await backend.set_many({f"summary:SYM{i}": i for i in range(DELETE_BATCH_SIZE + 1)})
+        await backend.set("financials:AAPL", "keep")
+
+        deleted = await backend.delete_pattern("summary:*")
+        assert deleted == DELETE_BATCH_SIZE + 1
+        assert batches == [DELETE_BATCH_SIZE, 1]
+        assert backend.data == {"financials:AAPL": "keep"}
+
+    async def test_add_default(self) -> None:
+        """Test default add only stores absent keys."""
+        backend = InMemoryBackend()
+        assert await backend.add("key1", "value1")
+        assert not await backend.add("key1", "value2")
+        assert backend.data == {"key1": "value1"}
+
+    async def test_set_many_default(self) -> None:
+        """Test default set_many stores every item."""
+        backend = InMemoryBackend()
+        await backend.set_many({"key1": "value1", "key2": "value2"})
+        assert backend.data == {"key1": "value1", "key2": "value2"}
+
+    def test_compile_glob_matches_fnmatch(self) -> None:
+        """Test compiled globs keep fnmatch semantics and are reused."""
+        match = compile_glob("*:AAPL*")
+        assert match("summary:AAPL")
+        assert match("financials:AAPL:annual")
+        assert not match("summary:MSFT")
+        assert compile_glob("*:AAPL*") is match
+
+    async def test_context_manager_closes(self) -> None:
+        """Test backends close their shared handle on context exit."""
+        closed: list[bool] = []
+
+        class ClosingBackend(InMemoryBackend):
+            async def close(self) -> None:
+                closed.append(True)
+
+        async with ClosingBackend() as backend:
+            assert isinstance(backend, ClosingBackend)
+            assert not closed
+        assert closed == [True]
+
+
+class ScanningBackend(InMemoryBackend):
+    """In-memory backend that supports incremental key scanning."""
+
+    async def scan_keys(self, pattern: str) -> AsyncIterator[str]:
+        match = compile_glob(pattern)
+        for key in list(self.data):
+            if match(key):
+                yield key
+
 
 class TestDiskCacheBackend:
     """Tests for disk cache backend."""
@@ -44,19 +271,20 @@ class TestDiskCacheBackend:
             yield Path(tmpdir)
 
     @pytest.fixture
-    def cache(self, cache_dir: Path) -> Generator[DiskCacheBackend, None, None]:
+    async def cache(self, cache_dir: Path) -> AsyncGenerator[DiskCacheBackend, None]:
         """Create a disk cache backend."""
         backend = DiskCacheBackend(cache_dir=cache_dir)
         yield backend
-        # Close the cache and clear thread-local storage to prevent ResourceWarnings
-        cache = backend._cache
-        cache.close()
-        # Clear thread-local connection storage
-        if hasattr(cache, "_local"):
-            if hasattr(cache._local, "con"):
-                with suppress(Exception):
-                    cache._local.con.close()
-            cache._local.__dict__.clear()
+        # Closes the connection on the cache thread and stops the thread
+        await backend.close()
+
+    async def test_creates_missing_cache_dir(self, cache_dir: Path) -> None:
+        """Test a missing cache directory is created along with its parents."""
+        nested = cache_dir / "a" / "b"
+        async with DiskCacheBackend(cache_dir=str(nested)) as backend:
+            await backend.set("key", "value")
+            assert backend.cache_dir == nested
+        assert nested.is_dir()
 
     async def test_set_and_get(self, cache: DiskCacheBackend) -> None:
         """Test basic set and get operations."""
@@ -107,6 +335,33 @@ class TestDiskCacheBackend:
         result = await cache.get_many(["key1", "key2", "key3"])
         assert result == {"key1": "value1", "key2": "value2"}
 
+    async def test_set_many(self, cache: DiskCacheBackend) -> None:
+        """Test storing several keys in one transaction keeps them tagged."""
+        await cache.set_many({"summary:AAPL": {"a": 1}, "summary:MSFT": {"m": 2}}, ttl_seconds=60)
+
+        assert await cache.get("summary:AAPL") == {"a": 1}
+        assert await cache.invalidate_category("summary") == 2
+
+    async def test_get_many_batched(self, cache: DiskCacheBackend) -> None:
+        """Test batched reads decode every storage form and skip expired rows."""
+        keys = [f"summary:SYM{i}" for i in range(600)]  # Spans two SELECT batches
+        await cache.set_many({key: {"i": i} for i, key in enumerate(keys)})
+        await cache.set("summary:BIG", "x" * 100_000)  # Spilled to a file
+        await cache.set("summary:NOPE", CACHE_MISS)
+        cache._call(cache._cache.set, "summary:OLD", {"pickled": True})
+        cache._call(lambda: cache._cache.set("summary:GONE", "expired", expire=0.01))
+        time.sleep(0.02)
+
+        result = await cache.get_many(
+            [*keys, "summary:BIG", "summary:NOPE", "summary:OLD", "summary:GONE"]
+        )
+        assert len(result) == 603
+        assert result["summary:SYM599"] == {"i": 599}
+        assert result["summary:BIG"] == "x" * 100_000
+        assert result["summary:NOPE"] is CACHE_MISS
+        assert result["summary:OLD"] == {"pickled": True}
+        assert "summary:GONE" not in result
+
     async def test_delete_pattern(self, cache: DiskCacheBackend) -> None:
         """Test deleting keys by pattern."""
         await cache.set("summary:AAPL", "data1")
@@ -120,6 +375,282 @@ class TestDiskCacheBackend:
         assert not await cache.exists("summary:MSFT")
         assert await cache.exists("financials:AAPL")
 
+    async def test_delete_pattern_uses_key_index(self, cache: DiskCacheBackend) -> None:
+        """Test prefix-anchored pattern deletes are range scans on the key index."""
+        args = ("summary:AAPL*", 0, "", DELETE_BATCH_SIZE)
+        plan = cache._call(
+            lambda: cache._cache._sql("EXPLAIN QUERY PLAN " + _GLOB_SELECT_SQL, args).fetchall()
+        )
+        assert any("Cache_key_raw" in row[-1] for row in plan)
+
+        await cache.set_many({f"summary:SYM{i}": i for i in range(DELETE_BATCH_SIZE + 1)})
+        await cache.set("summary:AAPL", "keep")
+        assert await cache.delete_pattern("summary:SYM*") == DELETE_BATCH_SIZE + 1
+        assert await cache.exists("summary:AAPL")
+
+    async def test_delete_patterns(self, cache: DiskCacheBackend) -> None:
+        """Test several patterns are deleted in one call."""
+        await cache.set_many({"summary:AAPL": 1, "quote:AAPL": 2, "quote:MSFT": 3})
+
+        assert await cache.delete_patterns(["summary:AAPL*", "quote:AAPL*"]) == 2
+        assert await cache.exists("quote:MSFT")
+
+    async def test_delete_pattern_glob_semantics(self, cache: DiskCacheBackend) -> None:
+        """Test pattern deletes keep fnmatch semantics and remove spilled values."""
+        await cache.set("summary:AAPL", "x" * 100_000)  # Large enough to spill to a file
+        await cache.set("financials:AAPL:annual", "data2")
+        await cache.set("summary:MSFT", "data3")
+
+        assert await cache.delete_pattern("*:AAPL*") == 2
+        assert await cache.delete_pattern("summary:[!A]*") == 1
+        assert cache.count == 0
+        assert not any(path.is_file() for path in cache.cache_dir.rglob("*.val"))
+
+    async def test_delete_pattern_scan_fallback(
+        self, cache: DiskCacheBackend, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test pattern deletes still work without diskcache's batched delete."""
+        await cache.set("summary:AAPL", "data1")
+        await cache.set("summary:MSFT", "data2")
+        await cache.set_many({f"quote:SYM{i}": i for i in range(DELETE_BATCH_SIZE + 1)})
+        monkeypatch.delattr(diskcache.Cache, "_select_delete")
+
+        assert await cache.delete_pattern("summary:[!M]*") == 1
+        assert await cache.exists("summary:MSFT")
+        assert await cache.delete_pattern("quote:*") == DELETE_BATCH_SIZE + 1
+
+    async def test_invalidate_category(self, cache: DiskCacheBackend) -> None:
+        """Test deleting a category through the tag index."""
+        await cache.set("summary:AAPL", "data1")
+        await cache.set("summary:MSFT", "data2")
+        await cache.set("financials:AAPL", "data3")
+
+        deleted = await cache.invalidate_category("summary")
+        assert deleted == 2
+
+        assert not await cache.exists("summary:AAPL")
+        assert not await cache.exists("summary:MSFT")
+        assert await cache.exists("financials:AAPL")
+
+    async def test_invalidate_category_tags_existing_entries(self, cache_dir: Path) -> None:
+        """Test entries stored without a tag are tagged when the cache is reopened."""
+        legacy = diskcache.Cache(str(cache_dir))
+        legacy.set("summary:AAPL", "untagged")
+        legacy.close()
+
+        backend = DiskCacheBackend(cache_dir=cache_dir)
+        try:
+            assert await backend.invalidate_category("summary") == 1
+            assert not await backend.exists("summary:AAPL")
+        finally:
+            await backend.close()
+
+    async def test_tag_backfill_runs_once(
+        self, cache_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test the tag backfill is recorded and skipped on later opens."""
+        async with DiskCacheBackend(cache_dir=cache_dir) as backend:
+            version = backend._call(lambda: backend._cache._sql("PRAGMA user_version").fetchone())
+            assert version == (disk_module._TAGGED_USER_VERSION,)
+
+        # A backfill on reopen would now fail and log a warning
+        monkeypatch.setattr(disk_module, "_BACKFILL_TAGS_SQL", "UPDATE missing_table SET x = 1")
+        with capture_logs() as logs:
+            async with DiskCacheBackend(cache_dir=cache_dir) as backend:
+                await backend.set("summary:AAPL", "tagged")
+        assert not [entry for entry in logs if entry["log_level"] == "warning"]
+
+    async def test_delete_many(self, cache: DiskCacheBackend) -> None:
+        """Test deleting several keys at once."""
+        await cache.set("key1", "value1")
+        await cache.set("key2", "value2")
+
+        deleted = await cache.delete_many(["key1", "key2", "key3"])
+        assert deleted == 2
+        assert not await cache.exists("key1")
+        assert not await cache.exists("key2")
+
+    async def test_add(self, cache: DiskCacheBackend) -> None:
+        """Test add is insert-if-absent and treats expired entries as absent."""
+        assert await cache.add("summary:AAPL", {"v": 1})
+        assert not await cache.add("summary:AAPL", {"v": 2})
+        assert await cache.get("summary:AAPL") == {"v": 1}
+
+        await cache.set("summary:OLD", "stale", ttl_seconds=-1)
+        assert await cache.add("summary:OLD", "fresh")
+        assert await cache.get("summary:OLD") == "fresh"
+
+    async def test_delete_many_batches(
+        self, cache: DiskCacheBackend, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test batched deletes count live rows and remove spilled values."""
+        keys = [f"quote:SYM{i}" for i in range(DELETE_BATCH_SIZE + 1)]
+        await cache.set_many(dict.fromkeys(keys, 1))
+        await cache.set("summary:AAPL", "x" * 100_000)  # Large enough to spill to a file
+        await cache.set("summary:OLD", "stale", ttl_seconds=-1)
+
+        assert await cache.delete_many([*keys, "summary:AAPL", "summary:OLD"]) == len(keys) + 1
+        assert not any(path.is_file() for path in cache.cache_dir.rglob("*.val"))
+
+        await cache.set_many({"key1": 1, "key2": 2})
+        monkeypatch.delattr(diskcache.Cache, "_select_delete")
+        assert await cache.delete_many(["key1", "key2", "key3"]) == 2
+
+    async def test_values_stored_as_json(self, cache: DiskCacheBackend) -> None:
+        """Test values are serialized to marked JSON bytes on disk."""
+        await cache.set("summary:AAPL", {"price": 1.5, "tags": ["a"]})
+
+        stored = cache._call(cache._cache.get, "summary:AAPL")
+        assert stored == b'\x00JSON{"price":1.5,"tags":["a"]}'
+        assert await cache.get("summary:AAPL") == {"price": 1.5, "tags": ["a"]}
+
+    async def test_non_json_values_round_trip(self, cache: DiskCacheBackend) -> None:
+        """Test values JSON cannot encode and pre-JSON entries still load."""
+        await cache.set("key1", {1, 2})
+        cache._call(cache._cache.set, "key2", {"pickled": True})
+
+        assert await cache.get("key1") == {1, 2}
+        assert await cache.get("key2") == {"pickled": True}
+
+    async def test_values_keep_their_types(self, cache_dir: Path) -> None:
+        """Test values JSON would change read back with the same types after reopening."""
+        values = {
+            "a": {"t": date(2024, 1, 2)},
+            "b": b"123",
+            "c": (1, 2),
+            "d": {"pair": (1, 2)},
+            "e": {1: "one"},
+            "f": b"\x00JSON{}",
+            "g": "plain",
+        }
+        async with DiskCacheBackend(cache_dir=cache_dir) as backend:
+            await backend.set_many(values)
+
+        async with DiskCacheBackend(cache_dir=cache_dir) as backend:
+            for key, value in values.items():
+                result = await backend.get(key)
+                assert result == value
+                assert type(result) is type(value)
+            assert await backend.get_many(list(values)) == values
+
+    async def test_large_values_compressed(self, cache_dir: Path) -> None:
+        """Test values past the size threshold are stored zstd-compressed."""
+        pytest.importorskip("zstandard")
+        gurus = [{"name": f"Guru {i}", "cik": str(i), "value": i * 1.5} for i in range(2000)]
+
+        async with DiskCacheBackend(cache_dir=cache_dir, l1_size=0) as backend:
+            await backend.set("gurulist:all", {"gurus": gurus})
+            await backend.set("summary:AAPL", {"price": 1.5})
+
+            stored = backend._call(backend._cache.get, "gurulist:all")
+            assert stored.startswith(b"\x00ZSTD")
+            assert len(stored) < len(backend._dumps({"gurus": gurus})) // 4
+            assert await backend.get("gurulist:all") == {"gurus": gurus}
+            assert await backend.get_many(["gurulist:all"]) == {"gurulist:all": {"gurus": gurus}}
+            # Small values stay uncompressed
+            assert backend._call(backend._cache.get, "summary:AAPL") == b'\x00JSON{"price":1.5}'
+
+    async def test_cache_miss_round_trip(self, cache: DiskCacheBackend) -> None:
+        """Test the negative-cache sentinel survives storage by identity."""
+        await cache.set("summary:NOPE", CACHE_MISS, ttl_seconds=60)
+
+        assert await cache.get("summary:NOPE") is CACHE_MISS
+        assert pickle.loads(pickle.dumps(CACHE_MISS)) is CACHE_MISS
+
+    async def test_l1_serves_repeat_reads(self, cache: DiskCacheBackend) -> None:
+        """Test repeat reads come from the in-process LRU, and writes invalidate it."""
+        await cache.set("summary:AAPL", {"v": 1})
+        assert await cache.get("summary:AAPL") == {"v": 1}
+
+        # Change the row behind the backend's back: the L1 still answers
+        cache._call(cache._cache.set, "summary:AAPL", b'\x00JSON{"v":2}')
+        assert await cache.get("summary:AAPL") == {"v": 1}
+        assert await cache.get_many(["summary:AAPL"]) == {"summary:AAPL": {"v": 1}}
+
+        await cache.set("summary:AAPL", {"v": 3})
+        assert await cache.get("summary:AAPL") == {"v": 3}
+        await cache.delete("summary:AAPL")
+        assert await cache.get("summary:AAPL") is None
+
+    async def test_debug_logs_under_default_structlog(self, cache: DiskCacheBackend) -> None:
+        """Test per-key debug events are emitted without configure_logging()."""
+        with capture_logs() as logs:
+            await cache.set("summary:AAPL", {"v": 1})
+            await cache.get("summary:AAPL")
+            await cache.get("summary:NOPE")
+
+        events = [entry["event"] for entry in logs]
+        assert "Cache hit: summary:AAPL" in events
+        assert "Cache miss: summary:NOPE" in events
+
+    async def test_l1_hits_return_fresh_copies(self, cache: DiskCacheBackend) -> None:
+        """Test mutating a returned value doesn't change what later reads get."""
+        await cache.set("summary:AAPL", {"v": 1, "tags": ["a"]})
+
+        first = await cache.get("summary:AAPL")
+        first["v"] = 2
+        first["tags"].append("b")
+        second = await cache.get("summary:AAPL")
+        second["tags"].clear()
+        (many,) = (await cache.get_many(["summary:AAPL"])).values()
+        many["v"] = 3
+        value, _ = await cache.get_with_ttl("summary:AAPL")
+
+        assert value == {"v": 1, "tags": ["a"]}
+        assert await cache.get("summary:AAPL") == {"v": 1, "tags": ["a"]}
+
+    async def test_l1_respects_expiry_and_size(self, cache_dir: Path) -> None:
+        """Test L1 entries expire with the disk entry and are bounded."""
+        backend = DiskCacheBackend(cache_dir=cache_dir, l1_size=2)
+        try:
+            await backend.set("summary:A", "a", ttl_seconds=1)
+            await backend.set_many({"summary:B": "b", "summary:C": "c"})
+            await backend.get_many(["summary:A", "summary:B", "summary:C"])
+            assert list(backend._l1) == ["summary:B", "summary:C"]
+
+            backend._l1["summary:B"] = (time.monotonic() - 1, "b")
+            assert await backend.get("summary:B") == "b"  # Reloaded from disk
+        finally:
+            await backend.close()
+
+    async def test_operations_run_on_cache_thread(self, cache: DiskCacheBackend) -> None:
+        """Test diskcache calls run off the event loop, on one dedicated thread."""
+        names = {await cache._run(lambda: threading.current_thread().name) for _ in range(3)}
+        assert len(names) == 1
+        assert names.pop().startswith("diskcache")
+
+    async def test_operations_do_not_sleep(
+        self, cache: DiskCacheBackend, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test cache ops yield through the executor, not no-op sleeps."""
+
+        async def fail_sleep(delay: float) -> None:
+            raise AssertionError("unexpected asyncio.sleep")
+
+        monkeypatch.setattr("gurufocus_api.cache.disk.asyncio.sleep", fail_sleep)
+        await cache.set("key1", "value1")
+        assert await cache.get("key1") == "value1"
+        assert await cache.exists("key1")
+        assert await cache.delete("key1")
+
+    async def test_reuse_after_close(self, cache: DiskCacheBackend) -> None:
+        """Test a closed backend reopens on the next operation."""
+        await cache.set("key1", "value1")
+        await cache.close()
+        await cache.close()  # Idempotent
+
+        assert await cache.get("key1") == "value1"
+
+    def test_sqlite_settings(self, cache: DiskCacheBackend) -> None:
+        """Test SQLite tuning is applied to the underlying connection."""
+
+        def pragma(statement: str) -> Any:
+            return cache._call(lambda: cache._cache._sql(statement).fetchone()[0])
+
+        assert pragma("PRAGMA journal_mode") == "wal"
+        assert pragma("PRAGMA synchronous") == 1
+        assert pragma("PRAGMA cache_size") == -64_000
+
     def test_get_stats(self, cache: DiskCacheBackend) -> None:
         """Test getting cache statistics."""
         stats = cache.get_stats()
@@ -127,6 +658,22 @@ class TestDiskCacheBackend:
         assert "size_bytes" in stats
         assert "item_count" in stats
 
+    async def test_stats_snapshot_reused_until_write(self, cache: DiskCacheBackend) -> None:
+        """Test size/count reuse one aggregate snapshot until the backend writes."""
+        await cache.set("summary:AAPL", "data")
+        assert cache.count == 1
+
+        # Written behind the backend's back, so the snapshot is not dropped
+        cache._call(cache._cache.set, "summary:MSFT", b"data")
+        assert cache.get_stats()["item_count"] == 1
+
+        await cache.delete("summary:AAPL")
+        assert cache.count == 1
+
+        cache._stats_ttl = 0
+        cache._call(cache._cache.set, "summary:GOOG", b"data")
+        assert cache.count == 2
+
 
 class TestCacheManager:
     """Tests for cache manager."""
@@ -138,20 +685,11 @@ class TestCacheManager:
             yield Path(tmpdir)
 
     @pytest.fixture
-    def manager(self, cache_dir: Path) -> Generator[CacheManager, None, None]:
+    async def manager(self, cache_dir: Path) -> AsyncGenerator[CacheManager, None]:
         """Create a cache manager."""
         mgr = CacheManager(cache_dir=cache_dir, enabled=True)
         yield mgr
-        # Close the cache and clear thread-local storage to prevent ResourceWarnings
-        if mgr._backend is not None and hasattr(mgr._backend, "_cache"):
-            cache = mgr._backend._cache
-            cache.close()
-            # Clear thread-local connection storage
-            if hasattr(cache, "_local"):
-                if hasattr(cache._local, "con"):
-                    with suppress(Exception):
-                        cache._local.con.close()
-                cache._local.__dict__.clear()
+        await mgr.close()
 
     async def test_set_and_get_by_category(self, manager: CacheManager) -> None:
         """Test set/get using cache categories."""
@@ -184,6 +722,23 @@ class TestCacheManager:
         assert result is None
         assert manager.misses == 1
 
+    async def test_get_with_freshness(self, manager: CacheManager) -> None:
+        """Test entries read as stale only within the category's stale window."""
+        await manager.set(CacheCategory.CALENDAR, "fresh", value={"a": 1})
+        await manager.set(CacheCategory.CALENDAR, "stale", value={"b": 2}, ttl_override=60)
+
+        assert await manager.get_with_freshness(CacheCategory.CALENDAR, "fresh") == (
+            {"a": 1},
+            False,
+        )
+        assert await manager.get_with_freshness(CacheCategory.CALENDAR, "stale") == (
+            {"b": 2},
+            True,
+        )
+        assert await manager.get_with_freshness(CacheCategory.CALENDAR, "none") == (None, False)
+        assert manager.hits == 2
+        assert manager.misses == 1
+
     async def test_invalidate_symbol(self, manager: CacheManager) -> None:
         """Test invalidating all data for a symbol."""
         await manager.set(CacheCategory.SUMMARY, "AAPL", value={"type": "summary"})
@@ -198,6 +753,133 @@ class TestCacheManager:
         # MSFT should still exist
         assert await manager.get(CacheCategory.SUMMARY, "MSFT") is not None
 
+    async def test_invalidate_symbol_uses_anchored_patterns(self) -> None:
+        """Test symbol invalidation never issues a leading-wildcard pattern."""
+        backend = ScanningBackend()
+        patterns: list[str] = []
+        original_delete_pattern = backend.delete_pattern
+
+        async def tracking_delete_pattern(pattern: str) -> int:
+            patterns.append(pattern)
+            return await original_delete_pattern(pattern)
+
+        backend.delete_pattern = tracking_delete_pattern  # type: ignore[method-assign]
+        manager = CacheManager(backend=backend)
+        await manager.set(CacheCategory.NEWS_FEED, "symbol:AAPL", value=[1])
+        await manager.set(CacheCategory.PRICE_HISTORY, "AAPL", value=[2])
+        await manager.set(CacheCategory.PRICE_HISTORY, "MSFT", value=[3])
+
+        assert await manager.invalidate_symbol("aapl") == 2
+        assert list(backend.data) == ["price_history:MSFT"]
+        assert patterns and not any(p.startswith("*") for p in patterns)
+
+    async def test_invalidate_category(self, manager: CacheManager) -> None:
+        """Test invalidating all data for a category."""
+        await manager.set(CacheCategory.SUMMARY, "AAPL", value={"type": "summary"})
+        await manager.set(CacheCategory.SUMMARY, "MSFT", value={"type": "summary"})
+        await manager.set(CacheCategory.QUOTE, "AAPL", value={"type": "quote"})
+
+        count = await manager.invalidate_category(CacheCategory.SUMMARY)
+        assert count == 2
+
+        assert await manager.get(CacheCategory.SUMMARY, "AAPL") is None
+        assert await manager.get(CacheCategory.QUOTE, "AAPL") is not None
+
+    async def test_invalidate_earnings_categories(self, manager: CacheManager) -> None:
+        """Test invalidating every earnings-dependent category at once."""
+        await manager.set(CacheCategory.FINANCIALS, "AAPL", value={"type": "financials"})
+        await manager.set(CacheCategory.KEY_RATIOS, "MSFT", value={"type": "key_ratios"})
+        await manager.set(CacheCategory.QUOTE, "AAPL", value={"type": "quote"})
+
+        count = await manager.invalidate_earnings_categories()
+        assert count == 2
+
+        assert await manager.get(CacheCategory.FINANCIALS, "AAPL") is None
+        assert await manager.get(CacheCategory.KEY_RATIOS, "MSFT") is None
+        assert await manager.get(CacheCategory.QUOTE, "AAPL") is not None
+
+    async def test_set_many(self, manager: CacheManager) -> None:
+        """Test storing several symbols of one category at once."""
+        await manager.set_many(CacheCategory.QUOTE, {"AAPL": {"p": 1}, "MSFT": {"p": 2}})
+
+        assert await manager.get(CacheCategory.QUOTE, "AAPL") == {"p": 1}
+        assert await manager.get(CacheCategory.QUOTE, "MSFT") == {"p": 2}
+
+    async def test_set_miss(self, manager: CacheManager) -> None:
+        """Test recording a negative-cache entry."""
+        await manager.set_miss(CacheCategory.SUMMARY, "NOPE")
+
+        assert await manager.get(CacheCategory.SUMMARY, "NOPE") is CACHE_MISS
+        assert await manager.get(CacheCategory.SUMMARY, "AAPL") is None
+
+    async def test_add(self, manager: CacheManager) -> None:
+        """Test add only fills the cache when nothing is stored yet."""
+        assert await manager.add(CacheCategory.SUMMARY, "AAPL", value={"n": 1})
+        assert not await manager.add(CacheCategory.SUMMARY, "AAPL", value={"n": 2})
+        assert await manager.get(CacheCategory.SUMMARY, "AAPL") == {"n": 1}
+        assert not await NullCacheManager().add(CacheCategory.SUMMARY, "AAPL", value={})
+
+    async def test_debug_logs_gated_on_level(
+        self, manager: CacheManager, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test per-key debug logs are skipped when the stdlib level drops them."""
+        import gurufocus_api.cache.manager as manager_module
+
+        messages: list[str] = []
+        monkeypatch.setattr(manager_module.logger, "debug", lambda msg, *args: messages.append(msg))
+        stdlib_logger = logging.getLogger(manager_module.__name__)
+        original_level = stdlib_logger.level
+        # As configure_logging() sets it up: structlog filters through stdlib
+        structlog.configure(wrapper_class=structlog.stdlib.BoundLogger)
+        try:
+            stdlib_logger.setLevel(logging.INFO)
+            await manager.set(CacheCategory.SUMMARY, "AAPL", value={"n": 1})
+            await manager.get(CacheCategory.SUMMARY, "AAPL")
+            assert messages == []
+
+            stdlib_logger.setLevel(logging.DEBUG)
+            await manager.get(CacheCategory.SUMMARY, "AAPL")
+            assert messages == ["Cache hit: %s"]
+        finally:
+            stdlib_logger.setLevel(original_level)
+            structlog.reset_defaults()
+
+    async def test_null_cache_manager(self) -> None:
+        """Test the null manager is a disabled, side-effect-free no-op."""
+        manager = NullCacheManager()
+
+        await manager.set(CacheCategory.SUMMARY, "AAPL", value={"n": 1})
+        assert await manager.get(CacheCategory.SUMMARY, "AAPL") is None
+        assert not await manager.delete(CacheCategory.SUMMARY, "AAPL")
+        assert await manager.invalidate_symbol("AAPL") == 0
+        assert await manager.invalidate_category(CacheCategory.SUMMARY) == 0
+        await manager.clear()
+        await manager.close()
+        assert manager.get_stats() == {"enabled": False, "hits": 0, "misses": 0, "hit_rate": 0.0}
+
+    async def test_falsy_values_are_hits(self, manager: CacheManager) -> None:
+        """Test empty responses are cached hits, not misses."""
+        await manager.set(CacheCategory.INSIDERS, "AAPL", value=[])
+        await manager.set(CacheCategory.GURUS, "AAPL", value={})
+
+        assert await manager.get(CacheCategory.INSIDERS, "AAPL") == []
+        assert await manager.get(CacheCategory.GURUS, "AAPL") == {}
+        assert await manager.get(CacheCategory.GURUS, "MSFT") is None
+        assert (manager.hits, manager.misses) == (2, 1)
+
+    async def test_invalidate_tier(self, manager: CacheManager) -> None:
+        """Test invalidating every category in a tier."""
+        await manager.set(CacheCategory.QUOTE, "AAPL", value={"type": "quote"})
+        await manager.set(CacheCategory.MARKET_DATA, "MSFT", value={"type": "market_data"})
+        await manager.set(CacheCategory.FINANCIALS, "AAPL", value={"type": "financials"})
+
+        count = await manager.invalidate_tier(CacheTier.PRICE_DEPENDENT)
+        assert count == 2
+
+        assert await manager.get(CacheCategory.QUOTE, "AAPL") is None
+        assert await manager.get(CacheCategory.MARKET_DATA, "MSFT") is None
+        assert await manager.get(CacheCategory.FINANCIALS, "AAPL") is not None
+
     async def test_disabled_cache(self, cache_dir: Path) -> None:
         """Test that disabled cache doesn't store anything."""
         manager = CacheManager(cache_dir=cache_dir, enabled=False)
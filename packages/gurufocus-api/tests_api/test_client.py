@@ -0,0 +1,669 @@
+"""Tests for the GuruFocus HTTP client."""
+
+import asyncio
+import json
+import logging
+import math
+import subprocess
+import sys
+
+import pytest
+import respx
+from httpx import Request, Response
+from structlog.contextvars import bind_contextvars, clear_contextvars, get_contextvars
+from structlog.testing import capture_logs
+
+import gurufocus_api.client as client_module
+from gurufocus_api import (
+    APIError,
+    AuthenticationError,
+    GuruFocusClient,
+    InvalidSymbolError,
+    NetworkError,
+    NotFoundError,
+    RateLimitError,
+    close_shared_clients,
+)
+from gurufocus_api.config import GuruFocusSettings
+
+
+class TestConnectionPool:
+    """Tests for HTTP connection pool configuration."""
+
+    async def test_pool_limits_from_settings(self) -> None:
+        """Test the HTTP client is built with the configured pool limits."""
+        settings = GuruFocusSettings(
+            api_token="test-token",
+            max_connections=50,
+            max_keepalive_connections=10,
+            keepalive_expiry=15.0,
+        )
+        client = GuruFocusClient(settings=settings, cache_enabled=False)
+        try:
+            http_client = await client._ensure_client()
+            pool = http_client._transport._pool  # type: ignore[attr-defined]
+            assert pool._max_connections == 50
+            assert pool._max_keepalive_connections == 10
+            assert pool._keepalive_expiry == 15.0
+        finally:
+            await client.close()
+
+    @respx.mock
+    async def test_request_timeout(self) -> None:
+        """Test a request slower than the timeout fails as a NetworkError."""
+
+        async def stalled(request: Request) -> Response:
+            await asyncio.sleep(1)
+            return Response(200, json={})
+
+        respx.get("https://api.gurufocus.com/public/user/tok/gurulist").mock(side_effect=stalled)
+        settings = GuruFocusSettings(api_token="tok", max_retries=0, rate_limit_enabled=False)
+
+        async with GuruFocusClient(settings=settings, timeout=0.01, cache_enabled=False) as client:
+            assert client._client is not None
+            assert client._client.timeout.read is None
+            with pytest.raises(NetworkError, match="timed out"):
+                await client.get("gurulist")
+
+    @pytest.mark.parametrize(("installed", "enabled"), [(True, True), (False, False)])
+    async def test_http2_requires_h2(
+        self, monkeypatch: pytest.MonkeyPatch, installed: bool, enabled: bool
+    ) -> None:
+        """Test HTTP/2 is only requested when the h2 package is available."""
+        captured: dict[str, object] = {}
+
+        class RecordingClient:
+            is_closed = False
+
+            def __init__(self, **kwargs: object) -> None:
+                captured.update(kwargs)
+
+        monkeypatch.setattr(client_module, "_HTTP2_AVAILABLE", installed)
+        monkeypatch.setattr(client_module.httpx, "AsyncClient", RecordingClient)
+
+        client = GuruFocusClient(api_token="test-token", cache_enabled=False)
+        await client._ensure_client()
+        assert captured["http2"] is enabled
+
+        settings = GuruFocusSettings(api_token="test-token", http2=False)
+        client = GuruFocusClient(settings=settings, cache_enabled=False)
+        await client._ensure_client()
+        assert captured["http2"] is False
+
+
+class TestSharedHTTPClient:
+    """Tests for the process-wide shared HTTP client."""
+
+    async def test_clients_share_one_pool(self) -> None:
+        """Test shared-mode clients reuse one HTTP client and leave it open."""
+        settings = GuruFocusSettings(api_token="test-token", shared_http_client=True)
+        first = GuruFocusClient(settings=settings, cache_enabled=False)
+        second = GuruFocusClient(settings=settings, cache_enabled=False)
+        try:
+            http_client = await first._ensure_client()
+            assert await second._ensure_client() is http_client
+
+            await first.close()
+            assert not http_client.is_closed
+            assert await first._ensure_client() is http_client
+        finally:
+            await close_shared_clients()
+        assert http_client.is_closed
+
+    async def test_pool_settings_get_separate_clients(self) -> None:
+        """Test clients with different pool settings don't share a client."""
+        small = GuruFocusSettings(api_token="test-token", shared_http_client=True)
+        large = GuruFocusSettings(
+            api_token="test-token", shared_http_client=True, max_connections=200
+        )
+        try:
+            small_client = await GuruFocusClient(
+                settings=small, cache_enabled=False
+            )._ensure_client()
+            large_client = await GuruFocusClient(
+                settings=large, cache_enabled=False
+            )._ensure_client()
+            assert small_client is not large_client
+        finally:
+            await close_shared_clients()
+
+    async def test_unshared_by_default(self) -> None:
+        """Test each client owns and closes its own HTTP client by default."""
+        client = GuruFocusClient(api_token="test-token", cache_enabled=False)
+        http_client = await client._ensure_client()
+        await client.close()
+        assert http_client.is_closed
+
+
+class TestURLBuilding:
+    """Tests for API URL construction."""
+
+    def test_build_urls(self) -> None:
+        """Test v1 and v2 URLs put the token in the path."""
+        client = GuruFocusClient(api_token="tok", cache_enabled=False)
+
+        assert client._build_url("/stock/AAPL/summary") == (
+            "https://api.gurufocus.com/public/user/tok/stock/AAPL/summary"
+        )
+        assert client._build_url("gurulist") == "https://api.gurufocus.com/public/user/tok/gurulist"
+        assert client._build_v2_url("/portfolios") == (
+            "https://api.gurufocus.com/public/v2/tok/portfolios"
+        )
+
+    def test_build_urls_custom_base(self) -> None:
+        """Test a custom base URL is used for both API versions."""
+        client = GuruFocusClient(
+            api_token="tok", base_url="https://example.com/api/user", cache_enabled=False
+        )
+
+        assert client._build_url("/x") == "https://example.com/api/user/tok/x"
+        assert client._build_v2_url("/x") == "https://example.com/api/v2/tok/x"
+
+
+class TestEndpointSymbol:
+    """Tests for symbol detection in endpoint paths."""
+
+    @pytest.mark.parametrize(
+        ("endpoint", "expected"),
+        [
+            ("stock/aapl/summary", "AAPL"),
+            ("/stock/MSFT/financials", "MSFT"),
+            ("stock/BRK.B", "BRK.B"),
+            ("//stock/msft", "MSFT"),
+            ("stock/", None),
+            ("stocks/AAPL", None),
+            ("gurulist", None),
+        ],
+    )
+    def test_extract_symbol(self, endpoint: str, expected: str | None) -> None:
+        """Test the symbol is taken from stock/SYMBOL/... paths only."""
+        client = GuruFocusClient(api_token="tok", cache_enabled=False)
+        assert client._extract_symbol_from_endpoint(endpoint) == expected
+
+    def test_not_found_uses_parsed_symbol(self) -> None:
+        """Test a 404 raises InvalidSymbolError only when a symbol was parsed."""
+        client = GuruFocusClient(api_token="tok", cache_enabled=False)
+        response = Response(404, text="Not found")
+
+        with pytest.raises(InvalidSymbolError) as exc_info:
+            client._handle_response(response, "stock/XYZ/summary", "XYZ")
+        assert exc_info.value.symbol == "XYZ"
+
+        with pytest.raises(NotFoundError):
+            client._handle_response(response, "guru/1/picks", None)
+
+
+class TestJSONHandling:
+    """Tests for JSON request bodies and response parsing."""
+
+    @pytest.mark.parametrize("orjson_available", [True, False])
+    @respx.mock
+    async def test_post_body_and_response(
+        self, monkeypatch: pytest.MonkeyPatch, orjson_available: bool
+    ) -> None:
+        """Test JSON bodies and responses round-trip with or without orjson."""
+        monkeypatch.setattr(client_module, "_ORJSON_AVAILABLE", orjson_available)
+        route = respx.post("https://api.gurufocus.com/public/user/tok/screener").mock(
+            return_value=Response(200, json={"stocks": [{"symbol": "AAPL"}]})
+        )
+
+        async with GuruFocusClient(
+            api_token="tok", cache_enabled=False, rate_limit_enabled=False
+        ) as client:
+            result = await client.post("screener", json_data={"filters": ["pe < 10"]})
+
+        assert result == {"stocks": [{"symbol": "AAPL"}]}
+        request = route.calls.last.request
+        assert request.headers["content-type"] == "application/json"
+        assert json.loads(request.content) == {"filters": ["pe < 10"]}
+
+    @pytest.mark.parametrize(
+        ("status_code", "error"),
+        [
+            (301, APIError),
+            (401, AuthenticationError),
+            (403, AuthenticationError),
+            (404, NotFoundError),
+            (418, APIError),
+            (429, RateLimitError),
+            (503, APIError),
+        ],
+    )
+    def test_error_statuses(self, status_code: int, error: type[Exception]) -> None:
+        """Test each error status maps to its exception."""
+        client = GuruFocusClient(api_token="tok", cache_enabled=False)
+
+        with pytest.raises(error):
+            client._handle_response(Response(status_code, text="error"), "x", None)
+
+    @respx.mock
+    async def test_get_requests_are_prepared_once(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test repeat GETs reuse one built request, within the LRU bound."""
+        monkeypatch.setattr(client_module, "_PREPARED_GETS_MAX", 2)
+        route = respx.get(url__startswith="https://api.gurufocus.com/public/user/tok/").mock(
+            return_value=Response(200, json={"ok": True})
+        )
+
+        async with GuruFocusClient(
+            api_token="tok", cache_enabled=False, rate_limit_enabled=False
+        ) as client:
+            await client.get("gurulist")
+            prepared = client._prepared_gets["https://api.gurufocus.com/public/user/tok/gurulist"]
+            await client.get("gurulist")
+            assert route.call_count == 2
+            assert list(client._prepared_gets.values()) == [prepared]
+            assert client._prepared_gets[str(prepared.url)] is prepared
+
+            await client.get("a")
+            await client.get("b")
+            assert list(client._prepared_gets) == [
+                "https://api.gurufocus.com/public/user/tok/a",
+                "https://api.gurufocus.com/public/user/tok/b",
+            ]
+
+    def test_error_details_truncate_body(self) -> None:
+        """Test error details keep only the first 500 bytes of the body."""
+        client = GuruFocusClient(api_token="tok", cache_enabled=False)
+        body = "<html>" + "x" * 10_000
+
+        with pytest.raises(APIError) as exc_info:
+            client._handle_response(Response(502, text=body), "x", None)
+
+        assert exc_info.value.details["response_text"] == body[:500]
+
+    @pytest.mark.parametrize("follow", [False, True])
+    @respx.mock
+    async def test_redirects(self, follow: bool) -> None:
+        """Test redirects raise APIError unless follow_redirects is enabled."""
+        respx.get("https://api.gurufocus.com/public/user/tok/old").mock(
+            return_value=Response(
+                301, headers={"Location": "https://api.gurufocus.com/public/user/tok/new"}
+            )
+        )
+        new = respx.get("https://api.gurufocus.com/public/user/tok/new").mock(
+            return_value=Response(200, json={"moved": True})
+        )
+        settings = GuruFocusSettings(
+            api_token="tok", follow_redirects=follow, rate_limit_enabled=False
+        )
+
+        async with GuruFocusClient(settings=settings, cache_enabled=False) as client:
+            if follow:
+                assert await client.get("old") == {"moved": True}
+            else:
+                with pytest.raises(APIError, match="Unexpected redirect: 301") as exc_info:
+                    await client.get("old")
+                assert exc_info.value.status_code == 301
+                assert not new.called
+
+    def test_parse_falls_back_to_stdlib(self) -> None:
+        """Test payloads orjson rejects are still parsed by the stdlib."""
+        client = GuruFocusClient(api_token="tok", cache_enabled=False)
+
+        response = Response(200, content=b'{"pe": NaN}')
+        result = client._handle_response(response, "stock/AAPL/summary", "AAPL")
+        assert math.isnan(result["pe"])
+
+        response = Response(200, content='{"name": "Nestlé"}'.encode("utf-16"))
+        assert client._handle_response(response, "x", None) == {"name": "Nestlé"}
+
+        with pytest.raises(APIError, match="Invalid JSON"):
+            client._handle_response(Response(200, content=b"<html>"), "x", None)
+
+
+class TestInFlightGets:
+    """Tests for sharing concurrent identical GET requests."""
+
+    URL = "https://api.gurufocus.com/public/user/tok/stock/AAPL/summary"
+
+    @staticmethod
+    def _client() -> GuruFocusClient:
+        return GuruFocusClient(api_token="tok", cache_enabled=False, rate_limit_enabled=False)
+
+    @respx.mock
+    async def test_concurrent_gets_share_request(self) -> None:
+        """Test identical concurrent GETs send one request; others send their own."""
+        release = asyncio.Event()
+
+        async def slow_response(request: Request) -> Response:
+            await release.wait()
+            return Response(200, json={"page": request.url.params.get("page")})
+
+        route = respx.get(self.URL).mock(side_effect=slow_response)
+
+        async with self._client() as client:
+            calls = [
+                asyncio.ensure_future(client.get("stock/AAPL/summary", params={"page": 1}))
+                for _ in range(3)
+            ]
+            other = asyncio.ensure_future(client.get("stock/AAPL/summary", params={"page": 2}))
+            await asyncio.sleep(0)
+            release.set()
+
+            assert await asyncio.gather(*calls) == [{"page": "1"}] * 3
+            assert await other == {"page": "2"}
+            assert route.call_count == 2
+            assert len(client._in_flight) == 0
+
+    @respx.mock
+    async def test_query_encoded_once_in_key_order(self) -> None:
+        """Test params are sent sorted with httpx encoding and key order is ignored."""
+        release = asyncio.Event()
+
+        async def slow_response(request: Request) -> Response:
+            await release.wait()
+            return Response(200, json={})
+
+        route = respx.get(url__startswith=self.URL).mock(side_effect=slow_response)
+
+        async with self._client() as client:
+            calls = [
+                asyncio.ensure_future(client.get("stock/AAPL/summary", params=params))
+                for params in (
+                    {"ids": [1, 2], "active": True, "q": "a b"},
+                    {"q": "a b", "active": True, "ids": [1, 2]},
+                )
+            ]
+            await asyncio.sleep(0)
+            release.set()
+            await asyncio.gather(*calls)
+
+        assert route.call_count == 1
+        assert route.calls.last.request.url.query == b"active=true&ids=1&ids=2&q=a+b"
+
+    @respx.mock
+    async def test_cancelled_caller_leaves_request_for_others(self) -> None:
+        """Test cancelling one caller doesn't cancel a request others await."""
+        release = asyncio.Event()
+
+        async def slow_response(request: Request) -> Response:
+            await release.wait()
+            return Response(200, json={"ok": True})
+
+        respx.get(self.URL).mock(side_effect=slow_response)
+
+        async with self._client() as client:
+            first = asyncio.ensure_future(client.get("stock/AAPL/summary"))
+            second = asyncio.ensure_future(client.get("stock/AAPL/summary"))
+            await asyncio.sleep(0)
+
+            first.cancel()
+            await asyncio.sleep(0)
+            release.set()
+
+            assert await second == {"ok": True}
+            assert first.cancelled()
+
+    @respx.mock
+    async def test_last_cancelled_caller_cancels_request(self) -> None:
+        """Test the shared request is cancelled once no caller awaits it."""
+        respx.get(self.URL).mock(side_effect=lambda request: asyncio.Event().wait())
+
+        async with self._client() as client:
+            caller = asyncio.ensure_future(client.get("stock/AAPL/summary"))
+            await asyncio.sleep(0)
+            (in_flight,) = client._in_flight._calls.values()
+
+            caller.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await caller
+            await asyncio.sleep(0)
+
+            assert in_flight.task.cancelled()
+            assert len(client._in_flight) == 0
+
+    @respx.mock
+    async def test_posts_not_shared(self) -> None:
+        """Test concurrent POSTs are each sent."""
+        route = respx.post("https://api.gurufocus.com/public/user/tok/screener").mock(
+            return_value=Response(200, json={})
+        )
+
+        async with self._client() as client:
+            await asyncio.gather(client.post("screener"), client.post("screener"))
+
+        assert route.call_count == 2
+
+
+class TestRequestLogging:
+    """Tests for per-request logging context."""
+
+    @respx.mock
+    async def test_request_preserves_caller_contextvars(self) -> None:
+        """Test a request neither adds to nor clears the caller's log context."""
+        respx.get("https://api.gurufocus.com/public/user/tok/gurulist").mock(
+            return_value=Response(200, json={})
+        )
+        bind_contextvars(job="nightly")
+        try:
+            async with GuruFocusClient(
+                api_token="tok", cache_enabled=False, rate_limit_enabled=False
+            ) as client:
+                await client.get("gurulist")
+            assert get_contextvars() == {"job": "nightly"}
+        finally:
+            clear_contextvars()
+
+    @respx.mock
+    async def test_request_ids_unique(self) -> None:
+        """Test each request logs a distinct request ID."""
+        respx.get("https://api.gurufocus.com/public/user/tok/gurulist").mock(
+            return_value=Response(200, json={})
+        )
+
+        async with GuruFocusClient(
+            api_token="tok", cache_enabled=False, rate_limit_enabled=False
+        ) as client:
+            with capture_logs() as logs:
+                for _ in range(3):
+                    await client.get("gurulist")
+
+        ids = {entry["request_id"] for entry in logs if "request_id" in entry}
+        assert len(ids) == 3
+        assert all(len(request_id) >= 8 for request_id in ids)
+
+    @pytest.mark.parametrize("info_enabled", [True, False])
+    @respx.mock
+    async def test_timing_only_when_logged(
+        self, monkeypatch: pytest.MonkeyPatch, info_enabled: bool
+    ) -> None:
+        """Test request timing and the success log are skipped below INFO."""
+        respx.get("https://api.gurufocus.com/public/user/tok/gurulist").mock(
+            return_value=Response(200, json={})
+        )
+        monkeypatch.setattr(client_module, "_OTEL_AVAILABLE", False)
+        monkeypatch.setattr(client_module, "_info_enabled", lambda: info_enabled)
+
+        async with GuruFocusClient(
+            api_token="tok", cache_enabled=False, rate_limit_enabled=False
+        ) as client:
+            with capture_logs() as logs:
+                await client.get("gurulist")
+
+        success = [entry for entry in logs if entry["event"] == "api_request_success"]
+        if info_enabled:
+            assert len(success) == 1
+            assert success[0]["duration_ms"] >= 0
+        else:
+            assert success == []
+
+    @respx.mock
+    async def test_success_logged_under_default_structlog(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test the success log is emitted without configure_logging()."""
+        respx.get("https://api.gurufocus.com/public/user/tok/gurulist").mock(
+            return_value=Response(200, json={})
+        )
+        monkeypatch.setattr(client_module, "_OTEL_AVAILABLE", False)
+        stdlib_logger = logging.getLogger(client_module.__name__)
+        original_level = stdlib_logger.level
+        stdlib_logger.setLevel(logging.WARNING)
+        try:
+            async with GuruFocusClient(
+                api_token="tok", cache_enabled=False, rate_limit_enabled=False
+            ) as client:
+                with capture_logs() as logs:
+                    await client.get("gurulist")
+        finally:
+            stdlib_logger.setLevel(original_level)
+
+        assert [entry["event"] for entry in logs].count("api_request_success") == 1
+
+    @respx.mock
+    async def test_attempt_debug_logged_under_default_structlog(self) -> None:
+        """Test per-attempt debug events are emitted without configure_logging()."""
+        respx.get("https://api.gurufocus.com/public/user/tok/gurulist").mock(
+            return_value=Response(200, json={})
+        )
+        stdlib_logger = logging.getLogger(client_module.__name__)
+        original_level = stdlib_logger.level
+        stdlib_logger.setLevel(logging.WARNING)
+        try:
+            async with GuruFocusClient(
+                api_token="tok", cache_enabled=False, rate_limit_enabled=False
+            ) as client:
+                with capture_logs() as logs:
+                    await client.get("gurulist")
+        finally:
+            stdlib_logger.setLevel(original_level)
+
+        assert "api_request_attempt" in [entry["event"] for entry in logs]
+
+
+class TestRetryBackoff:
+    """Tests for retry delays."""
+
+    @respx.mock
+    async def test_retry_delays_are_jittered_and_capped(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test retries wait between the base delay and the cap, with jitter."""
+        delays: list[float] = []
+
+        async def fake_sleep(delay: float) -> None:
+            delays.append(delay)
+
+        monkeypatch.setattr(client_module.asyncio, "sleep", fake_sleep)
+        respx.get("https://api.gurufocus.com/public/user/tok/gurulist").mock(
+            return_value=Response(503, json={"error": "unavailable"})
+        )
+        settings = GuruFocusSettings(
+            api_token="tok",
+            max_retries=8,
+            retry_delay=1.0,
+            retry_delay_cap=5.0,
+            rate_limit_enabled=False,
+            usage_tracking_enabled=False,
+        )
+
+        async with GuruFocusClient(settings=settings, cache_enabled=False) as client:
+            with pytest.raises(APIError):
+                await client.get("gurulist")
+
+        assert len(delays) == 8
+        assert all(1.0 <= delay <= 5.0 for delay in delays)
+        assert len(set(delays)) > 1
+
+    @pytest.mark.parametrize(("idempotent", "calls"), [(False, 1), (True, 3)])
+    @respx.mock
+    async def test_post_retries_only_when_idempotent(
+        self, monkeypatch: pytest.MonkeyPatch, idempotent: bool, calls: int
+    ) -> None:
+        """Test a failed POST is attempted once unless marked idempotent."""
+
+        async def fake_sleep(delay: float) -> None:
+            pass
+
+        monkeypatch.setattr(client_module.asyncio, "sleep", fake_sleep)
+        route = respx.post("https://api.gurufocus.com/public/user/tok/screener").mock(
+            return_value=Response(503, json={"error": "unavailable"})
+        )
+        settings = GuruFocusSettings(
+            api_token="tok",
+            max_retries=2,
+            rate_limit_enabled=False,
+            usage_tracking_enabled=False,
+        )
+
+        async with GuruFocusClient(settings=settings, cache_enabled=False) as client:
+            with pytest.raises(APIError):
+                await client.post("screener", idempotent=idempotent)
+
+        assert route.call_count == calls
+
+
+class TestSpans:
+    """Tests for request tracing spans."""
+
+    def test_create_span_bound_at_import(self) -> None:
+        """Test the span factory is chosen once from OpenTelemetry availability."""
+        expected = (
+            client_module._otel_span
+            if client_module._OTEL_AVAILABLE
+            else (client_module._noop_span)
+        )
+        assert client_module._create_span is expected
+
+    def test_imports_without_opentelemetry(self) -> None:
+        """Test the package imports and reports no OpenTelemetry when it is missing."""
+        code = (
+            "import sys; sys.modules['opentelemetry'] = None\n"
+            "import gurufocus_api.client, gurufocus_api.logging\n"
+            "assert not gurufocus_api.client._OTEL_AVAILABLE\n"
+            "assert not gurufocus_api.logging.is_otel_available()\n"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+    @pytest.mark.skipif(not client_module._OTEL_AVAILABLE, reason="OpenTelemetry not installed")
+    def test_tracer_loaded_on_first_span(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test OpenTelemetry is imported by the first span, not at import."""
+        monkeypatch.setattr(client_module, "_tracer", None)
+
+        with client_module._otel_span("gurufocus.GET /x") as span:
+            assert span is not None
+        assert client_module._tracer is not None
+        assert client_module.StatusCode is not None
+
+    def test_noop_span_is_shared(self) -> None:
+        """Test the no-op span reuses one context that yields None."""
+        first = client_module._noop_span("gurufocus.GET /x", {"a": 1})
+        assert client_module._noop_span("gurufocus.GET /y") is first
+
+        with first as span:
+            assert span is None
+        with first as span:
+            assert span is None
+
+    @pytest.mark.parametrize(("retry_after", "retried"), [("2", True), ("3600", False)])
+    @respx.mock
+    async def test_rate_limited_honors_retry_after(
+        self, monkeypatch: pytest.MonkeyPatch, retry_after: str, retried: bool
+    ) -> None:
+        """Test a 429 waits out a short Retry-After and gives up on a long one."""
+        delays: list[float] = []
+
+        async def fake_sleep(delay: float) -> None:
+            delays.append(delay)
+
+        monkeypatch.setattr(client_module.asyncio, "sleep", fake_sleep)
+        route = respx.get("https://api.gurufocus.com/public/user/tok/gurulist").mock(
+            side_effect=[
+                Response(429, headers={"Retry-After": retry_after}),
+                Response(200, json={"ok": True}),
+            ]
+        )
+        settings = GuruFocusSettings(
+            api_token="tok", rate_limit_enabled=False, usage_tracking_enabled=False
+        )
+
+        async with GuruFocusClient(settings=settings, cache_enabled=False) as client:
+            if retried:
+                assert await client.get("gurulist") == {"ok": True}
+                assert delays == [2]
+            else:
+                with pytest.raises(RateLimitError) as exc_info:
+                    await client.get("gurulist")
+                assert exc_info.value.retry_after == 3600
+                assert delays == []
+                assert route.call_count == 1
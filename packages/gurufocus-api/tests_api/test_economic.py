@@ -1,13 +1,16 @@
 """Tests for economic data endpoints (indicators and calendar)."""
 
+import asyncio
 import json
 from pathlib import Path
+from typing import Any
 
 import pytest
 import respx
 from httpx import Response
 
 from gurufocus_api import GuruFocusClient
+from gurufocus_api.cache import CacheCategory
 from gurufocus_api.models.economic import (
     CalendarResponse,
     EconomicIndicatorResponse,
@@ -136,6 +139,103 @@ class TestEconomicIndicatorItemEndpoint:
         assert result["name"] == "Fake US GDP"
         assert "data" in result
 
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_get_indicator_quotes_name(self) -> None:
+        """Test indicator names with slashes are sent as a single path segment."""
+        route = respx.get(
+            "https://api.gurufocus.com/public/user/test-token/economicindicators/item/"
+            "Debt%2FGDP%20Ratio"
+        ).mock(return_value=Response(200, json=INDICATOR_ITEM_DATA))
+
+        async with GuruFocusClient(api_token="test-token", cache_enabled=False) as client:
+            await client.economic.get_indicator_raw("Debt/GDP Ratio")
+
+        assert route.called
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_concurrent_misses_share_fetch(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test concurrent cache misses make one request and one cache write."""
+        route = respx.get(
+            "https://api.gurufocus.com/public/user/test-token/economicindicators/item/US%20GDP"
+        ).mock(return_value=Response(200, json=INDICATOR_ITEM_DATA))
+
+        async with GuruFocusClient(api_token="test-token", cache_dir=str(tmp_path)) as client:
+            writes: list[str] = []
+            cache_set = client.cache.set
+
+            async def counting_set(*args: Any, **kwargs: Any) -> None:
+                writes.append(args[1])
+                await cache_set(*args, **kwargs)
+
+            monkeypatch.setattr(client.cache, "set", counting_set)
+            results = await asyncio.gather(
+                *(client.economic.get_indicator_raw("US GDP") for _ in range(5))
+            )
+
+        assert all(result == INDICATOR_ITEM_DATA for result in results)
+        assert route.call_count == 1
+        assert writes == ["US GDP"]
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_stale_entry_served_while_refreshing(self, tmp_path: Path) -> None:
+        """Test a stale entry is returned at once and refreshed in the background."""
+        fresh = {**INDICATOR_ITEM_DATA, "refreshed": True}
+        route = respx.get(
+            "https://api.gurufocus.com/public/user/test-token/economicindicators/item/US%20GDP"
+        ).mock(return_value=Response(200, json=fresh))
+
+        async with GuruFocusClient(api_token="test-token", cache_dir=str(tmp_path)) as client:
+            # Expires within the stale window, so it reads as stale
+            await client.cache.set(
+                CacheCategory.ECONOMIC_INDICATOR_ITEM,
+                "US GDP",
+                value=INDICATOR_ITEM_DATA,
+                ttl_override=60,
+            )
+            results = await asyncio.gather(
+                *(client.economic.get_indicator_raw("US GDP") for _ in range(3))
+            )
+            await asyncio.gather(*client.economic._refreshes)
+
+            assert all(result == INDICATOR_ITEM_DATA for result in results)
+            assert route.call_count == 1
+            assert await client.economic.get_indicator_raw("US GDP") == fresh
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_close_cancels_pending_refresh(self, tmp_path: Path) -> None:
+        """Test closing the client cancels refreshes instead of reopening connections."""
+        route = respx.get(
+            "https://api.gurufocus.com/public/user/test-token/economicindicators"
+        ).mock(return_value=Response(200, json=INDICATORS_LIST_DATA))
+
+        client = GuruFocusClient(api_token="test-token", cache_dir=str(tmp_path))
+        await client.cache.set(
+            CacheCategory.ECONOMIC_INDICATORS_LIST,
+            "all",
+            value=INDICATORS_LIST_DATA,
+            ttl_override=60,
+        )
+        economic = client.economic
+        assert await economic.get_indicators_list_raw() == INDICATORS_LIST_DATA
+        assert economic._refreshes
+
+        await client.close()
+        await asyncio.sleep(0)
+
+        assert not economic._refreshes
+        assert route.call_count == 0
+        assert client._cache is None
+        assert client._client is None
+        # A stale read on a closed endpoint starts no new refresh
+        economic._refresh(CacheCategory.ECONOMIC_INDICATORS_LIST, "all", "economicindicators")
+        assert not economic._refreshes
+
 
 class TestCalendarEndpoint:
     """Tests for GET /calendar endpoint."""
@@ -296,6 +396,19 @@ class TestCalendarEndpoint:
         assert "dividend" in result
         assert "split" in result
 
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_get_calendar_all_sends_date_only(self) -> None:
+        """Test the unfiltered calendar sends just the encoded date."""
+        route = respx.get("https://api.gurufocus.com/public/user/test-token/calendar").mock(
+            return_value=Response(200, json=CALENDAR_DATA)
+        )
+
+        async with GuruFocusClient(api_token="test-token", cache_enabled=False) as client:
+            await client.economic.get_calendar_raw("2025-01-10")
+
+        assert route.calls.last.request.url.query == b"date=2025-01-10"
+
 
 class TestEconomicModelsEdgeCases:
     """Test edge cases in economic model parsing."""
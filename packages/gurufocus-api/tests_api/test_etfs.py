@@ -3,11 +3,13 @@
 import json
 from pathlib import Path
 
+import httpx
 import pytest
 import respx
 from httpx import Response
 
 from gurufocus_api import GuruFocusClient
+from gurufocus_api.exceptions import NotFoundError
 from gurufocus_api.models.etf import ETFListResponse
 
 # Load test fixtures
@@ -90,6 +92,44 @@ class TestETFListEndpoint:
         assert "data" in result
         assert "current_page" in result
 
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_get_etf_list_all_fetches_every_page(self) -> None:
+        """Test get_etf_list_all reads page 1 for the count, then the rest."""
+
+        def page(request: httpx.Request) -> Response:
+            number = int(request.url.params.get("page", 1))
+            return Response(200, json={**ETF_LIST_DATA, "current_page": number, "last_page": 3})
+
+        route = respx.get("https://api.gurufocus.com/public/user/test-token/etf/etf_list").mock(
+            side_effect=page
+        )
+
+        async with GuruFocusClient(api_token="test-token", cache_enabled=False) as client:
+            result = await client.etfs.get_etf_list_all(max_concurrency=2)
+
+        assert [response.current_page for response in result] == [1, 2, 3]
+        assert route.call_count == 3
+
+
+class TestETFSectorWeightingEndpoint:
+    """Tests for GET /etf/{ETF}/sector_weighting endpoint."""
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_not_found_is_cached(self, tmp_path: Path) -> None:
+        """Test a 404 for an unknown ETF is answered from the cache afterwards."""
+        route = respx.get(
+            "https://api.gurufocus.com/public/user/test-token/etf/No%20Such%20ETF/sector_weighting"
+        ).mock(return_value=Response(404, json={"error": "not found"}))
+
+        async with GuruFocusClient(api_token="test-token", cache_dir=str(tmp_path)) as client:
+            for _ in range(3):
+                with pytest.raises(NotFoundError):
+                    await client.etfs.get_sector_weighting_raw("No Such ETF")
+
+        assert route.call_count == 1
+
 
 class TestETFModelsEdgeCases:
     """Test edge cases in ETF model parsing."""
@@ -1,7 +1,9 @@
 """Tests for guru-related endpoints."""
 
+import asyncio
 import json
 from pathlib import Path
+from typing import Any
 
 import pytest
 import respx
@@ -72,6 +74,17 @@ class TestGurulistEndpoint:
         assert first_guru.turnover == 3
         assert first_guru.cik == "0001234567"
 
+    def test_iter_gurus_matches_parsed_items(self) -> None:
+        """Test iter_gurus yields the same values as from_api_response."""
+        response = GuruListResponse.from_api_response(GURULIST_DATA)
+
+        us_rows = list(GuruListResponse.iter_gurus(GURULIST_DATA))
+        plus_rows = list(GuruListResponse.iter_gurus(GURULIST_DATA, plus=True))
+
+        assert [row._asdict() for row in us_rows] == [g.model_dump() for g in response.us_gurus]
+        assert [row._asdict() for row in plus_rows] == [g.model_dump() for g in response.plus_gurus]
+        assert us_rows[0].name == "Fake Guru One"
+
     @pytest.mark.asyncio
     @respx.mock
     async def test_get_gurulist_raw_returns_dict(self) -> None:
@@ -87,6 +100,31 @@ class TestGurulistEndpoint:
         assert "all" in result
         assert "us" in result["all"]
 
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_concurrent_misses_share_fetch(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test concurrent cache misses make one request and one cache write."""
+        route = respx.get("https://api.gurufocus.com/public/user/test-token/gurulist").mock(
+            return_value=Response(200, json=GURULIST_DATA)
+        )
+
+        async with GuruFocusClient(api_token="test-token", cache_dir=str(tmp_path)) as client:
+            writes: list[str] = []
+            cache_set = client.cache.set
+
+            async def counting_set(*args: Any, **kwargs: Any) -> None:
+                writes.append(args[1])
+                await cache_set(*args, **kwargs)
+
+            monkeypatch.setattr(client.cache, "set", counting_set)
+            results = await asyncio.gather(*(client.gurus.get_gurulist_raw() for _ in range(5)))
+
+        assert all(result == GURULIST_DATA for result in results)
+        assert route.call_count == 1
+        assert writes == ["all"]
+
 
 class TestGuruAggregatedEndpoint:
     """Tests for GET /guru/{id}/aggregated endpoint."""
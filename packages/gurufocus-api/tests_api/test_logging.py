@@ -0,0 +1,46 @@
+"""Tests for logging configuration helpers."""
+
+import logging
+from collections.abc import Iterator
+
+import pytest
+import structlog
+
+from gurufocus_api.logging import level_enabled
+
+LOGGER_NAME = "gurufocus_api.tests.level_enabled"
+
+
+@pytest.fixture(autouse=True)
+def restore_structlog() -> Iterator[None]:
+    """Put structlog and the test logger back to their defaults afterwards."""
+    yield
+    structlog.reset_defaults()
+    logging.getLogger(LOGGER_NAME).setLevel(logging.NOTSET)
+
+
+class TestLevelEnabled:
+    """Tests for level_enabled()."""
+
+    def test_enabled_when_structlog_unconfigured(self) -> None:
+        """Test structlog's defaults, which print every level, enable all checks."""
+        logging.getLogger(LOGGER_NAME).setLevel(logging.WARNING)
+
+        assert level_enabled(LOGGER_NAME, logging.DEBUG)()
+
+    def test_follows_stdlib_level_for_stdlib_loggers(self) -> None:
+        """Test stdlib-backed structlog loggers defer to the stdlib level."""
+        check = level_enabled(LOGGER_NAME, logging.DEBUG)
+        structlog.configure(wrapper_class=structlog.stdlib.BoundLogger)
+
+        logging.getLogger(LOGGER_NAME).setLevel(logging.INFO)
+        assert not check()
+        logging.getLogger(LOGGER_NAME).setLevel(logging.DEBUG)
+        assert check()
+
+    def test_follows_filtering_logger_level(self) -> None:
+        """Test filtering bound loggers are checked against their own level."""
+        structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(logging.INFO))
+
+        assert level_enabled(LOGGER_NAME, logging.INFO)()
+        assert not level_enabled(LOGGER_NAME, logging.DEBUG)()
@@ -8,8 +8,9 @@ import respx
 from httpx import Response
 
 from gurufocus_api import GuruFocusClient, RateLimitConfig, RateLimiter
+from gurufocus_api.config import GuruFocusSettings
 from gurufocus_api.exceptions import RateLimitError
-from gurufocus_api.rate_limiter import NullRateLimiter
+from gurufocus_api.rate_limiter import NullRateLimiter, SlidingWindowRateLimiter
 
 
 class TestRateLimitConfig:
@@ -161,6 +162,47 @@ class TestRateLimiter:
         # At 60 rpm, need ~1 second for 1 token
         assert 0.5 < wait_time < 1.5
 
+    def test_try_acquire_nowait(self) -> None:
+        """Test try_acquire_nowait takes tokens until the bucket is empty."""
+        config = RateLimitConfig(burst_size=2, requests_per_minute=1.0)
+        limiter = RateLimiter(config)
+
+        assert limiter.try_acquire_nowait() is True
+        assert limiter.try_acquire_nowait() is True
+        assert limiter.try_acquire_nowait() is False
+        assert limiter.daily_count == 2
+
+    def test_try_acquire_nowait_daily_limit(self) -> None:
+        """Test try_acquire_nowait respects the daily limit."""
+        limiter = RateLimiter(RateLimitConfig(burst_size=5, requests_per_day=1))
+
+        assert limiter.try_acquire_nowait() is True
+        assert limiter.try_acquire_nowait() is False
+
+    @pytest.mark.asyncio
+    async def test_try_acquire_nowait_defers_to_waiters(self) -> None:
+        """Test try_acquire_nowait doesn't jump ahead of a waiting acquire()."""
+        limiter = RateLimiter(RateLimitConfig(burst_size=1, requests_per_minute=600.0))
+        assert limiter.try_acquire_nowait() is True
+
+        waiter = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0)
+        assert limiter.try_acquire_nowait() is False
+        assert await waiter is True
+
+    @pytest.mark.asyncio
+    async def test_acquire_waiters_sleep_concurrently(self) -> None:
+        """Test waiters don't hold each other up while sleeping for tokens."""
+        limiter = RateLimiter(RateLimitConfig(burst_size=1, requests_per_minute=600.0))
+        assert limiter.try_acquire_nowait() is True
+
+        waiters = [asyncio.create_task(limiter.acquire()) for _ in range(3)]
+        await asyncio.sleep(0)
+        assert limiter._waiters == 3
+
+        assert await asyncio.gather(*waiters) == [True, True, True]
+        assert limiter._waiters == 0
+
     @pytest.mark.asyncio
     async def test_acquire_or_raise_success(self) -> None:
         """Test acquire_or_raise succeeds when tokens available."""
@@ -237,6 +279,68 @@ class TestRateLimiter:
         assert "time_until_available" in stats
 
 
+class TestSlidingWindowRateLimiter:
+    """Tests for the sliding-window rate limiter."""
+
+    @pytest.mark.asyncio
+    async def test_limit_ignores_burst_size(self) -> None:
+        """Test the window admits requests_per_minute requests, not burst_size."""
+        config = RateLimitConfig(requests_per_minute=3.0, burst_size=1)
+        limiter = SlidingWindowRateLimiter(config)
+
+        for _ in range(3):
+            assert await limiter.acquire(timeout=0) is True
+
+        assert limiter.can_acquire() is False
+        assert limiter.try_acquire_nowait() is False
+        assert limiter.tokens == 0
+        assert limiter.daily_count == 3
+
+    @pytest.mark.asyncio
+    async def test_requests_leave_window(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test slots free up as requests age out of the 60-second window."""
+        now = 1000.0
+        monkeypatch.setattr(time, "monotonic", lambda: now)
+        limiter = SlidingWindowRateLimiter(RateLimitConfig(requests_per_minute=2.0))
+
+        await limiter.acquire()
+        now = 1030.0
+        await limiter.acquire()
+        assert limiter.time_until_available() == pytest.approx(30.0)
+
+        now = 1060.0
+        assert limiter.can_acquire() is True
+        assert limiter.tokens == 1
+
+    @pytest.mark.asyncio
+    async def test_acquire_or_raise_when_full(self) -> None:
+        """Test a full window raises RateLimitError with retry_after."""
+        limiter = SlidingWindowRateLimiter(RateLimitConfig(requests_per_minute=1.0))
+        await limiter.acquire()
+
+        with pytest.raises(RateLimitError) as exc_info:
+            await limiter.acquire_or_raise(timeout=0.01)
+
+        assert exc_info.value.retry_after is not None
+        assert exc_info.value.retry_after > 0
+
+    @pytest.mark.asyncio
+    async def test_reset_and_stats(self) -> None:
+        """Test reset empties the window and stats report its usage."""
+        limiter = SlidingWindowRateLimiter(RateLimitConfig(requests_per_minute=5.0))
+        await limiter.acquire()
+        await limiter.acquire()
+
+        stats = limiter.get_stats()
+        assert stats["window_requests"] == 2
+        assert stats["window_limit"] == 5
+        assert stats["tokens"] == 3
+
+        limiter.reset()
+        assert limiter.tokens == 5
+        assert limiter.get_stats()["window_requests"] == 0
+
+
 class TestNullRateLimiter:
     """Tests for the null rate limiter."""
 
@@ -250,6 +354,11 @@ class TestNullRateLimiter:
         limiter = NullRateLimiter()
         assert limiter.time_until_available() == 0.0
 
+    def test_try_acquire_nowait_always_true(self) -> None:
+        """Test try_acquire_nowait always returns True."""
+        limiter = NullRateLimiter()
+        assert all(limiter.try_acquire_nowait() for _ in range(100))
+
     @pytest.mark.asyncio
     async def test_acquire_always_succeeds(self) -> None:
         """Test acquire always succeeds."""
@@ -301,6 +410,13 @@ class TestRateLimiterIntegration:
         ) as client:
             assert isinstance(client.rate_limiter, NullRateLimiter)
 
+    @pytest.mark.asyncio
+    async def test_sliding_window_algorithm(self) -> None:
+        """Test the sliding-window limiter is selected from settings."""
+        settings = GuruFocusSettings(api_token="test-token", rate_limit_algorithm="sliding_window")
+        async with GuruFocusClient(settings=settings) as client:
+            assert isinstance(client.rate_limiter, SlidingWindowRateLimiter)
+
     @pytest.mark.asyncio
     @respx.mock
     async def test_custom_rate_limit_config(self) -> None:
@@ -99,6 +99,9 @@ class TestAPIUsageTracker:
         await tracker.decrement()
         assert tracker._local_consumed == 2
 
+        tracker.decrement_nowait()
+        assert tracker._local_consumed == 3
+
     @pytest.mark.asyncio
     async def test_get_remaining_no_sync(self, tracker: APIUsageTracker) -> None:
         """Test get_remaining when never synced."""
@@ -284,6 +287,7 @@ class TestNullUsageTracker:
     async def test_decrement_noop(self, tracker: NullUsageTracker) -> None:
         """Test decrement is no-op."""
         await tracker.decrement()
+        tracker.decrement_nowait()
 
         assert tracker._local_consumed == 0
 